@@ -0,0 +1,148 @@
+# benchmarks/bench_asr.py
+"""Real-time factor, WER and peak RSS of the ASR adapters and decoding profiles.
+
+Usage:
+    python -m benchmarks.bench_asr [--wav a.wav b.wav ...] [--ref "texto a" "texto b" ...]
+                                   [--impl openai faster-whisper] [--profile fast balanced accurate]
+                                   [--model small] [--compute-type int8] [--device cpu]
+
+Each (adapter, profile) runs in its own subprocess, so peak RSS is not polluted by the
+other backend. RTF = decode time / audio duration (lower is better; < 1 is faster than
+real time). WER is reported when one reference transcript per --wav is given.
+Without --wav a synthetic 8 s segment is used (timing only, text is noise).
+"""
+from __future__ import annotations
+import argparse
+import json
+import re
+import resource
+import subprocess
+import sys
+import time
+from typing import List
+import numpy as np
+
+from octavius.config.settings import AsrSettings
+from octavius.domain.models.recording_segment import RecordingSegment
+
+
+def _load_segments(paths: List[str]) -> List[RecordingSegment]:
+    from octavius.utils.resampler import resample_once
+    segments = []
+    if not paths:
+        rng = np.random.default_rng(0)
+        t = np.arange(8 * 16000) / 16000
+        x = (np.sin(2 * np.pi * 180 * t) * 4000 * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+             + rng.standard_normal(t.size) * 300).astype(np.int16)
+        return [RecordingSegment(pcm=x.tobytes(), sample_rate=16000, channels=1, frame_ms=30,
+                                 start_ms=0, end_ms=len(x) * 1000 // 16000)]
+    import soundfile as sf
+    for p in paths:
+        audio, sr = sf.read(p, dtype="int16", always_2d=True)
+        x = audio.mean(axis=1).round().astype(np.int16)
+        x = resample_once(x, sr, 16000)
+        segments.append(RecordingSegment(pcm=x.tobytes(), sample_rate=16000, channels=1, frame_ms=30,
+                                         start_ms=0, end_ms=len(x) * 1000 // 16000))
+    return segments
+
+
+def _words(text: str) -> List[str]:
+    return re.sub(r"[^\w\s']", " ", text.lower()).split()
+
+
+def _wer(refs: List[str], hyps: List[str]) -> float:
+    """Word error rate over all segments (word-level Levenshtein / reference words)."""
+    errors = total = 0
+    for ref, hyp in zip(refs, hyps):
+        r, h = _words(ref), _words(hyp)
+        prev = list(range(len(h) + 1))
+        for i, rw in enumerate(r, 1):
+            cur = [i] + [0] * len(h)
+            for j, hw in enumerate(h, 1):
+                cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (rw != hw))
+            prev = cur
+        errors += prev[-1]
+        total += len(r)
+    return errors / max(1, total)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _worker(args: argparse.Namespace) -> None:
+    """Child process: load one adapter, transcribe every segment, print a JSON line."""
+    settings = AsrSettings(implementation=args.worker, model_id=args.model, profile=args.profile[0],
+                           compute_type=args.compute_type, device=args.device, language=args.language,
+                           warmup=False)
+    segments = _load_segments(args.wav)
+    if args.worker == "faster-whisper":
+        from octavius.infrastructure.asr.faster_whisper import FasterWhisperTranscriber as Adapter
+    else:
+        from octavius.infrastructure.asr.whisper import WhisperTranscriber as Adapter
+    asr = Adapter(settings)
+    t0 = time.perf_counter()
+    asr.open()
+    asr.ready.result()
+    load_s = time.perf_counter() - t0
+
+    asr.transcribe(segments[0])   # warm-up, not timed
+    audio_s = decode_s = 0.0
+    texts = []
+    for seg in segments:
+        t0 = time.perf_counter()
+        utt = asr.transcribe(seg)
+        decode_s += time.perf_counter() - t0
+        audio_s += len(seg.pcm) / 2 / seg.sample_rate
+        texts.append(utt.raw_text)
+    print(json.dumps({
+        "impl": args.worker, "load_s": load_s, "audio_s": audio_s, "decode_s": decode_s,
+        "rtf": decode_s / audio_s, "peak_rss_mb": _peak_rss_mb(), "texts": texts,
+    }))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--wav", nargs="*", default=[])
+    ap.add_argument("--ref", nargs="*", default=[], help="reference transcript per --wav (enables WER)")
+    ap.add_argument("--impl", nargs="*", default=["openai", "faster-whisper"])
+    ap.add_argument("--profile", nargs="*", default=["fast", "balanced", "accurate"])
+    ap.add_argument("--model", default="small")
+    ap.add_argument("--compute-type", default="int8")
+    ap.add_argument("--device", default="cpu")
+    ap.add_argument("--language", default="es")
+    ap.add_argument("--worker", help=argparse.SUPPRESS)
+    ap.add_argument("--show-text", action="store_true")
+    args = ap.parse_args()
+
+    if args.worker:
+        _worker(args)
+        return
+
+    if args.ref and len(args.ref) != len(args.wav):
+        ap.error("--ref needs one reference per --wav")
+
+    print(f"{'impl':>15} | {'profile':>8} | {'load s':>6} | {'audio s':>7} | {'RTF':>5} | {'WER':>5} | {'peak RSS MB':>11}")
+    for impl in args.impl:
+        for profile in args.profile:
+            cmd = [sys.executable, "-m", "benchmarks.bench_asr", "--worker", impl, "--profile", profile,
+                   "--model", args.model, "--compute-type", args.compute_type, "--device", args.device,
+                   "--language", args.language, "--wav", *args.wav]
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+            lines = [l for l in proc.stdout.splitlines() if l.startswith("{")]
+            if proc.returncode != 0 or not lines:
+                print(f"{impl:>15} | {profile:>8} | failed: {(proc.stderr.strip().splitlines() or ['?'])[-1]}")
+                continue
+            r = json.loads(lines[-1])
+            wer = f"{_wer(args.ref, r['texts']):5.1%}" if args.ref else f"{'-':>5}"
+            print(f"{impl:>15} | {profile:>8} | {r['load_s']:6.1f} | {r['audio_s']:7.1f} | {r['rtf']:5.2f} | "
+                  f"{wer} | {r['peak_rss_mb']:11.0f}")
+            if args.show_text:
+                for t in r["texts"]:
+                    print(f"{'':>15}   {t}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_resampler.py
+"""CPU cost of chunked resampling: legacy per-chunk resample_poly vs StreamingResampler.
+
+Usage:
+    python -m benchmarks.bench_resampler [--seconds 60] [--chunk-ms 30]
+
+Reports CPU milliseconds spent per second of audio for each device rate → 16 kHz.
+"""
+from __future__ import annotations
+import argparse
+import time
+import numpy as np
+
+from octavius.utils.resampler import StreamingResampler
+
+
+def _legacy_resample_int16(x: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """Baseline: the previous `audio_utils.resample_int16` (import + filter design per call)."""
+    from scipy.signal import resample_poly
+    y = resample_poly(x.astype(np.float32), dst_rate, src_rate)
+    return np.clip(np.round(y), -32768, 32767).astype(np.int16)
+
+
+def _cpu_ms_per_audio_s(fn, chunks, seconds: float) -> float:
+    t0 = time.process_time()
+    for c in chunks:
+        fn(c)
+    return (time.process_time() - t0) * 1000.0 / seconds
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--seconds", type=float, default=60.0)
+    ap.add_argument("--chunk-ms", type=int, default=30)
+    ap.add_argument("--dst", type=int, default=16000)
+    args = ap.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'src→dst':>14} | {'legacy ms/s':>11} | {'streaming ms/s':>14} | speedup")
+    for src in (48000, 44100, 32000):
+        x = (rng.standard_normal(int(src * args.seconds)) * 3000).astype(np.int16)
+        step = int(src * args.chunk_ms / 1000)
+        chunks = [x[i:i + step] for i in range(0, len(x) - step + 1, step)]
+
+        legacy = _cpu_ms_per_audio_s(lambda c: _legacy_resample_int16(c, src, args.dst), chunks, args.seconds)
+        rs = StreamingResampler(src, args.dst)
+        streaming = _cpu_ms_per_audio_s(rs.process, chunks, args.seconds)
+        print(f"{src:>6}→{args.dst:<7} | {legacy:11.2f} | {streaming:14.2f} | x{legacy / streaming:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# octavius/asr/batch.py
+"""Bulk transcription of recorded sessions (QA, model tuning).
+
+Usage:
+    python -m octavius.asr.batch <dir|file> [...] [--out results.jsonl] [--glob "*.wav"]
+                                 [--model small] [--device cpu] [--language es]
+                                 [--batch-size 8] [--workers 1] [--full-context]
+
+Files are streamed with soundfile (never fully loaded), downmixed, resampled to 16 kHz and
+cut into <= 30 s pieces at the quietest point near each boundary. Pieces from all files are
+pooled, sorted by length and decoded in padded batches of `--batch-size`: one encoder pass
+per batch, sized to its longest member (see `whisper_decode.decode_batch`).
+
+Each piece becomes one JSON line (file, index, start/end seconds, text, language, decoder
+stats). With `--workers N` the file list is split among N spawned processes, each with its
+own model and 1/N of the CPU threads. Throughput is reported as audio hours transcribed per
+wall-clock hour.
+"""
+from __future__ import annotations
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+import json
+import logging
+import multiprocessing as mp
+import os
+from pathlib import Path
+import sys
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import soundfile as sf
+
+from octavius.domain.services.chunked_transcriber import quiet_point
+from octavius.utils.resampler import StreamingResampler
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+_READ_BLOCK_S = 10
+
+
+@dataclass(frozen=True)
+class Piece:
+    """A <= 30 s slice of one file, float32 mono at 16 kHz."""
+    path: str
+    index: int
+    start_s: float
+    audio: np.ndarray
+
+    @property
+    def seconds(self) -> float:
+        return len(self.audio) / SAMPLE_RATE
+
+
+# A batch decoder maps float32 arrays to objects with Whisper `DecodingResult` fields.
+BatchDecoder = Callable[[List[np.ndarray]], Sequence[Any]]
+
+
+def iter_pieces(path: str, max_s: float = 30.0, search_s: float = 2.0, min_s: float = 0.2) -> Iterator[Piece]:
+    """Stream `path` and yield it as pieces of at most `max_s` (tails shorter than `min_s` are dropped)."""
+    info = sf.info(path)
+    resampler = StreamingResampler(info.samplerate, SAMPLE_RATE)
+    max_n = int(max_s * SAMPLE_RATE)
+    search_n = int(search_s * SAMPLE_RATE)
+    win = SAMPLE_RATE // 50   # 20 ms
+    pending = np.zeros(0, dtype=np.int16)
+    consumed = 0   # output samples already emitted
+    index = 0
+
+    def blocks() -> Iterator[np.ndarray]:
+        for block in sf.blocks(path, blocksize=_READ_BLOCK_S * info.samplerate, dtype="int16", always_2d=True):
+            mono = block[:, 0] if block.shape[1] == 1 else np.round(block.mean(axis=1)).astype(np.int16)
+            yield resampler.process(mono).copy()
+        yield resampler.flush().copy()
+
+    for chunk in blocks():
+        pending = np.concatenate([pending, chunk])
+        while len(pending) > max_n:
+            lo = max_n - search_n
+            cut = lo + quiet_point(pending[lo:max_n], win)
+            yield Piece(path, index, consumed / SAMPLE_RATE, pending[:cut].astype(np.float32) / 32768.0)
+            index += 1
+            consumed += cut
+            pending = pending[cut:]
+    if len(pending) >= min_s * SAMPLE_RATE:
+        yield Piece(path, index, consumed / SAMPLE_RATE, pending.astype(np.float32) / 32768.0)
+
+
+def length_batches(pieces: Iterable[Piece], batch_size: int, pool_size: Optional[int] = None) -> Iterator[List[Piece]]:
+    """Group pieces of similar length: buffer `pool_size` of them, sort, slice into batches.
+
+    The pool keeps memory bounded while files are streamed (default: 8 batches).
+    """
+    pool_size = pool_size or 8 * batch_size
+    pool: List[Piece] = []
+
+    def drain(final: bool) -> Iterator[List[Piece]]:
+        pool.sort(key=lambda p: len(p.audio))
+        while len(pool) >= batch_size or (final and pool):
+            batch = pool[:batch_size]
+            del pool[:batch_size]
+            yield batch
+
+    for piece in pieces:
+        pool.append(piece)
+        if len(pool) >= pool_size:
+            yield from drain(final=False)
+    yield from drain(final=True)
+
+
+def transcribe_files(
+    paths: Sequence[str],
+    decode: BatchDecoder,
+    *,
+    batch_size: int = 8,
+    max_s: float = 30.0,
+) -> Iterator[Dict[str, Any]]:
+    """Yield one result record per piece of `paths`, in batch (not file) order."""
+    pieces = (p for path in paths for p in _safe_pieces(path, max_s))
+    for batch in length_batches(pieces, batch_size):
+        for piece, res in zip(batch, decode([p.audio for p in batch])):
+            yield {
+                "file": piece.path,
+                "index": piece.index,
+                "start_s": round(piece.start_s, 3),
+                "end_s": round(piece.start_s + piece.seconds, 3),
+                "text": res.text.strip(),
+                "language": res.language,
+                "avg_logprob": round(float(res.avg_logprob), 4),
+                "no_speech_prob": round(float(res.no_speech_prob), 4),
+                "compression_ratio": round(float(res.compression_ratio), 4),
+            }
+
+
+def _safe_pieces(path: str, max_s: float) -> Iterator[Piece]:
+    try:
+        yield from iter_pieces(path, max_s=max_s)
+    except (RuntimeError, OSError) as e:   # soundfile raises RuntimeError/LibsndfileError on bad files
+        logger.error("No se pudo leer %s: %s", path, e)
+
+
+class WhisperBatchDecoder:
+    """openai-whisper model + greedy decoding options, callable on a list of arrays."""
+
+    def __init__(self, model_id: str, device: str, language: Optional[str], task: str, full_context: bool) -> None:
+        import torch
+        import whisper
+        from octavius.infrastructure.asr.whisper_decode import decode_batch, enable_variable_audio_ctx
+
+        if device == "auto":
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self._model = whisper.load_model(model_id, device)
+        if not full_context:
+            enable_variable_audio_ctx(self._model)
+        self._options = whisper.DecodingOptions(
+            task=task, language=language, temperature=0.0, without_timestamps=True, fp16=device == "cuda",
+        )
+        self._decode_batch = decode_batch
+        self._full_context = full_context
+
+    def __call__(self, audios: List[np.ndarray]) -> Sequence[Any]:
+        return self._decode_batch(self._model, audios, self._options, full_context=self._full_context)
+
+
+def find_audio(inputs: Sequence[str], pattern: str) -> List[str]:
+    files: List[str] = []
+    for item in inputs:
+        p = Path(item)
+        if p.is_dir():
+            files.extend(str(f) for f in sorted(p.rglob(pattern)) if f.is_file())
+        elif p.is_file():
+            files.append(str(p))
+        else:
+            logger.warning("Ruta no encontrada: %s", item)
+    return files
+
+
+def _audio_seconds(path: str) -> float:
+    try:
+        return sf.info(path).duration
+    except (RuntimeError, OSError):
+        return 0.0
+
+
+def _shard(files: List[str], n: int) -> List[List[str]]:
+    """Split files into n shards of similar total duration (longest first, greedy)."""
+    shards: List[List[str]] = [[] for _ in range(n)]
+    load = [0.0] * n
+    for f in sorted(files, key=_audio_seconds, reverse=True):
+        i = load.index(min(load))
+        shards[i].append(f)
+        load[i] += _audio_seconds(f)
+    return [s for s in shards if s]
+
+
+def _run_shard(files: List[str], args: argparse.Namespace, threads: int) -> List[Dict[str, Any]]:
+    """Worker process body: own model, own thread budget."""
+    import torch
+    torch.set_num_threads(threads)
+    decoder = WhisperBatchDecoder(args.model, args.device, args.language, args.task, args.full_context)
+    return list(transcribe_files(files, decoder, batch_size=args.batch_size))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m octavius.asr.batch", description=__doc__.split("\n\n")[0])
+    ap.add_argument("inputs", nargs="+", help="audio files or directories (searched recursively)")
+    ap.add_argument("--glob", default="*.wav", help="file pattern inside directories")
+    ap.add_argument("--out", default="-", help="JSONL output path ('-' = stdout)")
+    ap.add_argument("--model", default="small")
+    ap.add_argument("--device", default="auto", choices=["auto", "cpu", "cuda"])
+    ap.add_argument("--language", default="es", help="pinned language; 'auto' to detect per piece")
+    ap.add_argument("--task", default="transcribe", choices=["transcribe", "translate"])
+    ap.add_argument("--batch-size", type=int, default=8)
+    ap.add_argument("--workers", type=int, default=1, help="worker processes (each loads its own model)")
+    ap.add_argument("--full-context", action="store_true", help="always run the encoder on 30 s windows")
+    args = ap.parse_args(argv)
+    if args.language == "auto":
+        args.language = None
+    if args.batch_size < 1 or args.workers < 1:
+        ap.error("--batch-size and --workers must be >= 1")
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
+
+    files = find_audio(args.inputs, args.glob)
+    if not files:
+        ap.error("no audio files found")
+    audio_s = sum(_audio_seconds(f) for f in files)
+    logger.info("%d archivos, %.2f h de audio", len(files), audio_s / 3600)
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    t0 = time.perf_counter()
+    n = 0
+    try:
+        def write(rec: Dict[str, Any]) -> None:
+            nonlocal n
+            out.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            n += 1
+
+        if args.workers == 1:
+            decoder = WhisperBatchDecoder(args.model, args.device, args.language, args.task, args.full_context)
+            for rec in transcribe_files(files, decoder, batch_size=args.batch_size):
+                write(rec)
+        else:
+            shards = _shard(files, args.workers)
+            threads = max(1, (os.cpu_count() or 1) // len(shards))
+            with ProcessPoolExecutor(len(shards), mp_context=mp.get_context("spawn")) as pool:
+                futures = [pool.submit(_run_shard, shard, args, threads) for shard in shards]
+                for fut in as_completed(futures):
+                    for rec in fut.result():
+                        write(rec)
+                    out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    wall = time.perf_counter() - t0
+    print(
+        f"{len(files)} files, {n} pieces, {audio_s / 3600:.3f} h audio in {wall / 3600:.3f} h "
+        f"→ {audio_s / wall if wall else 0.0:.1f} audio-h per wall-h "
+        f"(batch={args.batch_size}, workers={args.workers})",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
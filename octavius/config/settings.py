@@ -32,22 +32,79 @@ class AudioSettings(BaseModel):
     sample_rate: int = 16000
     channels: Literal[1,2] = 1
     chunk_size: int = 1024
+    capture_mode: Literal["blocking", "callback"] = "blocking"
+    ring_buffer_ms: int = 5000
+
+    @field_validator("ring_buffer_ms")
+    @classmethod
+    def _val_ring(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("audio.ring_buffer_ms must be > 0")
+        return v
 
 class AsrSettings(BaseModel):
     engine: Literal["whisper"] = "whisper"
-    implementation: Literal["faster-whisper", "whisper.cpp", "openai"] = "faster-whisper"
+    implementation: Literal["faster-whisper", "whisper.cpp", "openai"] = "openai"
     model_id: Literal["tiny", "base", "small", "medium", "large-v3"] = "small"
+    model_path: Optional[str] = None   # local CTranslate2 model dir (faster-whisper); overrides model_id
     device: Literal["auto", "cpu", "cuda"] = "auto"
-    compute_type: Literal["int8", "int8_float32", "int16", "float16", "float32"] = "int8"
+    compute_type: Literal["int8", "int8_float32", "int16", "float16", "float32"] = "float32"
     language: Literal["es", "en", "fr"] = "es"
     task: Literal["transcribe", "translate"] = "transcribe"
+    profile: Literal["fast", "balanced", "accurate"] = "balanced"   # decoding profile (latency vs accuracy)
+    cascade_model_id: Optional[Literal["tiny", "base", "small", "medium"]] = None   # fast first stage
+    cascade_min_logprob: float = -0.7    # escalate to model_id below this avg logprob
+    cascade_max_no_speech: float = 0.6   # ... or above this no-speech prob (with text)
+    cascade_max_compression: float = 2.4  # ... or above this compression ratio
+    short_max_s: float = 0.0           # openai: shorter segments use a reduced encoder context (0 = off; ~5 s on slow CPUs)
+    short_min_logprob: float = -0.8    # below this avg logprob the short path falls back to 30 s
+    cache_dir: Optional[str] = None    # openai int8: quantized models are cached here (default ~/.cache/octavius/asr)
+    model_cache_mb: int = 0            # ceiling for cached (unused) models in the shared registry; 0 = no limit
+    warmup: bool = True                # run a synthetic decode right after loading (in background)
+    isolation: Literal["none", "process"] = "none"
+    timeout_s: float = 30.0            # process isolation: per-segment budget (+ segment duration)
+    stream_features: bool = False      # openai: compute the log-mel during capture (VAD) instead of after it
+    chunking: bool = False             # transcribe long speech in chunks while the user keeps talking
     chunk_seconds: int = 30
+    chunk_overlap_ms: int = 1000
+    chunk_search_ms: int = 2000
+    gate: bool = False                 # drop empty / low-confidence / hallucinated transcripts before the LLM
+    gate_min_confidence: float = 0.3   # exp(avg_logprob) * (1 - no_speech_prob)
+    gate_max_repeats: int = 4          # same word back to back this many times = decoder loop
 
-    @field_validator("chunk_seconds")
+    @field_validator("gate_min_confidence")
+    @classmethod
+    def _val_gate_conf(cls, v: float) -> float:
+        if not 0.0 <= v <= 1.0:
+            raise ValueError("asr.gate_min_confidence debe estar entre 0 y 1")
+        return v
+
+    @field_validator("chunk_seconds", "chunk_search_ms")
     @classmethod
     def _val_chunk(cls, v: int) -> int:
         if v <= 0:
-            raise ValueError("asr.chunk_seconds debe ser > 0")
+            raise ValueError("asr.chunk_seconds / asr.chunk_search_ms deben ser > 0")
+        return v
+
+    @field_validator("timeout_s")
+    @classmethod
+    def _val_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("asr.timeout_s debe ser > 0")
+        return v
+
+    @field_validator("short_max_s")
+    @classmethod
+    def _val_short(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("asr.short_max_s debe ser >= 0")
+        return v
+
+    @field_validator("chunk_overlap_ms")
+    @classmethod
+    def _val_overlap(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("asr.chunk_overlap_ms debe ser >= 0")
         return v
 
 class VadSettings(BaseModel):
@@ -57,6 +114,8 @@ class VadSettings(BaseModel):
     silence_ms: int = 800
     pre_speech_ms: int = 300
     max_record_ms: int = 15000
+    energy_gate: bool = False
+    energy_gate_margin_db: float = 6.0
 
     @field_validator("aggressiveness")
     @classmethod
@@ -79,6 +138,13 @@ class VadSettings(BaseModel):
             raise ValueError("vad.* must be > 0")
         return v
 
+    @field_validator("energy_gate_margin_db")
+    @classmethod
+    def _val_margin(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("vad.energy_gate_margin_db must be >= 0")
+        return v
+
 class LLMSettings(BaseModel):
     provider: Literal["gemini", "openai", "ollama", "groq"] = "gemini"
     model: str = "gemini-2.5-flash"
@@ -86,7 +152,39 @@ class LLMSettings(BaseModel):
     max_tokens: int = 350
     system_prompt: Optional[str] = None
     api_key_env: str = "GEMINI_API_KEY"  # name of env var holding the key
+    streaming: bool = False               # stream the answer and hand it on sentence by sentence
+    query_routing: bool = False           # per turn: search grounding / thinking only when the query needs them
+    transport: Literal["sdk", "http"] = "sdk"   # http: async client on a pooled, pre-warmed connection
+    base_url: str = "https://generativelanguage.googleapis.com"
+    timeout_s: float = 30.0
+    keepalive_s: float = 600.0            # idle pooled connections are kept this long
+    keepalive_ping_s: float = 0.0         # > 0: refresh the connection after this much idle time
+    hedge_after_ms: float = 0.0           # > 0: no first token by then -> also ask hedge_model (http only)
+    hedge_model: str = "gemini-2.5-flash-lite"  # hedge request: this model, no search, no thinking
+    deadline_ms: float = 8000.0           # no first token by then -> short apology instead of silence
+    ollama_url: str = "http://localhost:11434"   # provider ollama: local Ollama-compatible server
+    keep_alive: str = "30m"               # provider ollama: keep the model loaded this long (negative, e.g. "-1m" = forever)
+
+    @field_validator("timeout_s")
+    @classmethod
+    def _val_timeout(cls, v: float) -> float:
+        if v <= 0:
+            raise ValueError("llm.timeout_s debe ser > 0")
+        return v
     
+    @field_validator("hedge_after_ms")
+    @classmethod
+    def _val_hedge(cls, v: float) -> float:
+        if v < 0:
+            raise ValueError("llm.hedge_after_ms debe ser >= 0 (0 = desactivado)")
+        return v
+
+    @model_validator(mode="after")
+    def _check_hedge(self):
+        if self.hedge_after_ms > 0 and self.deadline_ms <= self.hedge_after_ms:
+            raise ValueError("llm.deadline_ms debe ser mayor que llm.hedge_after_ms")
+        return self
+
     @field_validator("temperature")
     @classmethod
     def _val_temp(cls, v: float) -> float:
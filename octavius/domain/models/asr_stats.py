@@ -0,0 +1,35 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import math
+from typing import Iterable, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class AsrStats:
+    """Decoder statistics of one transcription (Whisper-style).
+
+    - `avg_logprob`: mean token log-probability (closer to 0 = more certain).
+    - `no_speech_prob`: probability that the audio held no speech.
+    - `compression_ratio`: text gzip ratio; high values mean repetition loops.
+    """
+    avg_logprob: float
+    no_speech_prob: float
+    compression_ratio: float
+
+    @property
+    def confidence(self) -> float:
+        """exp(avg_logprob) × (1 − no_speech_prob), in [0, 1]."""
+        return max(0.0, min(1.0, math.exp(min(0.0, self.avg_logprob)) * (1.0 - self.no_speech_prob)))
+
+    @classmethod
+    def combine(cls, parts: Iterable[Tuple[float, "AsrStats"]]) -> Optional["AsrStats"]:
+        """Duration-weighted stats over (seconds, stats) parts; the worst compression ratio wins."""
+        parts = [(max(w, 1e-3), s) for w, s in parts]
+        if not parts:
+            return None
+        total = sum(w for w, _ in parts)
+        return cls(
+            avg_logprob=sum(w * s.avg_logprob for w, s in parts) / total,
+            no_speech_prob=sum(w * s.no_speech_prob for w, s in parts) / total,
+            compression_ratio=max(s.compression_ratio for _, s in parts),
+        )
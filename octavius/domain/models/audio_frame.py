@@ -0,0 +1,16 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class AudioFrame:
+    """A chunk of device-native PCM16 audio stamped on the source's sample clock.
+
+    `sample_index` counts samples per channel since the source was opened (lost samples
+    included, so gaps show up as jumps). `captured_at` is the `time.monotonic()` instant
+    at which the first sample of the chunk was captured, when the source knows it.
+    """
+    pcm: bytes
+    sample_index: int
+    captured_at: Optional[float] = None
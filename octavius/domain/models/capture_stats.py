@@ -0,0 +1,35 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CaptureStats:
+    """Snapshot of an AudioSource's capture counters (cumulative since `open()`).
+
+    Samples are counted per channel, i.e. in units of the device sample clock. The latency
+    maximum is the exception: it covers the reads since the source's last
+    `reset_latency_max()`, so that a per-turn log can report a per-turn peak.
+    """
+    overflows: int = 0              # input overflow events reported by the device/driver
+    dropped_samples: int = 0        # samples lost to overflows or a full capture buffer
+    chunks: int = 0                 # chunks delivered by capture_stream()
+    blocked_ms: float = 0.0         # time the consumer spent waiting inside read()
+    read_latency_ms_avg: float = 0.0  # average age of delivered audio when handed out
+    read_latency_ms_max: float = 0.0  # highest age since the last reset_latency_max()
+    read_latency_ms_sum: float = 0.0  # total age of delivered audio (for per-window averages)
+    buffer_fill: float = 0.0        # capture buffer occupancy in [0, 1] at snapshot time
+
+    def since(self, previous: "CaptureStats") -> "CaptureStats":
+        """Counters accumulated after `previous`; the latency average is over that window only."""
+        chunks = self.chunks - previous.chunks
+        latency_sum = self.read_latency_ms_sum - previous.read_latency_ms_sum
+        return CaptureStats(
+            overflows=self.overflows - previous.overflows,
+            dropped_samples=self.dropped_samples - previous.dropped_samples,
+            chunks=chunks,
+            blocked_ms=self.blocked_ms - previous.blocked_ms,
+            read_latency_ms_avg=(latency_sum / chunks) if chunks > 0 else 0.0,
+            read_latency_ms_max=self.read_latency_ms_max,
+            read_latency_ms_sum=latency_sum,
+            buffer_fill=self.buffer_fill,
+        )
@@ -1,2 +1,4 @@
 from .llm_chunk import LLMChunk
-from .llm_response import LLMResponse
\ No newline at end of file
+from .llm_response import LLMResponse
+from .generation_options import GenerationOptions
+from .fallback import FALLBACK_TEXT
\ No newline at end of file
@@ -0,0 +1,2 @@
+# Short reply LLM adapters give when the provider fails, instead of leaving the user in silence.
+FALLBACK_TEXT = "Estoy teniendo un problema para responder ahora mismo; probemos de nuevo en un momento."
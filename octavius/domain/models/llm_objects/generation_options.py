@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class GenerationOptions:
+    """Per-turn request features: Google Search grounding and thinking (both cost latency)."""
+    grounding: bool = True
+    thinking: bool = True
+    reason: str = ""   # which rule decided (for logs)
+
+    @property
+    def label(self) -> str:
+        return "grounded" if self.grounding else "ungrounded"
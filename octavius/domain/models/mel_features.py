@@ -0,0 +1,36 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass(frozen=True)
+class MelFeatures:
+    """Whisper-style log-mel spectrogram of a segment, computed while it was captured.
+
+    `data` is float32 (n_mels, n_frames), already log-compressed, clamped to 8 dB below its
+    maximum and scaled like `whisper.log_mel_spectrogram`. It covers `n_samples` of audio
+    followed by `pad_samples` of trailing silence. `pad_value` is what a frame of pure
+    silence normalizes to, used to extend the spectrogram to a longer window.
+    """
+    data: np.ndarray
+    n_samples: int
+    pad_samples: int
+    pad_value: float
+    sample_rate: int = 16000
+    hop_length: int = 160
+
+    @property
+    def n_mels(self) -> int:
+        return int(self.data.shape[0])
+
+    @property
+    def n_frames(self) -> int:
+        return int(self.data.shape[1])
+
+    def padded(self, n_frames: int) -> np.ndarray:
+        """`data` trimmed or extended with silence frames to exactly `n_frames`."""
+        if self.n_frames >= n_frames:
+            return self.data[:, :n_frames]
+        out = np.full((self.n_mels, n_frames), self.pad_value, dtype=np.float32)
+        out[:, :self.n_frames] = self.data
+        return out
@@ -1,19 +1,55 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from typing import Optional, Union
+
+from octavius.domain.models.mel_features import MelFeatures
 
 @dataclass(frozen=True)
 class RecordingSegment:
     """Normalized speech segment produced by the VAD.
 
-    PCM is 16-bit mono, sampled at `sample_rate`. Timestamps are relative to the start of the segment.
+    PCM is 16-bit mono, sampled at `sample_rate`.
+
+    Timing:
+      - `start_ms` / `end_ms` are positions on the audio source's sample clock (ms since the
+        source was opened) of the first sample (pre-roll included) and of the end of the last
+        speech frame. Pauses the VAD left out of `pcm` are inside that span, so `duration_ms`
+        can be longer than the PCM itself.
+      - `captured_at` / `ended_at` are the same two instants as `time.monotonic()` values, and
+        `endpoint_at` is when the VAD decided the segment was over. They are None when the
+        source provides no capture times.
+
+    `pcm` may be a zero-copy memoryview into the producer's buffer (bytes-like: works with
+    `len()`, `np.frombuffer`, truthiness). Producers reuse that memory later on, so copy it
+    with `bytes(segment.pcm)` if it must outlive the turn.
+
+    `features` optionally carries the segment's log-mel spectrogram, computed by the
+    producer while the audio arrived; ASR adapters that understand it skip their own
+    front-end.
     """
-    pcm: bytes
+    pcm: Union[bytes, memoryview]
     sample_rate: int
     channels: int           # always 1 (mono)
     frame_ms: int           # frame window used during VAD (10/20/30)
     start_ms: int
     end_ms: int
+    captured_at: Optional[float] = None
+    ended_at: Optional[float] = None
+    endpoint_at: Optional[float] = None
+    features: Optional[MelFeatures] = None
 
     @property
     def duration_ms(self) -> int:
         return max(0, self.end_ms - self.start_ms)
+
+    @property
+    def pcm_ms(self) -> int:
+        """Length of the audio actually contained in `pcm`."""
+        return len(self.pcm) * 1000 // (2 * self.channels * self.sample_rate)
+
+    @property
+    def endpoint_delay_ms(self) -> Optional[float]:
+        """Time between the end of speech and the VAD closing the segment."""
+        if self.ended_at is None or self.endpoint_at is None:
+            return None
+        return (self.endpoint_at - self.ended_at) * 1000.0
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Optional, Any, Dict
 from .intent import Intent
+from .asr_stats import AsrStats
 
 @dataclass(frozen=True)
 class Utterance:
@@ -9,4 +10,5 @@ class Utterance:
     intent: Optional[Intent]  =None
     slots: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 0.0
-    asr_confidence: Optional[float] = None
\ No newline at end of file
+    asr_confidence: Optional[float] = None
+    asr_stats: Optional[AsrStats] = None
\ No newline at end of file
@@ -0,0 +1,45 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Union
+
+from octavius.domain.models.recording_segment import RecordingSegment
+
+
+class EndReason(str, Enum):
+    """Why a speech segment was closed."""
+    SILENCE = "silence"          # `silence_ms` of continuous non-speech
+    MAX_LENGTH = "max_length"    # `max_record_ms` reached
+    STREAM_END = "stream_end"    # the frames iterator was exhausted
+
+
+@dataclass(frozen=True)
+class SpeechStart:
+    """Speech detected. `timestamp_ms` is the source sample-clock position of the segment's
+    first sample (pre-roll included); `captured_at` is that instant as `time.monotonic()`."""
+    timestamp_ms: int
+    captured_at: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class SpeechChunk:
+    """Samples appended to the current segment since the previous event.
+
+    `pcm` is PCM16 mono at the VAD sample rate; `offset_ms` is its position inside the segment.
+    Like `RecordingSegment.pcm` it may be a zero-copy view into the VAD's buffer.
+    """
+    pcm: Union[bytes, memoryview]
+    offset_ms: int
+
+
+@dataclass(frozen=True)
+class SpeechEnd:
+    """Segment closed. When no speech was found before the limit, `segment.pcm` is empty
+    and no SpeechStart precedes this event. `trailing_silence_ms` is the non-speech run
+    after the last speech frame when the segment closed (0: cut while speaking)."""
+    reason: EndReason
+    segment: RecordingSegment
+    trailing_silence_ms: int = 0
+
+
+VadEvent = Union[SpeechStart, SpeechChunk, SpeechEnd]
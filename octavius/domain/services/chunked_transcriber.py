@@ -0,0 +1,213 @@
+from __future__ import annotations
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+import logging
+import re
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from octavius.domain.models.asr_stats import AsrStats
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.domain.models.mel_features import MelFeatures
+from octavius.domain.models.vad_event import SpeechChunk, SpeechEnd, VadEvent
+from octavius.ports.asr import ASRPort
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[^\w']+", re.UNICODE)
+
+
+def _norm(word: str) -> str:
+    return _WORD_RE.sub("", word.lower())
+
+
+def _overlap_words(prev: Sequence[str], nxt: Sequence[str], max_words: int) -> int:
+    """Number of leading words of `nxt` that repeat the tail of `prev` (0 if none)."""
+    a = [_norm(w) for w in prev[-max_words:]]
+    b = [_norm(w) for w in nxt[:max_words]]
+    for k in range(min(len(a), len(b)), 0, -1):
+        if a[-k:] == b[:k]:
+            return k
+    return 0
+
+
+def stitch_transcripts(texts: Sequence[str], max_overlap_words: int = 8) -> str:
+    """Join chunk transcripts, dropping the words each chunk repeats from the previous one.
+
+    Matching is case/punctuation insensitive; the first chunk's spelling is kept.
+    """
+    words: List[str] = []
+    for text in texts:
+        nxt = text.split()
+        k = _overlap_words(words, nxt, max_overlap_words) if words else 0
+        words.extend(nxt[k:])
+    return " ".join(words)
+
+
+def quiet_point(x: np.ndarray, win: int) -> int:
+    """Offset of the centre of the lowest-energy `win`-sample window of `x` (latest on ties).
+
+    Returns len(x) when `x` is shorter than one window.
+    """
+    hop = max(1, win // 2)
+    x = np.asarray(x, dtype=np.float32)
+    if len(x) < win:
+        return len(x)
+    frames = np.lib.stride_tricks.sliding_window_view(x, win)[::hop]
+    energy = np.einsum("ij,ij->i", frames, frames)
+    idx = len(energy) - 1 - int(np.argmin(energy[::-1]))
+    return idx * hop + win // 2
+
+
+class ChunkedTranscriber:
+    """Transcribes long speech in overlapping chunks while it is still being captured.
+
+    Fed with VAD events (`on_event`), it accumulates speech PCM and, every `chunk_seconds`,
+    closes a chunk at the quietest point of the last `search_ms` and submits it to the ASR
+    on a background worker. Each chunk starts `overlap_ms` before the previous cut so words
+    at the boundary are heard whole; `finish()` transcribes the tail and stitches the
+    partial transcripts with overlap deduplication.
+
+    The time spent in `finish()` therefore depends on the last chunk only. When the whole
+    utterance fits in that one chunk, the log-mel features the VAD computed during capture
+    (`SpeechEnd.segment.features`) go along with it, so the ASR does not recompute them.
+    One worker by default: ASR models are generally not safe to call concurrently.
+    """
+
+    def __init__(
+        self,
+        asr: ASRPort,
+        *,
+        sample_rate: int,
+        frame_ms: int,
+        chunk_seconds: float = 10.0,
+        overlap_ms: int = 1000,
+        search_ms: int = 2000,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        if chunk_seconds <= 0:
+            raise ValueError("chunk_seconds must be > 0")
+        if overlap_ms < 0 or search_ms <= 0:
+            raise ValueError("overlap_ms must be >= 0 and search_ms > 0")
+        self._asr = asr
+        self._rate = int(sample_rate)
+        self._frame_ms = int(frame_ms)
+        self._chunk = int(chunk_seconds * self._rate)
+        self._overlap = int(overlap_ms * self._rate / 1000)
+        self._search = min(int(search_ms * self._rate / 1000), self._chunk // 2)
+        self._win = max(1, self._rate // 50)          # 20 ms energy window
+        self._max_overlap_words = max(3, int(overlap_ms / 1000 * 5) + 2)
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="asr-chunk")
+        self._buf = np.zeros(self._chunk + self._rate, dtype=np.int16)
+        self._futures: List[Future] = []
+        self._segments: List[RecordingSegment] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop any audio and pending chunks from a previous utterance."""
+        for fut in self._futures:
+            fut.cancel()
+        self._n = 0        # samples accumulated
+        self._cut = 0      # where the next chunk starts (before overlap)
+        self._base = 0     # samples already dropped from the front of the buffer
+        self._futures = []
+        self._segments = []
+        self._features: Optional[MelFeatures] = None
+
+    def close(self) -> None:
+        self.reset()
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+    # -------- feeding --------
+
+    def on_event(self, event: VadEvent) -> None:
+        """Accumulate speech from SpeechChunk events and submit every chunk that closes."""
+        if isinstance(event, SpeechEnd):
+            self._features = event.segment.features
+            return
+        if not isinstance(event, SpeechChunk):
+            return
+        x = np.frombuffer(event.pcm, dtype=np.int16)
+        if self._n + len(x) > self._buf.size:
+            self._compact()
+        if self._n + len(x) > self._buf.size:
+            grown = np.zeros(max(self._n + len(x), 2 * self._buf.size), dtype=np.int16)
+            grown[:self._n] = self._buf[:self._n]
+            self._buf = grown
+        self._buf[self._n:self._n + len(x)] = x
+        self._n += len(x)
+
+        while self._n - self._cut >= self._chunk:
+            end = self._cut + self._chunk
+            cut = self._quiet_point(end - self._search, end)
+            self._submit(self._cut, cut)
+            self._cut = cut
+
+    def finish(self) -> Utterance:
+        """Submit the remaining audio, wait for every chunk and return the stitched utterance."""
+        if self._n > self._cut:
+            feats = self._features
+            whole = not self._futures and self._cut == 0 and self._base == 0
+            if whole and feats is not None and feats.n_samples == self._n:
+                self._submit(0, self._n, features=feats)
+            else:
+                self._submit(self._cut, self._n)
+        try:
+            results: List[Utterance] = [f.result() for f in self._futures]
+            seconds = [len(seg.pcm) / 2 / self._rate for seg in self._segments]
+        finally:
+            self._n = self._cut = self._base = 0
+            self._futures = []
+            self._segments = []
+            self._features = None
+        if not results:
+            return Utterance(raw_text="")
+        if len(results) > 1:
+            logger.info("[asr] stitched %d chunks", len(results))
+        text = stitch_transcripts([(u.raw_text or "").strip() for u in results], self._max_overlap_words)
+        stats = None
+        if all(u.asr_stats is not None for u in results):
+            stats = AsrStats.combine(zip(seconds, (u.asr_stats for u in results)))
+        return Utterance(raw_text=text, lang=results[0].lang, asr_stats=stats,
+                         asr_confidence=stats.confidence if stats else None)
+
+    @property
+    def has_audio(self) -> bool:
+        return self._n > 0
+
+    @property
+    def submitted(self) -> int:
+        """Chunks handed to the ASR for the current utterance."""
+        return len(self._futures)
+
+    # -------- internals --------
+
+    def _quiet_point(self, lo: int, hi: int) -> int:
+        return lo + quiet_point(self._buf[lo:hi], self._win)
+
+    def _compact(self) -> None:
+        """Forget audio no future chunk can reach (before the next chunk's overlap)."""
+        drop = max(0, self._cut - self._overlap)
+        if not drop:
+            return
+        keep = self._n - drop
+        self._buf[:keep] = self._buf[drop:self._n]
+        self._n, self._cut, self._base = keep, self._cut - drop, self._base + drop
+
+    def _submit(self, start: int, end: int, features: Optional[MelFeatures] = None) -> None:
+        begin = max(0, start - self._overlap)
+        segment = RecordingSegment(
+            pcm=self._buf[begin:end].tobytes(),   # own copy: the buffer keeps growing
+            sample_rate=self._rate,
+            channels=1,
+            frame_ms=self._frame_ms,
+            start_ms=(self._base + begin) * 1000 // self._rate,
+            end_ms=(self._base + end) * 1000 // self._rate,
+            features=features,
+        )
+        logger.debug("[asr] chunk %d: %d..%d ms", len(self._futures), segment.start_ms, segment.end_ms)
+        self._segments.append(segment)
+        self._futures.append(self._executor.submit(self._asr.transcribe, segment))
@@ -0,0 +1,65 @@
+# octavius/domain/services/query_classifier.py
+from __future__ import annotations
+import re
+import unicodedata
+from typing import Iterable, Sequence, Tuple
+
+from octavius.domain.models.llm_objects import GenerationOptions
+
+# (reason, regex) pairs matched against the lower-cased, accent-free user text.
+# Turns that depend on fresh or checkable facts: worth a Google Search round trip.
+DEFAULT_GROUNDING: Sequence[Tuple[str, str]] = (
+    ("news", r"\b(noticias?|actualidad|ultima hora|titulares|news|headlines?|latest)\b"),
+    ("date", r"\b(hoy|ayer|manana|esta (semana|noche)|este (mes|ano)|que dia|fecha|today|tomorrow|yesterday|"
+             r"what day|this (week|year)|que hora (es|son)|what time is it)\b|\b(19|20)\d\d\b"),
+    ("weather", r"\b(tiempo (hace|hara|va a hacer)|clima|llover|lluvia|temperatura|pronostico|weather|forecast)\b"),
+    ("price", r"\b(precios?|cuesta|cuestan|cotiza\w*|bolsa|bitcoin|euros?|dolar(es)?|price|cost|stock)\b"),
+    ("sports", r"\b(resultados?|partido|marcador|gano|liga|clasificacion|score|match)\b"),
+    ("fact", r"\b(quien (es|fue|era|gano|invento|escribio)|cuando (es|fue|sera|nacio|murio)|"
+             r"donde (esta|queda|nacio)|cuantos? (habitantes|anos|km|kilometros|metros)|"
+             r"capital de|poblacion|horario|abre|cierra|estreno|elecciones|presidente|ministr[oa]|"
+             r"who (is|was|won)|when (is|was|did)|where is|how (tall|old|far|many))\b"),
+)
+# Turns that need some reasoning before answering.
+DEFAULT_THINKING: Sequence[Tuple[str, str]] = (
+    ("math", r"\d+\s*([-+*/x×^]|por|mas|menos|entre|times|plus|minus)\s*\d+|\b(calcula|cuanto (es|son)|"
+             r"porcentaje|calculate|what is \d)"),
+    ("reasoning", r"\b(por que|explica(me)?|compara|diferencias? entre|ventajas|paso a paso|resuelve|"
+                  r"planifica|organiza|como (funciona|puedo|se hace|hago)|why|explain|compare|step by step|"
+                  r"how (do|does|can|should))\b"),
+)
+
+
+def _normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+class QueryClassifier:
+    """Decides per turn whether the LLM request needs search grounding and thinking.
+
+    Cheap keyword rules on the user's last utterance (Spanish and English): news, dates,
+    weather, prices, results and factual questions enable grounding; arithmetic and
+    "explain / compare / how do I" requests enable thinking. Anything else (greetings,
+    small talk, opinions) gets neither, which is the fast path.
+    """
+
+    def __init__(
+        self,
+        *,
+        grounding: Iterable[Tuple[str, str]] = DEFAULT_GROUNDING,
+        thinking: Iterable[Tuple[str, str]] = DEFAULT_THINKING,
+    ) -> None:
+        self._grounding = [(name, re.compile(p)) for name, p in grounding]
+        self._thinking = [(name, re.compile(p)) for name, p in thinking]
+
+    def classify(self, text: str) -> GenerationOptions:
+        norm = _normalize(text or "")
+        ground = next((name for name, rx in self._grounding if rx.search(norm)), None)
+        think = next((name for name, rx in self._thinking if rx.search(norm)), None)
+        reasons = [r for r in (ground, think) if r]
+        return GenerationOptions(
+            grounding=ground is not None,
+            thinking=think is not None,
+            reason="+".join(reasons) or "chit-chat",
+        )
@@ -0,0 +1,57 @@
+# octavius/domain/services/sentence_splitter.py
+from __future__ import annotations
+import re
+from typing import List, Optional
+
+# Abbreviations whose final dot does not end a sentence (compared lower-cased, without the dot).
+_ABBREVIATIONS = frozenset({
+    "sr", "sra", "srta", "dr", "dra", "dña", "ud", "uds", "ej", "pág", "núm", "aprox", "av", "avda",
+    "mr", "mrs", "ms", "st", "vs", "e.g", "i.e", "mme", "mlle",
+})
+# terminator run, optional closing quotes/brackets, then whitespace
+_BOUNDARY = re.compile(r"[.!?…]+[\"'»”)\]]*\s+|\n+")
+
+
+class SentenceSplitter:
+    """Cuts a streamed LLM answer into sentences as the text arrives.
+
+    `push(delta)` returns the sentences completed by that delta; `flush()` returns what is
+    left at the end of the stream. A sentence ends at ., !, ? or … followed by whitespace
+    (so "3.5" or a dot at the very end of a delta wait for the next one), or at a newline.
+    Known abbreviations ("Sr.", "p. ej.") and single-letter initials do not end a sentence,
+    and pieces shorter than `min_chars` are merged into the next sentence.
+    """
+
+    def __init__(self, min_chars: int = 12) -> None:
+        self._min = int(min_chars)
+        self._buf = ""
+        self._scan = 0   # boundaries before this offset were already rejected
+
+    def push(self, delta: str) -> List[str]:
+        self._buf += delta
+        out: List[str] = []
+        start = 0
+        for m in _BOUNDARY.finditer(self._buf, max(0, self._scan - 1)):
+            end = m.end()
+            piece = self._buf[start:end].strip()
+            if not piece or len(piece) < self._min:
+                continue
+            if m.group().startswith(".") and self._is_abbreviation(self._buf[start:m.start()]):
+                continue
+            out.append(piece)
+            start = end
+        self._buf = self._buf[start:]
+        self._scan = len(self._buf)
+        return out
+
+    def flush(self) -> Optional[str]:
+        rest, self._buf, self._scan = self._buf.strip(), "", 0
+        return rest or None
+
+    @staticmethod
+    def _is_abbreviation(text: str) -> bool:
+        words = text.rstrip().split()
+        if not words:
+            return False
+        last = words[-1].lower().lstrip("(¿¡\"'«")
+        return last in _ABBREVIATIONS or (len(last) == 1 and last.isalpha())
@@ -0,0 +1,76 @@
+# octavius/domain/services/transcript_gate.py
+from __future__ import annotations
+from dataclasses import dataclass
+import re
+from typing import Iterable, Optional, Sequence
+
+from octavius.domain.models.utterance import Utterance
+
+# Phrases Whisper produces on noise, music or coughs: subtitle credits and video outros
+# from its training data. Matched against the lower-cased transcript.
+DEFAULT_HALLUCINATIONS: Sequence[str] = (
+    r"amara\.org",
+    r"subt[ií]tulos (realizados|hechos|creados) por",
+    r"subtitulado por",
+    r"gracias por (ver|mirar)",
+    r"suscr[ií]bete",
+    r"no olvides suscribirte",
+    r"thanks? (you )?for watching",
+    r"please subscribe",
+    r"subtitles by",
+    r"sous-titr(es|age) (réalisés )?par",
+    r"merci d'avoir regardé",
+    r"^\W*(m[uú]sica|music|musique|aplausos|applause|risas)\W*$",   # "[Música]", "(Aplausos)"
+)
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass(frozen=True)
+class GateDecision:
+    accepted: bool
+    reason: Optional[str] = None
+
+
+class TranscriptGate:
+    """Decides whether a transcript is worth a turn (history + LLM request).
+
+    Rejects:
+    - empty / punctuation-only text,
+    - `asr_confidence` below `min_confidence` (when the adapter reports one),
+    - known hallucination phrases (`patterns`, regexes on the lower-cased text),
+    - a word repeated back to back `max_repeats` times or more (decoder loop).
+    """
+
+    def __init__(
+        self,
+        *,
+        min_confidence: float = 0.3,
+        patterns: Iterable[str] = DEFAULT_HALLUCINATIONS,
+        max_repeats: int = 4,
+    ) -> None:
+        self._min_conf = float(min_confidence)
+        self._patterns = [re.compile(p, re.IGNORECASE) for p in patterns]
+        self._max_repeats = int(max_repeats)
+
+    def check(self, utt: Utterance) -> GateDecision:
+        text = (utt.raw_text or "").strip()
+        words = _WORD.findall(text.lower())
+        if not words:
+            return GateDecision(False, "empty")
+        if utt.asr_confidence is not None and utt.asr_confidence < self._min_conf:
+            return GateDecision(False, f"confidence={utt.asr_confidence:.2f}")
+        for p in self._patterns:
+            if p.search(text):
+                return GateDecision(False, f"hallucination '{p.pattern}'")
+        if self._max_repeats > 1 and _longest_run(words) >= self._max_repeats:
+            return GateDecision(False, "repetition")
+        return GateDecision(True)
+
+
+def _longest_run(words: Sequence[str]) -> int:
+    best = run = 1
+    for prev, cur in zip(words, words[1:]):
+        run = run + 1 if cur == prev else 1
+        best = max(best, run)
+    return best
@@ -1,9 +1,12 @@
 from __future__ import annotations
 import signal
+import time
 from dataclasses import dataclass
-from typing import Callable, Optional, Iterator
+from typing import Callable, List, Optional, Iterator, Tuple
 import logging
 
+from octavius.domain.models.audio_frame import AudioFrame
+from octavius.domain.models.recording_segment import RecordingSegment
 from octavius.domain.models.utterance import Utterance
 from octavius.ports.audio_source import AudioSource
 from octavius.ports.vad import VADPort
@@ -11,11 +14,22 @@ from octavius.ports.asr import ASRPort
 from octavius.ports.llm import LLMClient
 from octavius.domain.services.conversation_history import ConversationHistory
 from octavius.domain.models.turn import Turn, Role
-from octavius.domain.models.llm_objects import LLMResponse
+from octavius.domain.models.llm_objects import GenerationOptions, LLMResponse
 from octavius.domain.models.turn_state import TurnState
+from octavius.domain.models.capture_stats import CaptureStats
+from octavius.domain.models.vad_event import EndReason, SpeechEnd
+from octavius.domain.services.chunked_transcriber import ChunkedTranscriber
+from octavius.domain.services.transcript_gate import TranscriptGate
+from octavius.domain.services.sentence_splitter import SentenceSplitter
+from octavius.domain.services.query_classifier import QueryClassifier
+from octavius.utils.latency import LatencyRecorder
 
 logger = logging.getLogger(__name__)
 
+# A max_record_ms cut continues the turn only if the user was still talking: a non-speech
+# run longer than a pause between words means the cut landed in the trailing silence.
+_CONTINUE_MAX_GAP_MS = 300
+
 @dataclass(frozen=True)
 class TurnResult:
     asr_text: Optional[str]
@@ -23,6 +37,20 @@ class TurnResult:
     segment_ms: Optional[int]
     raw_asr: Optional[Utterance] = None
     raw_llm: Optional[LLMResponse] = None
+    # latency relative to the end of speech (segment.ended_at); None if the source has no capture times
+    endpoint_delay_ms: Optional[float] = None
+    asr_done_ms: Optional[float] = None
+    llm_done_ms: Optional[float] = None
+    rejected: Optional[str] = None   # why the transcript gate dropped the turn
+    # streaming only: first LLM token / first complete sentence, relative to the end of speech
+    ttft_ms: Optional[float] = None
+    ttfs_ms: Optional[float] = None
+    llm_options: Optional[GenerationOptions] = None   # grounding/thinking chosen for this turn
+
+def _options_kw(options: Optional[GenerationOptions]) -> dict:
+    """`options=` only when there is a per-turn decision (clients without it keep working)."""
+    return {"options": options} if options is not None else {}
+
 
 class TurnManager:
     """Single-turn orchestrator following your class diagram."""
@@ -37,6 +65,11 @@ class TurnManager:
         history: ConversationHistory,
         llm_system_prompt: Optional[str] = None,
         llm_max_tokens_context: int = 2048,
+        chunker: Optional[ChunkedTranscriber] = None,
+        gate: Optional[TranscriptGate] = None,
+        llm_streaming: bool = False,
+        on_sentence: Optional[Callable[[str], None]] = None,
+        classifier: Optional[QueryClassifier] = None,
     ) -> None:
         self._audio = audio
         self._vad = vad
@@ -45,8 +78,15 @@ class TurnManager:
         self._history = history
         self._sys_prompt = llm_system_prompt
         self._ctx_budget = llm_max_tokens_context
+        self._chunker = chunker
+        self._gate = gate
+        self._streaming = llm_streaming
+        self._on_sentence = on_sentence
+        self._classifier = classifier
+        self._llm_latency = LatencyRecorder()
         self._log = logger
         self._state: TurnState = TurnState.IDLE
+        self._last_capture: CaptureStats = CaptureStats()
 
     # -------- state handling --------
 
@@ -99,7 +139,7 @@ class TurnManager:
 
         # Reuse a single frames iterator bound to the open AudioSource.
         self._set_state(TurnState.IDLE)
-        frames: Iterator[bytes] = self._audio.capture_stream()
+        frames: Iterator[AudioFrame] = self._audio.capture_stream()
         try:
             while not stop_flag["stop"]:
                 try:
@@ -131,35 +171,190 @@ class TurnManager:
 
     # -------------- internal helper (shared by run_once / run_forever) -----
 
-    def _run_once_with_frames(self, frames: Iterator[bytes]) -> TurnResult:
+    def _run_once_with_frames(self, frames: Iterator[AudioFrame]) -> TurnResult:
         """Core single-turn logic that consumes a persistent frames iterator."""
         self._set_state(TurnState.LISTENING)
-        recording_segment = self._vad.capture_until_silence(frames)  # RecordingSegment
+        if self._chunker is None:
+            recording_segment = self._vad.capture_until_silence(frames)  # RecordingSegment
+            segment_ms = recording_segment.duration_ms
+        else:
+            recording_segment, segment_ms = self._listen_chunked(frames)
+
+        self._log_capture_stats()
 
         if not recording_segment.pcm:
             self._log.warning("Empty recording_segment from VAD; returning early")
+            if self._chunker is not None:
+                self._chunker.reset()
             self._set_state(TurnState.IDLE)
             return TurnResult(asr_text=None, llm_text=None, segment_ms=None)
         self._set_state(TurnState.TRANSCRIBING)
-        utt = self._asr.transcribe(recording_segment)  #Utterance
+        if self._chunker is None:
+            utt = self._asr.transcribe(recording_segment)  #Utterance
+        else:
+            utt = self._chunker.finish()  # only the last chunk is still pending here
+        asr_done_ms = self._since_speech_end(recording_segment)
         user_text = utt.raw_text or ""
+        if self._gate is not None:
+            decision = self._gate.check(utt)
+            if not decision.accepted:
+                self._log.info("[gate] transcript dropped (%s): %r", decision.reason, user_text)
+                self._set_state(TurnState.IDLE)
+                return TurnResult(
+                    asr_text=user_text,
+                    llm_text=None,
+                    segment_ms=segment_ms,
+                    raw_asr=utt,
+                    endpoint_delay_ms=recording_segment.endpoint_delay_ms,
+                    asr_done_ms=asr_done_ms,
+                    rejected=decision.reason,
+                )
         self._history.append(Turn(role=Role.user, text=user_text))
         self._set_state(TurnState.PROCESSING)
         ctx = self._history.build_context(max_tokens=self._ctx_budget)
         prompt = ctx.to_prompt()
         self._log.info("%s",prompt)
 
-        llm_resp = self._llm.generate(prompt, system_prompt=self._sys_prompt)
+        options = self._classifier.classify(user_text) if self._classifier is not None else None
+        ttft_ms = ttfs_ms = None
+        t_llm = time.monotonic()
+        if self._streaming:
+            llm_resp, ttft_ms, ttfs_ms = self._generate_streaming(prompt, recording_segment, options)
+        else:
+            llm_resp = self._llm.generate(prompt, system_prompt=self._sys_prompt, **_options_kw(options))
+        llm_done_ms = self._since_speech_end(recording_segment)
+        if options is not None:
+            self._log_llm_latency(options, (time.monotonic() - t_llm) * 1000.0)
         assistant_text = llm_resp.text or ""
         self._history.append(Turn(role=Role.assistant, text=assistant_text))
         self._log.info("ASR: %s", user_text)
         self._log.info("LLM: %s", assistant_text)
+        endpoint_ms = recording_segment.endpoint_delay_ms
+        if endpoint_ms is not None and asr_done_ms is not None and llm_done_ms is not None:
+            self._log.info(
+                "[latency] speech=%d..%dms endpoint=+%.0fms asr=+%.0fms llm=+%.0fms%s",
+                recording_segment.start_ms, recording_segment.end_ms, endpoint_ms, asr_done_ms, llm_done_ms,
+                f" ttft=+{ttft_ms:.0f}ms ttfs=+{ttfs_ms:.0f}ms" if ttft_ms is not None and ttfs_ms is not None else "",
+            )
         self._set_state(TurnState.IDLE)
         return TurnResult(
             asr_text=user_text,
             llm_text=assistant_text,
-            segment_ms=recording_segment.duration_ms,
+            segment_ms=segment_ms,
             raw_asr=utt,
             raw_llm=llm_resp,
+            endpoint_delay_ms=endpoint_ms,
+            asr_done_ms=asr_done_ms,
+            llm_done_ms=llm_done_ms,
+            ttft_ms=ttft_ms,
+            ttfs_ms=ttfs_ms,
+            llm_options=options,
+        )
+
+    def _log_llm_latency(self, options: GenerationOptions, llm_ms: float) -> None:
+        """Log this turn's LLM time and the running percentiles of grounded vs ungrounded turns."""
+        self._llm_latency.record(options.label, llm_ms)
+        self._log.info(
+            "[llm] %s thinking=%s (%s) %.0fms | %s",
+            options.label, "on" if options.thinking else "off", options.reason, llm_ms,
+            self._llm_latency.summary(qs=(50, 90)),
+        )
+
+    def _generate_streaming(
+        self, prompt: str, segment: RecordingSegment, options: Optional[GenerationOptions] = None,
+    ) -> Tuple[LLMResponse, Optional[float], Optional[float]]:
+        """Consume `llm.stream()`, handing each complete sentence to `on_sentence` as it arrives.
+
+        Returns the assembled response plus time-to-first-token and time-to-first-sentence
+        (ms since the end of speech; None without capture times or without text).
+        """
+        splitter = SentenceSplitter()
+        parts: List[str] = []
+        ttft_ms = ttfs_ms = None
+        n_sentences = 0
+
+        def emit(sentence: str) -> None:
+            nonlocal ttfs_ms, n_sentences
+            if n_sentences == 0:
+                ttfs_ms = self._since_speech_end(segment)
+            n_sentences += 1
+            self._log.debug("[llm] sentence %d: %s", n_sentences, sentence)
+            if self._on_sentence is not None:
+                try:
+                    self._on_sentence(sentence)
+                except Exception:
+                    self._log.exception("on_sentence callback raised")
+
+        for chunk in self._llm.stream(prompt, system_prompt=self._sys_prompt, **_options_kw(options)):
+            if chunk.delta:
+                if not parts:
+                    ttft_ms = self._since_speech_end(segment)
+                parts.append(chunk.delta)
+                for sentence in splitter.push(chunk.delta):
+                    emit(sentence)
+            if chunk.is_final:
+                break
+        rest = splitter.flush()
+        if rest:
+            emit(rest)
+        return LLMResponse(text="".join(parts).strip()), ttft_ms, ttfs_ms
+
+    def _listen_chunked(self, frames: Iterator[AudioFrame]) -> Tuple[RecordingSegment, int]:
+        """Capture speech while the chunker transcribes it in the background.
+
+        A segment cut by `vad.max_record_ms` while the user is still talking does not end the
+        turn: listening continues with a new segment and its audio keeps feeding the same
+        chunked transcription. A cut inside the trailing silence ends the turn as usual (a new
+        segment could only close at the next `max_record_ms`, since it has no speech yet).
+        Returns the last segment with speech and the speech span across all segments.
+        """
+        assert self._chunker is not None
+        self._chunker.reset()
+        first: Optional[RecordingSegment] = None
+        last: Optional[RecordingSegment] = None
+        while True:
+            end: Optional[SpeechEnd] = None
+            for ev in self._vad.stream_events(frames):
+                self._chunker.on_event(ev)
+                if isinstance(ev, SpeechEnd):
+                    end = ev
+            if end is None:  # pragma: no cover - VADPort contract
+                raise RuntimeError("VAD stream_events() finished without SpeechEnd")
+            if end.segment.pcm or last is None:
+                last = end.segment
+            if end.segment.pcm and first is None:
+                first = end.segment
+            if end.reason is not EndReason.MAX_LENGTH or not end.segment.pcm:
+                break
+            if end.trailing_silence_ms > _CONTINUE_MAX_GAP_MS:
+                self._log.info("[vad] max_record_ms reached %d ms after speech; ending the turn",
+                               end.trailing_silence_ms)
+                break
+            self._log.info("[vad] max_record_ms reached while speaking; continuing the turn")
+        span = last.end_ms - first.start_ms if first is not None else last.duration_ms
+        return last, max(0, span)
+
+    @staticmethod
+    def _since_speech_end(segment: RecordingSegment) -> Optional[float]:
+        """Milliseconds elapsed since the end of speech, on the capture clock."""
+        if segment.ended_at is None:
+            return None
+        return (time.monotonic() - segment.ended_at) * 1000.0
+
+    def _log_capture_stats(self) -> None:
+        """Log capture counters accumulated since the previous turn (once per turn)."""
+        try:
+            current = self._audio.stats()
+        except Exception:
+            self._log.debug("AudioSource stats unavailable", exc_info=True)
+            return
+        delta = current.since(self._last_capture)
+        self._last_capture = current
+        log = self._log.warning if (delta.overflows or delta.dropped_samples) else self._log.info
+        log(
+            "[capture] overflows=%d dropped=%d chunks=%d blocked=%.0fms latency avg=%.1fms max=%.1fms fill=%.0f%%",
+            delta.overflows, delta.dropped_samples, delta.chunks, delta.blocked_ms,
+            delta.read_latency_ms_avg, delta.read_latency_ms_max, delta.buffer_fill * 100.0,
         )
+        self._audio.reset_latency_max()   # the next turn reports its own peak
 
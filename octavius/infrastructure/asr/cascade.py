@@ -0,0 +1,122 @@
+# octavius/infrastructure/asr/cascade.py
+from __future__ import annotations
+from concurrent.futures import Future
+from dataclasses import dataclass
+import logging
+import threading
+import time
+from typing import Optional
+
+from octavius.domain.models.asr_stats import AsrStats
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.ports.asr import ASRPort
+from octavius.infrastructure.asr.warmup import ReadyMixin, load_in_background
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CascadeThresholds:
+    min_avg_logprob: float = -0.7      # escalate below this
+    max_no_speech_prob: float = 0.6    # escalate above this (when there is text)
+    max_compression_ratio: float = 2.4  # escalate above this (repetition loop)
+
+
+@dataclass(frozen=True)
+class CascadeStats:
+    calls: int = 0
+    escalations: int = 0
+    first_ms_avg: float = 0.0
+    second_ms_avg: float = 0.0
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalations / self.calls if self.calls else 0.0
+
+
+class CascadingTranscriber(ReadyMixin, ASRPort):
+    """Runs a fast model first and re-runs the segment on a larger one only when unsure.
+
+    The first stage's `Utterance.asr_stats` decide: low average log-probability, a high
+    no-speech probability on non-empty text, or a repetition-like compression ratio send
+    the segment to the second stage. An empty first-stage transcript (silence, a false VAD
+    trigger) and a result without stats are final: only real low-confidence stats escalate,
+    so the common case pays for the small model alone.
+    Both adapters are opened (loaded) once; `ready` resolves when both are.
+    """
+
+    def __init__(self, first: ASRPort, second: ASRPort, thresholds: CascadeThresholds = CascadeThresholds()) -> None:
+        self._first = first
+        self._second = second
+        self._t = thresholds
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._escalations = 0
+        self._first_ms = 0.0
+        self._second_ms = 0.0
+        self.ready: Optional[Future] = None
+
+    def open(self) -> None:
+        self._first.open()
+        self._second.open()
+        stages = [getattr(a, "ready", None) for a in (self._first, self._second)]
+        self.ready = load_in_background(
+            lambda: [f.result() for f in stages if f is not None], name="asr-cascade-load",
+        )
+
+    def close(self) -> None:
+        self._first.close()
+        self._second.close()
+        self.ready = None
+
+    def transcribe(self, segment: RecordingSegment) -> Utterance:
+        t0 = time.perf_counter()
+        utt = self._first.transcribe(segment)
+        t1 = time.perf_counter()
+        reason = self._escalation_reason(utt)
+        if reason is None:
+            self._account((t1 - t0) * 1000.0, None)
+            return utt
+
+        better = self._second.transcribe(segment)
+        second_ms = (time.perf_counter() - t1) * 1000.0
+        st = self._account((t1 - t0) * 1000.0, second_ms)
+        logger.info("[asr] cascade escalated (%s): %.0f ms + %.0f ms; rate %d/%d (%.0f%%)",
+                    reason, (t1 - t0) * 1000.0, second_ms, st.escalations, st.calls, st.escalation_rate * 100.0)
+        return better
+
+    def stats(self) -> CascadeStats:
+        with self._lock:
+            return self._snapshot()
+
+    # -------- internals --------
+
+    def _escalation_reason(self, utt: Utterance) -> Optional[str]:
+        s: Optional[AsrStats] = utt.asr_stats
+        if s is None or not (utt.raw_text or "").strip():
+            return None
+        if s.avg_logprob < self._t.min_avg_logprob:
+            return f"avg_logprob={s.avg_logprob:.2f}"
+        if s.no_speech_prob > self._t.max_no_speech_prob:
+            return f"no_speech={s.no_speech_prob:.2f}"
+        if s.compression_ratio > self._t.max_compression_ratio:
+            return f"compression={s.compression_ratio:.2f}"
+        return None
+
+    def _account(self, first_ms: float, second_ms: Optional[float]) -> CascadeStats:
+        with self._lock:
+            self._calls += 1
+            self._first_ms += first_ms
+            if second_ms is not None:
+                self._escalations += 1
+                self._second_ms += second_ms
+            return self._snapshot()
+
+    def _snapshot(self) -> CascadeStats:
+        return CascadeStats(
+            calls=self._calls,
+            escalations=self._escalations,
+            first_ms_avg=self._first_ms / self._calls if self._calls else 0.0,
+            second_ms_avg=self._second_ms / self._escalations if self._escalations else 0.0,
+        )
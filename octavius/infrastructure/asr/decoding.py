@@ -0,0 +1,83 @@
+# octavius/infrastructure/asr/decoding.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class DecodingProfile:
+    """Whisper decoding knobs that trade accuracy for latency.
+
+    - `pin_language`: decode in `asr.language` instead of detecting it on every segment.
+    - `beam_size` / `best_of`: beam search width (1 = greedy) and candidates sampled when
+      falling back to temperature > 0.
+    - `temperatures`: fallback schedule; a single 0.0 means no re-decoding.
+    - `without_timestamps`: skip timestamp tokens (shorter decode, we only need the text).
+    - `condition_on_previous_text`: feed the previous window as prompt (only matters > 30 s).
+    - `no_speech_threshold`: above this no-speech probability a window is treated as silence.
+    - `compression_ratio_threshold`: above this gzip ratio a decode is a repetition loop
+      (re-decoded at the next temperature, or not trusted on the short path).
+    """
+    pin_language: bool
+    beam_size: int
+    best_of: int
+    temperatures: Tuple[float, ...]
+    without_timestamps: bool
+    condition_on_previous_text: bool
+    no_speech_threshold: Optional[float] = 0.6
+    compression_ratio_threshold: Optional[float] = 2.4
+
+    def language(self, configured: Optional[str]) -> Optional[str]:
+        return configured if self.pin_language else None
+
+    def openai_kwargs(self, language: Optional[str]) -> Dict[str, Any]:
+        """Keyword arguments for `whisper.Whisper.transcribe()`."""
+        return dict(
+            language=self.language(language),
+            beam_size=self.beam_size if self.beam_size > 1 else None,
+            best_of=self.best_of,
+            temperature=self.temperatures,
+            without_timestamps=self.without_timestamps,
+            condition_on_previous_text=self.condition_on_previous_text,
+            no_speech_threshold=self.no_speech_threshold,
+            compression_ratio_threshold=self.compression_ratio_threshold,
+        )
+
+    def faster_whisper_kwargs(self, language: Optional[str]) -> Dict[str, Any]:
+        """Keyword arguments for `faster_whisper.WhisperModel.transcribe()`."""
+        return dict(
+            language=self.language(language),
+            beam_size=self.beam_size,
+            best_of=self.best_of,
+            temperature=list(self.temperatures),
+            without_timestamps=self.without_timestamps,
+            condition_on_previous_text=self.condition_on_previous_text,
+            no_speech_threshold=self.no_speech_threshold,
+            compression_ratio_threshold=self.compression_ratio_threshold,
+        )
+
+
+DECODING_PROFILES: Dict[str, DecodingProfile] = {
+    # one greedy pass, no fallback: lowest latency for short commands
+    "fast": DecodingProfile(
+        pin_language=True, beam_size=1, best_of=1, temperatures=(0.0,),
+        without_timestamps=True, condition_on_previous_text=False,
+    ),
+    # greedy, with a short fallback schedule for the occasional repetition loop
+    "balanced": DecodingProfile(
+        pin_language=True, beam_size=1, best_of=2, temperatures=(0.0, 0.4, 0.8),
+        without_timestamps=True, condition_on_previous_text=False,
+    ),
+    # Whisper's reference settings (beam search + full fallback), language still pinned
+    "accurate": DecodingProfile(
+        pin_language=True, beam_size=5, best_of=5, temperatures=(0.0, 0.2, 0.4, 0.6, 0.8, 1.0),
+        without_timestamps=False, condition_on_previous_text=True,
+    ),
+}
+
+
+def get_profile(name: str) -> DecodingProfile:
+    try:
+        return DECODING_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"asr.profile '{name}' desconocido; usa uno de {sorted(DECODING_PROFILES)}") from None
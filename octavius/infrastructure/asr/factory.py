@@ -0,0 +1,39 @@
+# octavius/infrastructure/asr/factory.py
+from __future__ import annotations
+
+from octavius.config.settings import AsrSettings
+from octavius.ports.asr import ASRPort
+
+
+def create_transcriber(settings: AsrSettings) -> ASRPort:
+    """In-process ASR adapter selected by `asr.implementation`.
+
+    With `asr.cascade_model_id` set, `cascade_model_id` runs first and `model_id` is only
+    used for segments it is unsure about.
+    Top-level function: it is also what the process worker calls in the child.
+    """
+    if settings.cascade_model_id and settings.cascade_model_id != settings.model_id:
+        from octavius.infrastructure.asr.cascade import CascadeThresholds, CascadingTranscriber
+        fast = settings.model_copy(update={"model_id": settings.cascade_model_id, "model_path": None})
+        return CascadingTranscriber(
+            _create_single(fast),
+            _create_single(settings),
+            CascadeThresholds(
+                min_avg_logprob=settings.cascade_min_logprob,
+                max_no_speech_prob=settings.cascade_max_no_speech,
+                max_compression_ratio=settings.cascade_max_compression,
+            ),
+        )
+    return _create_single(settings)
+
+
+def _create_single(settings: AsrSettings) -> ASRPort:
+    """Imports are local so only the chosen backend (CTranslate2 or PyTorch) gets loaded."""
+    impl = settings.implementation
+    if impl == "faster-whisper":
+        from octavius.infrastructure.asr.faster_whisper import FasterWhisperTranscriber
+        return FasterWhisperTranscriber(settings)
+    if impl == "openai":
+        from octavius.infrastructure.asr.whisper import WhisperTranscriber
+        return WhisperTranscriber(settings)
+    raise ValueError(f"asr.implementation '{impl}' no está soportado todavía")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import logging
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+from octavius.config.settings import AsrSettings
+from octavius.domain.models.asr_stats import AsrStats
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.ports.asr import ASRPort
+from octavius.infrastructure.asr.warmup import BackgroundModelMixin, warmup_segment
+from octavius.infrastructure.asr.model_registry import ModelKey
+from octavius.infrastructure.asr.decoding import get_profile
+from octavius.utils.audio_utils import ensure_float32_mono_16k_from_pcm16
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+logger = logging.getLogger(__name__)
+
+_MISSING = "faster-whisper not available. pip install faster-whisper"
+
+
+class FasterWhisperTranscriber(BackgroundModelMixin, ASRPort):
+    """Whisper on CTranslate2 (faster-whisper).
+
+    Honors `model_id` (or `model_path` for a locally converted CT2 model), `device`,
+    `compute_type`, `language` and the decoding `profile`. int8 weights on CPU are the main latency win on
+    boards without GPU. faster-whisper and CTranslate2 are only imported by `open()`, so
+    they stay optional for the other backends.
+    """
+
+    _label = "faster-whisper"
+
+    def __init__(self, settings: AsrSettings) -> None:
+        self.a = settings
+        self.profile = get_profile(settings.profile)
+        self.model: Optional[WhisperModel] = None
+        self.ready = None
+        self._key = None
+
+    def transcribe(self, segment: RecordingSegment) -> Utterance:
+        return self._decode(self._wait_model(), segment)
+
+    def _decode(self, model: WhisperModel, segment: RecordingSegment) -> Utterance:
+        audio_f32 = ensure_float32_mono_16k_from_pcm16(
+            segment.pcm,
+            sample_rate=segment.sample_rate,
+            channels=segment.channels,
+        )
+        segments, info = model.transcribe(
+            audio_f32,
+            task=self.a.task,
+            vad_filter=False,                   # the pipeline's VAD already trimmed silence
+            **self.profile.faster_whisper_kwargs(self.a.language),
+        )
+        segments = list(segments)   # generator: decoding happens here
+        text = "".join(s.text for s in segments).strip()
+        stats = AsrStats.combine(
+            (s.end - s.start, AsrStats(s.avg_logprob, s.no_speech_prob, s.compression_ratio)) for s in segments
+        )
+        return Utterance(raw_text=text, lang=info.language, asr_stats=stats,
+                         asr_confidence=stats.confidence if stats else None)
+
+    # -------- BackgroundModelMixin hooks --------
+
+    def _model_key(self) -> ModelKey:
+        device, compute_type = self._resolve_device(self.a.device, self.a.compute_type)
+        return ModelKey("faster-whisper", self.a.model_path or self.a.model_id, device, compute_type)
+
+    def _load_model_for(self, key: ModelKey) -> WhisperModel:
+        return _load_model(key.model_id, key.device, key.compute_type)
+
+    def _warm(self, model: WhisperModel) -> None:
+        # faster-whisper pads every input to the 30 s window, so a short clip runs the same
+        # encoder/decoder shapes as a real turn
+        self._decode(model, warmup_segment())
+
+    def _resolve_device(self, device_str: Optional[str], compute_type: str) -> Tuple[str, str]:
+        """
+        'auto' → 'cuda' si CTranslate2 ve una GPU, si no 'cpu'.
+        float16 no tiene kernels eficientes en CPU: se cambia a float32.
+        """
+        has_cuda = _ctranslate2().get_cuda_device_count() > 0
+        dev = (device_str or "auto").strip().lower()
+        if dev == "auto":
+            dev = "cuda" if has_cuda else "cpu"
+        elif dev == "cuda" and not has_cuda:
+            logger.warning("Se solicitó device='cuda' pero no hay GPU disponible. Usando 'cpu'.")
+            dev = "cpu"
+        if dev == "cpu" and compute_type == "float16":
+            logger.warning("compute_type='float16' no está soportado en CPU. Usando 'float32'.")
+            compute_type = "float32"
+        return dev, compute_type
+
+
+def _ctranslate2() -> Any:
+    try:
+        import ctranslate2
+    except ImportError as e:
+        raise RuntimeError(_MISSING) from e
+    return ctranslate2
+
+
+def _load_model(model_ref: str, device: str, compute_type: str) -> WhisperModel:
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as e:
+        raise RuntimeError(_MISSING) from e
+    logger.info("Cargando faster-whisper '%s' en device='%s' compute_type='%s'…", model_ref, device, compute_type)
+    return WhisperModel(model_ref, device=device, compute_type=compute_type)
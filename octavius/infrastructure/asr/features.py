@@ -0,0 +1,154 @@
+# octavius/infrastructure/asr/features.py
+"""Whisper log-mel front-end computed incrementally, while a segment is being captured.
+
+Matches `whisper.log_mel_spectrogram`: 25 ms Hann window (n_fft=400), 10 ms hop (160),
+reflect padding at both ends (torch.stft, center=True), last frame dropped, Slaney mel
+filterbank, log10 with a 1e-10 floor, clamp to max - 8 and (x + 4) / 4. Everything but the
+final clamp/scale (which needs the global maximum) is done as audio arrives.
+"""
+from __future__ import annotations
+from typing import List, Optional
+import numpy as np
+
+from octavius.domain.models.mel_features import MelFeatures
+from octavius.ports.features import FeatureStream
+
+N_FFT = 400
+HOP_LENGTH = 160
+SAMPLE_RATE = 16000
+_HALF = N_FFT // 2
+
+
+def whisper_n_mels(model_id: str) -> int:
+    """Mel bins the checkpoint was trained with (large-v3 uses 128, the rest 80)."""
+    return 128 if model_id.startswith("large-v3") else 80
+
+
+def _hz_to_mel(f: np.ndarray) -> np.ndarray:
+    f_sp = 200.0 / 3
+    min_log_hz = 1000.0
+    logstep = np.log(6.4) / 27.0
+    mels = f / f_sp
+    log_t = f >= min_log_hz
+    mels[log_t] = min_log_hz / f_sp + np.log(f[log_t] / min_log_hz) / logstep
+    return mels
+
+
+def _mel_to_hz(m: np.ndarray) -> np.ndarray:
+    f_sp = 200.0 / 3
+    min_log_hz = 1000.0
+    min_log_mel = min_log_hz / f_sp
+    logstep = np.log(6.4) / 27.0
+    freqs = f_sp * m
+    log_t = m >= min_log_mel
+    freqs[log_t] = min_log_hz * np.exp(logstep * (m[log_t] - min_log_mel))
+    return freqs
+
+
+def mel_filters(n_mels: int, sample_rate: int = SAMPLE_RATE, n_fft: int = N_FFT) -> np.ndarray:
+    """Slaney-style mel filterbank (n_mels, n_fft // 2 + 1), as `librosa.filters.mel`."""
+    fftfreqs = np.fft.rfftfreq(n_fft, d=1.0 / sample_rate)
+    edges = np.array([0.0, sample_rate / 2.0])
+    mel_f = _mel_to_hz(np.linspace(*_hz_to_mel(edges), n_mels + 2))
+    fdiff = np.diff(mel_f)
+    ramps = np.subtract.outer(mel_f, fftfreqs)
+    lower = -ramps[:-2] / fdiff[:-1, None]
+    upper = ramps[2:] / fdiff[1:, None]
+    weights = np.maximum(0.0, np.minimum(lower, upper))
+    weights *= (2.0 / (mel_f[2:] - mel_f[:-2]))[:, None]
+    return weights.astype(np.float32)
+
+
+class StreamingLogMel(FeatureStream):
+    """Log-mel frames computed as PCM16 samples are pushed.
+
+    A frame is computed as soon as its 400-sample window is complete; only the last
+    window's worth of samples is kept between pushes. `finish()` appends `pad_ms` of
+    silence (Whisper's short-utterance decode pads 0.5 s), reflects the end, and applies
+    the global normalization.
+    """
+
+    def __init__(self, n_mels: int = 80, *, pad_ms: int = 500) -> None:
+        self._filters = mel_filters(n_mels)
+        self._window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N_FFT) / N_FFT)).astype(np.float32)
+        self._pad_samples = int(pad_ms) * SAMPLE_RATE // 1000
+        self.reset()
+
+    def reset(self) -> None:
+        self._buf = np.zeros(0, dtype=np.float32)   # padded-signal samples from frame `_next` on
+        self._started = False                       # leading reflection applied
+        self._n = 0                                 # real samples pushed (pad excluded)
+        self._next = 0                              # next frame index
+        self._frames: List[np.ndarray] = []         # mel power, (n_mels, k) blocks
+
+    def push(self, samples: np.ndarray) -> None:
+        x = np.asarray(samples, dtype=np.float32) / 32768.0
+        self._n += len(x)
+        self._append(x)
+
+    def finish(self) -> Optional[MelFeatures]:
+        n = self._n
+        if n == 0:
+            return None
+        self._append(np.zeros(self._pad_samples, dtype=np.float32))
+        total = n + self._pad_samples
+        if not self._started:   # shorter than the reflection: pad both ends in one go
+            self._buf = np.pad(self._buf, _HALF, mode="reflect")
+        else:
+            self._buf = np.concatenate([self._buf, self._buf[-(_HALF + 1):-1][::-1]])
+        self._compute(total // HOP_LENGTH)
+
+        mel = np.concatenate(self._frames, axis=1) if self._frames else np.zeros((len(self._filters), 0), np.float32)
+        log_spec = np.log10(np.maximum(mel, 1e-10))
+        top = float(log_spec.max()) if log_spec.size else -10.0
+        log_spec = (np.maximum(log_spec, top - 8.0) + 4.0) / 4.0
+        feats = MelFeatures(
+            data=log_spec.astype(np.float32),
+            n_samples=n,
+            pad_samples=self._pad_samples,
+            pad_value=(max(-10.0, top - 8.0) + 4.0) / 4.0,
+        )
+        self.reset()
+        return feats
+
+    # -------- internals --------
+
+    def _append(self, x: np.ndarray) -> None:
+        if not self._started:
+            self._buf = np.concatenate([self._buf, x])
+            if len(self._buf) <= _HALF:
+                return
+            self._buf = np.concatenate([self._buf[_HALF:0:-1], self._buf])
+            self._started = True
+        else:
+            self._buf = np.concatenate([self._buf, x])
+        self._compute(None)
+
+    def _compute(self, limit: Optional[int]) -> None:
+        """Frames whose window is complete in `_buf` (up to frame index `limit`)."""
+        k = 0 if len(self._buf) < N_FFT else (len(self._buf) - N_FFT) // HOP_LENGTH + 1
+        if limit is not None:
+            k = min(k, limit - self._next)
+        if k <= 0:
+            return
+        windows = np.lib.stride_tricks.sliding_window_view(self._buf, N_FFT)[:k * HOP_LENGTH:HOP_LENGTH]
+        spec = np.fft.rfft(windows * self._window, axis=1)
+        power = (spec.real ** 2 + spec.imag ** 2).astype(np.float32)
+        self._frames.append(self._filters @ power.T)
+        self._next += k
+        self._buf = self._buf[k * HOP_LENGTH:].copy()
+
+
+def log_mel(audio: np.ndarray, n_mels: int = 80, pad_samples: int = 0) -> np.ndarray:
+    """Whole-signal reference (float32 audio in [-1, 1]); same output as the streaming path."""
+    x = np.concatenate([np.asarray(audio, dtype=np.float32), np.zeros(pad_samples, dtype=np.float32)])
+    padded = np.pad(x, _HALF, mode="reflect")
+    n_frames = len(x) // HOP_LENGTH
+    windows = np.lib.stride_tricks.sliding_window_view(padded, N_FFT)[:n_frames * HOP_LENGTH:HOP_LENGTH]
+    window = (0.5 - 0.5 * np.cos(2 * np.pi * np.arange(N_FFT) / N_FFT)).astype(np.float32)
+    spec = np.fft.rfft(windows * window, axis=1)
+    mel = mel_filters(n_mels) @ (np.abs(spec) ** 2).astype(np.float32).T
+    log_spec = np.log10(np.maximum(mel, 1e-10))
+    if log_spec.size:
+        log_spec = np.maximum(log_spec, log_spec.max() - 8.0)
+    return ((log_spec + 4.0) / 4.0).astype(np.float32)
@@ -0,0 +1,175 @@
+# octavius/infrastructure/asr/model_registry.py
+from __future__ import annotations
+from dataclasses import dataclass
+import gc
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    implementation: str
+    model_id: str
+    device: str
+    compute_type: str
+
+
+@dataclass(frozen=True)
+class ModelInfo:
+    key: ModelKey
+    refs: int
+    rss_mb: float       # resident memory growth measured while loading
+    last_used: float    # time.monotonic() of the last acquire/release
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux /proc), None where unavailable."""
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _Entry:
+    __slots__ = ("model", "refs", "rss_bytes", "last_used")
+
+    def __init__(self, model: Any, rss_bytes: int) -> None:
+        self.model = model
+        self.refs = 0
+        self.rss_bytes = rss_bytes
+        self.last_used = time.monotonic()
+
+
+class ModelRegistry:
+    """Process-wide cache of loaded ASR models, shared between adapters.
+
+    - Models are keyed by (implementation, model_id, device, compute_type); adapters with
+      the same key share one set of weights.
+    - `acquire()` / `release()` reference-count them. A released model stays cached until
+      memory is needed: when the sum of model RSS exceeds `max_mb`, unreferenced models
+      are evicted least-recently-used first. Models in use are never evicted.
+    - Per-model RSS is the growth of the process RSS while it loaded (loads are
+      serialized so they do not overlap). `rss_fn` returning None disables accounting.
+    """
+
+    def __init__(self, max_mb: float = 0, rss_fn: Callable[[], Optional[int]] = current_rss_bytes) -> None:
+        self._max_bytes = int(max_mb * _MB)
+        self._rss_fn = rss_fn
+        self._entries: Dict[ModelKey, _Entry] = {}
+        self._lock = threading.Lock()        # guards _entries
+        self._load_lock = threading.Lock()   # one load at a time (clean RSS deltas, no double loads)
+
+    def set_limit(self, max_mb: float) -> None:
+        """Memory ceiling for cached models in MB (0 = unlimited)."""
+        with self._lock:
+            self._max_bytes = int(max_mb * _MB)
+            self._evict_unused()
+
+    def acquire(self, key: ModelKey, loader: Callable[[], Any]) -> Any:
+        """Return the model for `key`, loading it with `loader()` if needed (+1 reference)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return self._take(entry)
+        with self._load_lock:
+            with self._lock:
+                entry = self._entries.get(key)   # loaded by someone else meanwhile
+                if entry is not None:
+                    return self._take(entry)
+                self._evict_unused()
+            before = self._rss_fn()
+            model = loader()
+            after = self._rss_fn()
+            rss = max(0, after - before) if before is not None and after is not None else 0
+            with self._lock:
+                entry = _Entry(model, rss)
+                self._entries[key] = entry
+                model = self._take(entry)
+                self._evict_unused()
+                total = self._total_bytes()
+        logger.info("ASR model %s/%s (%s, %s) loaded: +%.0f MB RSS, cache total %.0f MB",
+                    key.implementation, key.model_id, key.device, key.compute_type, rss / _MB, total / _MB)
+        return model
+
+    def release(self, key: ModelKey) -> None:
+        """Drop one reference; the model stays cached while memory allows."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refs == 0:
+                logger.warning("release() of an unreferenced ASR model: %s", key)
+                return
+            entry.refs -= 1
+            entry.last_used = time.monotonic()
+            self._evict_unused()
+
+    def evict(self, key: ModelKey) -> bool:
+        """Drop a cached model now if nobody uses it. Returns True if it was dropped."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refs:
+                return False
+            self._drop(key)
+        gc.collect()
+        return True
+
+    def stats(self) -> List[ModelInfo]:
+        with self._lock:
+            return [ModelInfo(key=k, refs=e.refs, rss_mb=e.rss_bytes / _MB, last_used=e.last_used)
+                    for k, e in self._entries.items()]
+
+    @property
+    def total_mb(self) -> float:
+        with self._lock:
+            return self._total_bytes() / _MB
+
+    # -------- internals (call with _lock held) --------
+
+    def _take(self, entry: _Entry) -> Any:
+        entry.refs += 1
+        entry.last_used = time.monotonic()
+        return entry.model
+
+    def _total_bytes(self) -> int:
+        return sum(e.rss_bytes for e in self._entries.values())
+
+    def _evict_unused(self) -> None:
+        if not self._max_bytes:
+            return
+        idle = sorted((k for k, e in self._entries.items() if e.refs == 0),
+                      key=lambda k: self._entries[k].last_used)
+        dropped = False
+        for key in idle:
+            if self._total_bytes() <= self._max_bytes:
+                break
+            self._drop(key)
+            dropped = True
+        if dropped:
+            gc.collect()
+
+    def _drop(self, key: ModelKey) -> None:
+        entry = self._entries.pop(key)
+        logger.info("ASR model %s/%s evicted (%.0f MB)", key.implementation, key.model_id, entry.rss_bytes / _MB)
+        entry.model = None
+
+
+_registry: Optional[ModelRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry(max_mb: Optional[float] = None) -> ModelRegistry:
+    """The process-wide registry; `max_mb` (if given) updates its memory ceiling."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        if max_mb is not None:
+            _registry.set_limit(max_mb)
+        return _registry
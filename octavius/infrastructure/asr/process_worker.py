@@ -0,0 +1,229 @@
+# octavius/infrastructure/asr/process_worker.py
+from __future__ import annotations
+from concurrent.futures import Future
+import logging
+import multiprocessing as mp
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from octavius.config.settings import AsrSettings
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.ports.asr import ASRPort
+from octavius.infrastructure.asr.factory import create_transcriber
+from octavius.infrastructure.asr.warmup import ReadyMixin, load_in_background
+
+logger = logging.getLogger(__name__)
+
+_MIN_SHM_BYTES = 30 * 16000 * 2      # 30 s of 16 kHz PCM16 mono
+
+
+class ProcessASRTranscriber(ReadyMixin, ASRPort):
+    """ASRPort that hosts the real transcriber in a dedicated worker process.
+
+    - The model is loaded once in the worker (spawned, so no capture/PortAudio state is
+      inherited); its decode loop no longer competes for the GIL with capture and VAD.
+    - Segment PCM is copied into a `SharedMemory` block owned by this side; only a small
+      tuple (block name, size, format) goes over the control Pipe, and the `Utterance`
+      comes back the same way. Audio is never pickled.
+    - A decode that exceeds `timeout_s` (+ the segment duration) or a worker that dies gets
+      the process killed and respawned; that `transcribe()` call raises, the next one works
+      again once the new worker is ready.
+
+    `factory` builds the in-process adapter inside the worker; it must be picklable
+    (a module-level function).
+    """
+
+    def __init__(
+        self,
+        settings: AsrSettings,
+        *,
+        factory: Callable[[AsrSettings], ASRPort] = create_transcriber,
+        timeout_s: Optional[float] = None,
+        load_timeout_s: float = 600.0,
+    ) -> None:
+        self.a = settings
+        self._factory = factory
+        self._timeout = float(timeout_s if timeout_s is not None else settings.timeout_s)
+        self._load_timeout = float(load_timeout_s)
+        self._ctx = mp.get_context("spawn")
+        self._lock = threading.Lock()
+        self._proc = None
+        self._conn: Optional[Connection] = None
+        self._shm: Optional[SharedMemory] = None
+        self._req = 0
+        self.ready: Optional[Future] = None
+        self.respawns = 0
+
+    # -------- lifecycle --------
+
+    def open(self) -> None:
+        """Spawn the worker; the model loads there while this call returns immediately."""
+        with self._lock:
+            if self._proc is None:
+                self._spawn()
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_worker(graceful=True)
+            if self._shm is not None:
+                self._shm.close()
+                self._shm.unlink()
+                self._shm = None
+            self.ready = None
+
+    # -------- ASRPort --------
+
+    def transcribe(self, segment: RecordingSegment) -> Utterance:
+        with self._lock:
+            if self.ready is None:
+                raise RuntimeError("Call open() before transcribe()")
+            if not self.ready.done():
+                logger.info("ASR worker aún cargando; esperando al modelo…")
+            self.ready.result()
+            assert self._conn is not None
+
+            n = len(segment.pcm)
+            shm = self._ensure_shm(n)
+            shm.buf[:n] = segment.pcm
+            self._req += 1
+            self._conn.send((
+                "transcribe", self._req, shm.name, n,
+                segment.sample_rate, segment.channels, segment.frame_ms, segment.start_ms, segment.end_ms,
+                segment.features,   # small (~32 KB per second of audio); pickled with the request
+            ))
+
+            audio_s = n / (2 * segment.channels * segment.sample_rate)
+            budget = self._timeout + audio_s
+            if not self._conn.poll(budget):
+                self._restart(f"decode timed out after {budget:.1f}s")
+                raise TimeoutError(f"ASR worker timed out after {budget:.1f}s")
+            try:
+                kind, req_id, payload = self._conn.recv()
+            except (EOFError, OSError):
+                code = self._proc.exitcode if self._proc is not None else None
+                self._restart(f"worker died (exit code {code})")
+                raise RuntimeError(f"ASR worker died during decode (exit code {code})")
+
+        if kind == "ok" and req_id == self._req:
+            return payload
+        raise RuntimeError(f"ASR worker error: {payload}")
+
+    # -------- internals --------
+
+    def _spawn(self) -> None:
+        parent, child = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_worker_main, args=(child, self.a, self._factory), name="asr-worker", daemon=True,
+        )
+        proc.start()
+        child.close()
+        self._proc, self._conn = proc, parent
+        self.ready = load_in_background(lambda: self._await_ready(parent, proc), name="asr-worker-load")
+
+    def _await_ready(self, conn: Connection, proc) -> int:
+        deadline = time.monotonic() + self._load_timeout
+        while not conn.poll(0.2):
+            if not proc.is_alive():
+                raise RuntimeError(f"ASR worker exited while loading (exit code {proc.exitcode})")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"ASR worker not ready after {self._load_timeout:.0f}s")
+        kind, pid, payload = conn.recv()
+        if kind != "ready":
+            raise RuntimeError(f"ASR worker failed to load: {payload}")
+        logger.info("ASR worker pid=%d ready", pid)
+        return pid
+
+    def _restart(self, reason: str) -> None:
+        logger.error("ASR worker: %s; respawning", reason)
+        self._stop_worker(graceful=False)
+        self.respawns += 1
+        self._spawn()
+
+    def _stop_worker(self, *, graceful: bool) -> None:
+        proc, conn = self._proc, self._conn
+        self._proc = self._conn = None
+        if proc is None:
+            return
+        if graceful and proc.is_alive() and conn is not None:
+            try:
+                conn.send(("close", 0, None))
+            except (OSError, ValueError):
+                pass
+            proc.join(2.0)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join(2.0)
+        if proc.is_alive():  # pragma: no cover - ignored SIGTERM
+            proc.kill()
+            proc.join()
+        if conn is not None:
+            conn.close()
+
+    def _ensure_shm(self, nbytes: int) -> SharedMemory:
+        if self._shm is not None and self._shm.size >= nbytes:
+            return self._shm
+        size = max(_MIN_SHM_BYTES, 1 << max(0, nbytes - 1).bit_length())
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+        self._shm = SharedMemory(create=True, size=size)
+        return self._shm
+
+
+def _worker_main(conn: Connection, settings: AsrSettings, factory: Callable[[AsrSettings], ASRPort]) -> None:
+    """Worker process: load the model once, then serve transcribe requests until closed."""
+    try:
+        asr = factory(settings)
+        if hasattr(asr, "open"):
+            asr.open()
+        ready = getattr(asr, "ready", None)
+        if ready is not None:
+            ready.result()
+    except Exception as e:
+        conn.send(("error", 0, f"{type(e).__name__}: {e}"))
+        return
+    conn.send(("ready", os.getpid(), None))
+
+    blocks: Dict[str, SharedMemory] = {}
+    try:
+        while True:
+            try:
+                msg = conn.recv()
+            except EOFError:   # parent went away
+                break
+            if msg[0] == "close":
+                break
+            _, req_id, name, nbytes, rate, channels, frame_ms, start_ms, end_ms, features = msg
+            shm = blocks.get(name)
+            if shm is None:
+                for old in blocks.values():
+                    old.close()
+                blocks = {name: SharedMemory(name=name)}
+                shm = blocks[name]
+            view = shm.buf[:nbytes]   # zero-copy: the adapter reads the parent's block directly
+            try:
+                segment = RecordingSegment(pcm=view, sample_rate=rate, channels=channels,
+                                           frame_ms=frame_ms, start_ms=start_ms, end_ms=end_ms,
+                                           features=features)
+                result = ("ok", req_id, asr.transcribe(segment))
+            except Exception as e:
+                result = ("error", req_id, f"{type(e).__name__}: {e}")
+            segment = None
+            try:
+                view.release()
+            except BufferError:   # the adapter kept an array over the block; dropped with `blocks`
+                pass
+            conn.send(result)
+    finally:
+        for shm in blocks.values():
+            try:
+                shm.close()
+            except BufferError:
+                pass
+        if hasattr(asr, "close"):
+            asr.close()
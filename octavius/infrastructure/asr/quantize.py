@@ -0,0 +1,140 @@
+# octavius/infrastructure/asr/quantize.py
+"""Dynamic int8 quantization of the PyTorch Whisper model for CPU inference.
+
+Whisper's compute is dominated by `Linear` layers (attention projections and MLPs in every
+encoder/decoder block). `torch.ao.quantization.quantize_dynamic` stores their weights as
+int8 and quantizes activations on the fly, which runs on the fbgemm/x86 (PC) or qnnpack
+(ARM, Raspberry Pi) int8 kernels. Convolutions, layer norms and the token embedding stay in
+float32.
+
+Quantizing costs seconds to minutes on small boards, so the quantized module is saved to
+`cache_dir` once and loaded directly afterwards (the float model is not even loaded then).
+When the cache is built, a reference clip is decoded with both models and the speedup and
+weight-size savings are logged and stored next to it.
+"""
+from __future__ import annotations
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import platform
+import time
+from typing import Any, Callable, Dict, Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+INT8_COMPUTE_TYPES = ("int8", "int8_float32")
+_MB = 1024 * 1024
+
+
+def wants_int8(device: str, compute_type: str) -> bool:
+    """Dynamic int8 only exists for CPU; GPU and float compute types keep the float model."""
+    return device == "cpu" and compute_type in INT8_COMPUTE_TYPES
+
+
+def default_cache_dir() -> Path:
+    return Path(os.getenv("XDG_CACHE_HOME", "~/.cache")).expanduser() / "octavius" / "asr"
+
+
+def _select_engine() -> str:
+    engines = torch.backends.quantized.supported_engines
+    arm = platform.machine().lower() in ("aarch64", "arm64", "armv7l")
+    for name in (("qnnpack",) if arm else ("x86", "fbgemm")) + ("fbgemm", "qnnpack", "x86"):
+        if name in engines:
+            torch.backends.quantized.engine = name
+            return name
+    raise RuntimeError(f"no int8 quantization engine available (supported: {engines})")
+
+
+def quantize_linear_int8(model: torch.nn.Module) -> torch.nn.Module:
+    """Replace every Linear layer of `model` with a dynamically quantized int8 one (in place).
+
+    Subclasses of `nn.Linear` (Whisper's casts its weight to the input dtype, which is a
+    no-op in float32) are turned into plain `nn.Linear` first: `quantize_dynamic` matches
+    module types exactly.
+    """
+    _select_engine()
+    for m in model.modules():
+        if isinstance(m, torch.nn.Linear) and type(m) is not torch.nn.Linear:
+            m.__class__ = torch.nn.Linear
+    return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+
+def weights_mb(model: torch.nn.Module) -> float:
+    """Serialized size of the model's state (int8 packed weights included)."""
+    buf = io.BytesIO()
+    torch.save(model.state_dict(), buf)
+    return buf.tell() / _MB
+
+
+def load_quantized(
+    name: str,
+    load_float: Callable[[], torch.nn.Module],
+    *,
+    cache_dir: Optional[Path] = None,
+    reference: Optional[Callable[[torch.nn.Module], Any]] = None,
+) -> torch.nn.Module:
+    """int8 model for `name`: from the disk cache, or quantized from `load_float()` and cached.
+
+    `reference(model)` (optional) decodes a fixed clip; it is timed on the float and the
+    int8 model when the cache is built.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    engine = _select_engine()
+    path = cache_dir / f"{name}-int8-{engine}-torch{torch.__version__.split('+')[0]}.pt"
+    if path.exists():
+        try:
+            model = torch.load(path, map_location="cpu", weights_only=False)
+            report = _read_report(path)
+            logger.info("Modelo int8 cargado de caché %s%s", path, f" ({_fmt(report)})" if report else "")
+            return model
+        except Exception:
+            logger.warning("Caché int8 ilegible (%s); se vuelve a cuantizar", path, exc_info=True)
+
+    model = load_float().eval()
+    report: Dict[str, float] = {"float_mb": weights_mb(model)}
+    if reference is not None:
+        report["float_ms"] = _time_ms(reference, model)
+    t0 = time.perf_counter()
+    quantize_linear_int8(model)
+    report["quantize_s"] = time.perf_counter() - t0
+    report["int8_mb"] = weights_mb(model)
+    if reference is not None:
+        report["int8_ms"] = _time_ms(reference, model)
+        report["speedup"] = report["float_ms"] / max(report["int8_ms"], 1e-6)
+    logger.info("Whisper '%s' cuantizado a int8: %s", name, _fmt(report))
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        torch.save(model, tmp)
+        os.replace(tmp, path)
+        path.with_suffix(".json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    except OSError:
+        logger.warning("No se pudo guardar la caché int8 en %s", path, exc_info=True)
+    return model
+
+
+def _time_ms(reference: Callable[[torch.nn.Module], Any], model: torch.nn.Module) -> float:
+    with torch.inference_mode():
+        reference(model)                 # first run pays allocations / kernel selection
+        t0 = time.perf_counter()
+        reference(model)
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _read_report(path: Path) -> Optional[Dict[str, float]]:
+    try:
+        return json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _fmt(r: Dict[str, float]) -> str:
+    parts = [f"pesos {r['float_mb']:.0f} → {r['int8_mb']:.0f} MB (-{r['float_mb'] - r['int8_mb']:.0f} MB)"]
+    if "speedup" in r:
+        parts.append(f"clip de referencia {r['float_ms']:.0f} → {r['int8_ms']:.0f} ms (x{r['speedup']:.2f})")
+    return ", ".join(parts)
@@ -0,0 +1,128 @@
+# octavius/infrastructure/asr/warmup.py
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+import numpy as np
+
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.infrastructure.asr.model_registry import ModelKey, get_registry
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def load_in_background(load: Callable[[], T], *, name: str = "asr-load") -> "Future[T]":
+    """Run `load` on a daemon thread; the returned Future carries its result or exception.
+
+    A plain thread (not an executor) so an unfinished load never blocks interpreter exit.
+    """
+    fut: "Future[T]" = Future()
+    fut.set_running_or_notify_cancel()
+
+    def _run() -> None:
+        t0 = time.perf_counter()
+        try:
+            result = load()
+        except BaseException as e:
+            logger.exception("%s failed after %.1fs", name, time.perf_counter() - t0)
+            fut.set_exception(e)
+        else:
+            logger.info("%s ready in %.1fs", name, time.perf_counter() - t0)
+            fut.set_result(result)
+
+    threading.Thread(target=_run, name=name, daemon=True).start()
+    return fut
+
+
+def warmup_segment(seconds: float = 1.0, sample_rate: int = 16000) -> RecordingSegment:
+    """Short synthetic segment (voiced-like tone over low noise) to exercise the decode path."""
+    n = int(seconds * sample_rate)
+    t = np.arange(n) / sample_rate
+    rng = np.random.default_rng(0)
+    x = 2000 * np.sin(2 * np.pi * 150 * t) * np.hanning(n) + rng.standard_normal(n) * 100
+    pcm = np.clip(np.round(x), -32768, 32767).astype(np.int16).tobytes()
+    return RecordingSegment(pcm=pcm, sample_rate=sample_rate, channels=1, frame_ms=30,
+                            start_ms=0, end_ms=n * 1000 // sample_rate)
+
+
+class ReadyMixin:
+    """`is_ready` for adapters whose `ready` Future resolves when they can transcribe."""
+
+    ready: Optional[Future] = None
+
+    @property
+    def is_ready(self) -> bool:
+        """True once loading (and warm-up) finished without error."""
+        return self.ready is not None and self.ready.done() and self.ready.exception() is None
+
+
+class BackgroundModelMixin(ReadyMixin, ABC):
+    """Background load / warm-up lifecycle of the in-process Whisper adapters.
+
+    `open()` returns immediately; the model is acquired from the shared registry and, with
+    `warmup` enabled, warmed on a daemon thread, and `ready` resolves with it. `transcribe()`
+    implementations call `_wait_model()`, which only blocks when a turn arrives first.
+
+    Adapters set `a` (their AsrSettings) and `_label`, and provide `_model_key()`,
+    `_load_model_for(key)` (called by the registry on a miss) and `_warm(model)`, which should
+    run the decode path real turns take.
+    """
+
+    _label = "asr"
+    model: Any = None
+    _key: Optional[ModelKey] = None
+
+    def open(self) -> None:
+        """Start loading (and warming up) the model in the background; returns immediately."""
+        key = self._key = self._model_key()
+        self.ready = load_in_background(lambda: self._load_and_warm(key), name=f"{self._label}-load")
+
+    def close(self) -> None:
+        """Drop this adapter's reference to the shared model (once its load finishes)."""
+        ready, key = self.ready, self._key
+        self.model = None
+        self.ready = None
+        if ready is not None and key is not None:
+            ready.add_done_callback(lambda f: f.exception() is None and get_registry().release(key))
+
+    # -------- hooks --------
+
+    @abstractmethod
+    def _model_key(self) -> ModelKey: ...
+
+    @abstractmethod
+    def _load_model_for(self, key: ModelKey) -> Any: ...
+
+    @abstractmethod
+    def _warm(self, model: Any) -> None: ...
+
+    # -------- internals --------
+
+    def _load_and_warm(self, key: ModelKey) -> Any:
+        registry = get_registry(self.a.model_cache_mb)
+        model = registry.acquire(key, lambda: self._load_model_for(key))
+        if self.a.warmup:
+            # the first decode pays kernel init / allocations: do it now, not in the first turn
+            try:
+                self._warm(model)
+            except Exception:
+                registry.release(key)
+                raise
+        return model
+
+    def _wait_model(self) -> Any:
+        """Loaded model; only blocks when a turn needs ASR before loading finished."""
+        if self.ready is None:
+            raise RuntimeError("Call open() before transcribe()")
+        if not self.ready.done():
+            t0 = time.perf_counter()
+            logger.info("%s aún cargando; esperando al modelo…", self._label)
+            self.ready.result()
+            logger.info("%s listo tras esperar %.1fs", self._label, time.perf_counter() - t0)
+        self.model = self.ready.result()
+        return self.model
@@ -1,4 +1,3 @@
-from functools import lru_cache
 import logging
 import torch
 import whisper
@@ -6,57 +5,125 @@ import soundfile as sf
 import numpy as np
 from typing import Optional
 from octavius.config.settings import AsrSettings
+from octavius.domain.models.asr_stats import AsrStats
+from octavius.domain.models.mel_features import MelFeatures
 from octavius.domain.models.recording_segment import RecordingSegment
 from octavius.domain.models.utterance import Utterance
 from octavius.ports.asr import ASRPort
+from octavius.infrastructure.asr.warmup import BackgroundModelMixin, warmup_segment
+from octavius.infrastructure.asr.model_registry import ModelKey
+from octavius.infrastructure.asr.decoding import get_profile
+from octavius.infrastructure.asr.whisper_decode import decode_short, enable_variable_audio_ctx
+from octavius.infrastructure.asr.quantize import load_quantized, wants_int8
 from octavius.utils.audio_utils import ensure_float32_mono_16k_from_pcm16
 logger = logging.getLogger(__name__)
 
-class WhisperTranscriber(ASRPort):
+class WhisperTranscriber(BackgroundModelMixin, ASRPort):
+    _label = "whisper"
+
     def __init__(self, settings: AsrSettings) -> None:
         self.a = settings
+        self.profile = get_profile(settings.profile)
         self.model = None
         self.language = None
         self.task = None
+        self.ready = None
+        self._key = None
 
     def open(self) -> None:
-        self.model = self._get_model(self.a.model_id, self.a.device)
         self.language = self.a.language
         self.task = self.a.task
-
-    def close(self) -> None:
-        self.model = None
+        super().open()
 
     def transcribe_from_saved_audio(self, wav_path: str) -> Utterance:
+        model = self._wait_model()
         audio = self._ensure_mono_16k_from_path(wav_path)
-        result = self.model.transcribe(
+        result = model.transcribe(
             audio,
-            language=None,
             task=self.task,
-            fp16=self._getfp16()
+            fp16=self._getfp16(model),
+            **self.profile.openai_kwargs(self.a.language),
         )
         text = result["text"].strip()
         return Utterance(raw_text=text, lang=result.get("language"))
     
     def transcribe(self, segment: RecordingSegment) -> Utterance:
+        return self._decode(self._wait_model(), segment)
+
+    def _decode(self, model: whisper.Whisper, segment: RecordingSegment) -> Utterance:
         audio_f32 = ensure_float32_mono_16k_from_pcm16(
             segment.pcm,
             sample_rate=segment.sample_rate,   # VAD te lo da; por robustez revalidamos
             channels=segment.channels,         # debería ser 1; si no, downmix
             # frame_ms=segment.frame_ms,       # opcional si quieres alinear a frames
         )
-        result = self.model.transcribe(
+        if self.a.short_max_s > 0 and len(audio_f32) <= self.a.short_max_s * 16000:
+            utt = self._decode_short(model, audio_f32, segment.features)
+            if utt is not None:
+                return utt
+        result = model.transcribe(
             audio_f32,
-            language=None,
             task=self.task,
-            fp16=self._getfp16()
+            fp16=self._getfp16(model),
+            **self.profile.openai_kwargs(self.a.language),
         )
         text = result["text"].strip()
-        return Utterance(raw_text=text, lang=result["language"])
+        stats = AsrStats.combine(
+            (s["end"] - s["start"], AsrStats(s["avg_logprob"], s["no_speech_prob"], s["compression_ratio"]))
+            for s in result.get("segments", [])
+        )
+        return Utterance(raw_text=text, lang=result["language"], asr_stats=stats,
+                         asr_confidence=stats.confidence if stats else None)
+
+    def _decode_short(
+        self, model: whisper.Whisper, audio_f32: np.ndarray, features: Optional[MelFeatures] = None,
+    ) -> Optional[Utterance]:
+        """Encoder context sized to the utterance; None when the result is not trusted."""
+        temperature = self.profile.temperatures[0]
+        options = whisper.DecodingOptions(
+            task=self.task,
+            language=self.profile.language(self.a.language),
+            temperature=temperature,
+            beam_size=self.profile.beam_size if self.profile.beam_size > 1 and temperature == 0 else None,
+            without_timestamps=True,
+            fp16=self._getfp16(model),
+        )
+        res = decode_short(model, audio_f32, options, features=features)
+        stats = AsrStats(res.avg_logprob, res.no_speech_prob, res.compression_ratio)
+        no_speech = self.profile.no_speech_threshold
+        if no_speech is not None and res.no_speech_prob > no_speech and res.avg_logprob < -1.0:
+            # same silence rule as transcribe()
+            return Utterance(raw_text="", lang=res.language, asr_stats=stats, asr_confidence=stats.confidence)
+        max_cr = self.profile.compression_ratio_threshold
+        if res.avg_logprob < self.a.short_min_logprob or (max_cr is not None and res.compression_ratio > max_cr):
+            logger.debug("Whisper short path poco fiable (logprob=%.2f, cr=%.2f); repitiendo con 30 s",
+                         res.avg_logprob, res.compression_ratio)
+            return None
+        return Utterance(raw_text=res.text.strip(), lang=res.language, asr_stats=stats,
+                         asr_confidence=stats.confidence)
+
+    # -------- BackgroundModelMixin hooks --------
+
+    def _model_key(self) -> ModelKey:
+        dev = self._normalize_device(self.a.device)
+        compute_type = "int8" if wants_int8(dev, self.a.compute_type) else "float32"
+        return ModelKey("openai", self.a.model_id, dev, compute_type)
+
+    def _load_model_for(self, key: ModelKey) -> whisper.Whisper:
+        model = self._load_model(key.model_id, key.device, key.compute_type)
+        enable_variable_audio_ctx(model)
+        return model
 
+    def _warm(self, model: whisper.Whisper) -> None:
+        # With `short_max_s` set, a clip of up to 3 s takes the short path (encoder context
+        # sized to the audio) that turns up to `short_max_s` use; longer turns run the 30 s
+        # window, which stays cold. Without it, the clip warms the 30 s window.
+        short = self.a.short_max_s
+        self._decode(model, warmup_segment(min(3.0, short) if short > 0 else 3.0))
 
-    def _getfp16(self):
-        return bool(str(getattr(self.model, "device", "")) == "cuda" or torch.cuda.is_available())
+    def _getfp16(self, model: whisper.Whisper) -> bool:
+        # only where the model actually runs on a GPU (a CPU/int8 model on a GPU host stays fp32)
+        return str(getattr(model, "device", "")).startswith("cuda")
     def _normalize_device(self, device_str: Optional[str]) -> str:
         """
         Convierte 'auto' → 'cuda' si hay GPU, si no 'cpu'.
@@ -74,11 +141,18 @@ class WhisperTranscriber(ASRPort):
         logger.warning("Device '%s' no reconocido. Usando 'cpu'.", device_str)
         return "cpu"
 
-    @lru_cache(maxsize=1)
-    def _get_model(self,model_id: str, device: str) -> whisper.Whisper:
-        dev = self._normalize_device(device)
-        logger.info("Cargando Whisper '%s' en device='%s'…", model_id, dev)
-        return whisper.load_model(model_id,dev)
+    def _load_model(self, model_id: str, device: str, compute_type: str = "float32") -> whisper.Whisper:
+        if compute_type == "int8":
+            logger.info("Cargando Whisper '%s' int8 (cuantización dinámica) en CPU…", model_id)
+            reference = ensure_float32_mono_16k_from_pcm16(warmup_segment(5.0).pcm, sample_rate=16000)
+            return load_quantized(
+                f"whisper-{model_id}-{whisper.__version__}",
+                lambda: whisper.load_model(model_id, "cpu"),
+                cache_dir=self.a.cache_dir,
+                reference=lambda m: m.transcribe(reference, fp16=False, **self.profile.openai_kwargs(self.a.language)),
+            )
+        logger.info("Cargando Whisper '%s' en device='%s'…", model_id, device)
+        return whisper.load_model(model_id, device)
 
     def _ensure_mono_16k_from_path(self,path: str) -> np.ndarray:
         """
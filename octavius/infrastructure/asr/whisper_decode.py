@@ -0,0 +1,109 @@
+# octavius/infrastructure/asr/whisper_decode.py
+"""Short-utterance decoding for openai-whisper with a reduced encoder context.
+
+Whisper pads every input to 30 s (3000 mel frames → 1500 encoder positions), so a 1 s
+command costs a full encoder pass. The encoder is a stack of convolutions and
+self-attention over sinusoidal positions, so it runs on fewer frames as long as the
+positional embedding is sliced to the real length; the decoder cross-attends to however
+many audio positions it gets. Accuracy drops somewhat on the shortened context, which is
+why callers check the result and fall back to the regular 30 s path.
+
+When the segment arrives with precomputed `MelFeatures` (see `features.py`) that match the
+model and padding, the STFT is skipped too and only the encoder and decoder run here.
+"""
+from __future__ import annotations
+import types
+from typing import List, Optional
+import numpy as np
+import torch
+import torch.nn.functional as F
+import whisper
+from whisper.audio import HOP_LENGTH, SAMPLE_RATE
+
+from octavius.domain.models.mel_features import MelFeatures
+
+_PATCHED = "_octavius_variable_ctx"
+
+
+def _encoder_forward(self, x: torch.Tensor) -> torch.Tensor:
+    """`AudioEncoder.forward` accepting any context up to n_audio_ctx."""
+    x = F.gelu(self.conv1(x))
+    x = F.gelu(self.conv2(x))
+    x = x.permute(0, 2, 1)
+    n_ctx = x.shape[1]
+    if n_ctx > self.positional_embedding.shape[0]:
+        raise ValueError(f"audio context {n_ctx} exceeds the model's {self.positional_embedding.shape[0]}")
+    x = (x + self.positional_embedding[:n_ctx]).to(x.dtype)
+    for block in self.blocks:
+        x = block(x)
+    return self.ln_post(x)
+
+
+def enable_variable_audio_ctx(model: whisper.Whisper) -> None:
+    """Let `model.encoder` take mel inputs shorter than 30 s (idempotent).
+
+    Full-length inputs give exactly the original result, so a model shared with other
+    adapters is unaffected.
+    """
+    enc = model.encoder
+    if not getattr(enc, _PATCHED, False):
+        enc.forward = types.MethodType(_encoder_forward, enc)
+        setattr(enc, _PATCHED, True)
+
+
+def decode_short(
+    model: whisper.Whisper,
+    audio_f32: np.ndarray,
+    options: whisper.DecodingOptions,
+    pad_s: float = 0.5,
+    features: Optional[MelFeatures] = None,
+) -> whisper.DecodingResult:
+    """Decode one short segment with an encoder context matching its length (+ `pad_s`).
+
+    Requires `enable_variable_audio_ctx(model)`. The mel is computed for the real audio
+    plus a little trailing silence, never for the 30 s window; `features` computed during
+    capture are used instead when they describe exactly that input.
+    """
+    n_mels = model.dims.n_mels
+    max_frames = 2 * model.dims.n_audio_ctx
+    pad = int(pad_s * SAMPLE_RATE)
+    if (features is not None and features.n_mels == n_mels and features.sample_rate == SAMPLE_RATE
+            and features.n_samples == len(audio_f32) and features.pad_samples == pad):
+        mel = torch.from_numpy(features.data)
+    else:
+        mel = whisper.log_mel_spectrogram(torch.from_numpy(audio_f32), n_mels, padding=pad)
+    n_frames = min(mel.shape[-1], max_frames)
+    n_frames -= n_frames % 2           # conv2 has stride 2
+    mel = mel[:, :n_frames].to(model.device)
+    return whisper.decode(model, mel, options)
+
+
+def decode_batch(
+    model: whisper.Whisper,
+    audios: List[np.ndarray],
+    options: whisper.DecodingOptions,
+    pad_s: float = 0.5,
+    full_context: bool = False,
+) -> List[whisper.DecodingResult]:
+    """Decode several segments (each <= 30 s) with one encoder pass.
+
+    Every item is zero-padded to the longest one (+ `pad_s`) before its mel is computed, so
+    the padding is real silence; the encoder context is that common length unless
+    `full_context` (the regular 3000 frames); the shorter context requires
+    `enable_variable_audio_ctx(model)`. Group items of similar
+    length to keep the padding, and the wasted encoder work, small.
+    """
+    n_mels = model.dims.n_mels
+    max_frames = 2 * model.dims.n_audio_ctx
+    if full_context:
+        n_frames = max_frames
+    else:
+        longest = max(len(a) for a in audios) + int(pad_s * SAMPLE_RATE)
+        n_frames = min(max_frames, longest // HOP_LENGTH)
+        n_frames -= n_frames % 2
+    target = n_frames * HOP_LENGTH
+    mels = [
+        whisper.log_mel_spectrogram(torch.from_numpy(a[:target]), n_mels, padding=target - len(a[:target]))[:, :n_frames]
+        for a in audios
+    ]
+    return whisper.decode(model, torch.stack(mels).to(model.device), options)
@@ -0,0 +1,53 @@
+# octavius/infrastructure/audio/capture_counters.py
+from __future__ import annotations
+from octavius.domain.models.capture_stats import CaptureStats
+
+
+class CaptureCounters:
+    """Mutable per-source capture counters.
+
+    Overflow/drop counters may be bumped from the PortAudio callback thread while the
+    read-side counters are bumped by the consumer; each field has a single writer.
+    `snapshot()` only reads; the latency maximum restarts at `reset_latency_max()`.
+    """
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.overflows = 0
+        self.dropped_samples = 0
+        self.chunks = 0
+        self.blocked_s = 0.0
+        self._latency_sum_ms = 0.0
+        self._latency_max_ms = 0.0
+
+    def record_overflow(self, lost_samples: int = 0) -> None:
+        self.overflows += 1
+        self.dropped_samples += max(0, int(lost_samples))
+
+    def record_dropped(self, samples: int) -> None:
+        self.dropped_samples += max(0, int(samples))
+
+    def record_read(self, blocked_s: float, latency_ms: float) -> None:
+        self.chunks += 1
+        self.blocked_s += blocked_s
+        self._latency_sum_ms += latency_ms
+        if latency_ms > self._latency_max_ms:
+            self._latency_max_ms = latency_ms
+
+    def reset_latency_max(self) -> None:
+        self._latency_max_ms = 0.0
+
+    def snapshot(self, buffer_fill: float = 0.0) -> CaptureStats:
+        chunks = self.chunks
+        return CaptureStats(
+            overflows=self.overflows,
+            dropped_samples=self.dropped_samples,
+            chunks=chunks,
+            blocked_ms=self.blocked_s * 1000.0,
+            read_latency_ms_avg=(self._latency_sum_ms / chunks) if chunks else 0.0,
+            read_latency_ms_max=self._latency_max_ms,
+            read_latency_ms_sum=self._latency_sum_ms,
+            buffer_fill=buffer_fill,
+        )
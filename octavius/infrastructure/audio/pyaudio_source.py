@@ -2,20 +2,37 @@
 from __future__ import annotations
 from typing import Iterator, Optional, Union
 import logging
+import time
+import numpy as np
 import pyaudio
 
 from octavius.config.settings import Settings
+from octavius.domain.models.audio_frame import AudioFrame
+from octavius.domain.models.capture_stats import CaptureStats
+from octavius.infrastructure.audio.capture_counters import CaptureCounters
 from octavius.ports.audio_source import AudioSource
 from octavius.utils.devices import resolve_input_device
 from octavius.utils.audio_utils import pick_supported_format, frames_per_buffer
+from octavius.utils.ring_buffer import Int16RingBuffer
 
 logger = logging.getLogger(__name__)
 
 class PyAudioSource(AudioSource):
-    """PyAudio-backed AudioSource that yields PCM16 mono frames.
+    """PyAudio-backed AudioSource that yields stamped device-native PCM16 frames.
 
     It resolves the best input device, picks a supported (rate, channels) pair,
     opens the stream and downmixes to mono if needed.
+
+    Capture modes (``audio.capture_mode``):
+      - "callback": PortAudio pushes audio from its own thread into a preallocated
+        int16 ring buffer; `capture_stream()` reads from the ring, so capture keeps
+        running while the turn thread is busy with VAD/ASR/LLM.
+      - "blocking": `capture_stream()` calls `stream.read()` on the consumer thread.
+        Overflows are not counted here: PyAudio only reports them by discarding the
+        buffer it had filled, so reads keep `exception_on_overflow=False` as before.
+
+    Every chunk is an `AudioFrame` carrying its position on the device sample clock and
+    the monotonic time of its first sample.
     """
 
     def __init__(
@@ -27,12 +44,20 @@ class PyAudioSource(AudioSource):
         self._input_device = settings.audio.input_device
         self._desired_rate = settings.audio.sample_rate
         self._frame_ms = settings.vad.frame_ms
+        self._capture_mode = settings.audio.capture_mode
+        self._ring_ms = settings.audio.ring_buffer_ms
 
         self._stream = None  # type: ignore
         self._device_index: Optional[int] = None
         self._device_rate: Optional[int] = None
         self._device_channels: Optional[int] = None
         self._fpb: Optional[int] = None
+        self._ring: Optional[Int16RingBuffer] = None
+        self._counters = CaptureCounters()
+        # callback mode: (ring frame position, device sample index, monotonic time) of the
+        # newest chunk written by the callback; replaced atomically as one tuple
+        self._anchor: tuple = (0, 0, 0.0)
+        self._cb_samples = 0   # device samples delivered to the callback (per channel)
 
     # --- AudioSource API -----------------------------------------------------
 
@@ -58,6 +83,19 @@ class PyAudioSource(AudioSource):
         )
         fpb = frames_per_buffer(rate, self._frame_ms)
 
+        self._counters.reset()
+        # the callback may fire as soon as the stream opens: publish device facts first
+        self._device_rate = rate
+        self._device_channels = ch
+        self._anchor = (0, 0, time.monotonic())
+        self._cb_samples = 0
+        callback = None
+        if self._capture_mode == "callback":
+            # interleaved samples: frames * channels
+            capacity = max(fpb * ch * 2, frames_per_buffer(rate, self._ring_ms) * ch)
+            self._ring = Int16RingBuffer(capacity)
+            callback = self._on_audio
+
         stream = self._p.open(
             format=fmt,
             channels=ch,
@@ -65,6 +103,7 @@ class PyAudioSource(AudioSource):
             input=True,
             input_device_index=idx,
             frames_per_buffer=fpb,
+            stream_callback=callback,
         )
 
         # Save runtime facts
@@ -73,8 +112,8 @@ class PyAudioSource(AudioSource):
         self._device_channels = ch
         self._fpb = fpb
         self._stream = stream
-        logger.info("PyAudioSource opened: dev=%s rate=%d ch=%d frame_ms=%d fpb=%d",
-                    idx, rate, ch, self._frame_ms, fpb)
+        logger.info("PyAudioSource opened: dev=%s rate=%d ch=%d frame_ms=%d fpb=%d mode=%s",
+                    idx, rate, ch, self._frame_ms, fpb, self._capture_mode)
 
     def close(self) -> None:
         """Close the stream."""
@@ -85,13 +124,110 @@ class PyAudioSource(AudioSource):
                 self._stream.close()
         finally:
             self._stream = None
+            self._ring = None
 
-    def capture_stream(self) -> Iterator[bytes]:
-        """Yield *device-native* PCM16 frames of length ~ frame_ms."""
+    def capture_stream(self) -> Iterator[AudioFrame]:
+        """Yield *device-native* PCM16 frames of length ~ frame_ms, stamped with the sample clock."""
         assert self._stream is not None, "Call open() before capture_stream()"
         assert self._fpb is not None
+        if self._ring is not None:
+            yield from self._capture_from_ring()
+            return
+        yield from self._capture_blocking()
+
+    def stats(self) -> CaptureStats:
+        """Snapshot of overflow/drop/latency counters since open()."""
+        return self._counters.snapshot(buffer_fill=self.buffer_fill)
+
+    def reset_latency_max(self) -> None:
+        """Start a new window for `stats().read_latency_ms_max`."""
+        self._counters.reset_latency_max()
+
+    # --- Blocking mode -------------------------------------------------------
+
+    def _capture_blocking(self) -> Iterator[AudioFrame]:
+        assert self._stream is not None and self._fpb is not None and self._device_rate is not None
+        stream, fpb, rate = self._stream, self._fpb, self._device_rate
+        counters = self._counters
+        sample_index = 0
         while True:
-            yield self._stream.read(self._fpb, exception_on_overflow=False)
+            queued = stream.get_read_available()
+            t0 = time.monotonic()
+            data = stream.read(fpb, exception_on_overflow=False)
+            t1 = time.monotonic()
+            # chunk was already queued → it starts `queued` samples before t0;
+            # otherwise read() returned right after its last sample arrived
+            captured_at = t0 - queued / rate if queued >= fpb else t1 - fpb / rate
+            counters.record_read(
+                blocked_s=t1 - t0,
+                latency_ms=max(queued, fpb) * 1000.0 / rate,
+            )
+            yield AudioFrame(pcm=data, sample_index=sample_index, captured_at=captured_at)
+            sample_index += fpb
+
+    # --- Callback mode -------------------------------------------------------
+
+    def _on_audio(self, in_data, frame_count, time_info, status_flags):
+        """PortAudio callback (runs on the PortAudio thread): only copies into the ring."""
+        now = time.monotonic()
+        ring = self._ring
+        ch = self._device_channels or 1
+        if status_flags & pyaudio.paInputOverflow:
+            self._counters.record_overflow()
+        if ring is not None and in_data:
+            ring_pos = ring.written // ch
+            dropped = ring.write(np.frombuffer(in_data, dtype=np.int16))
+            if dropped:
+                self._counters.record_dropped(dropped // ch)
+            self._anchor = (ring_pos, self._cb_samples, now - self._input_age_s(time_info, frame_count))
+        self._cb_samples += frame_count
+        return (None, pyaudio.paContinue)
+
+    def _input_age_s(self, time_info, frame_count: int) -> float:
+        """Seconds between the ADC capture of the buffer's first sample and now."""
+        try:
+            age = float(time_info["current_time"]) - float(time_info["input_buffer_adc_time"])
+            if 0.0 <= age < 1.0:
+                return age
+        except (KeyError, TypeError, ValueError):
+            pass
+        # host API without timing info: the buffer just completed
+        return frame_count / float(self._device_rate or 1)
+
+    def _capture_from_ring(self) -> Iterator[AudioFrame]:
+        assert self._ring is not None and self._fpb is not None and self._device_channels is not None
+        assert self._device_rate is not None
+        ring, fpb, ch, rate = self._ring, self._fpb, self._device_channels, self._device_rate
+        counters = self._counters
+        chunk = np.empty(fpb * ch, dtype=np.int16)
+        # generous timeout so a dead device surfaces instead of hanging forever
+        timeout_s = max(1.0, 20 * self._frame_ms / 1000.0)
+        while self._stream is not None:
+            t0 = time.monotonic()
+            pos = ring.read_count // ch
+            if not ring.read_into(chunk, timeout=timeout_s):
+                if self._stream is None or not self._stream.is_active():
+                    raise RuntimeError("Audio stream stopped while waiting for samples")
+                logger.warning("No audio received from device in %.1fs", timeout_s)
+                continue
+            # age of the chunk's first sample = what is still queued behind it + its own length
+            counters.record_read(
+                blocked_s=time.monotonic() - t0,
+                latency_ms=(ring.available // ch + fpb) * 1000.0 / rate,
+            )
+            # map the ring position to the device clock through the newest callback anchor
+            # (exact as long as no samples were dropped between the two positions)
+            a_pos, a_index, a_time = self._anchor
+            yield AudioFrame(
+                pcm=chunk.tobytes(),
+                sample_index=a_index + (pos - a_pos),
+                captured_at=a_time + (pos - a_pos) / rate,
+            )
+
+    @property
+    def buffer_fill(self) -> float:
+        """Ring buffer occupancy in [0, 1] (always 0.0 in blocking mode)."""
+        return self._ring.fill_ratio if self._ring is not None else 0.0
 
     # --- Metadata ------------------------------------------------------------
 
@@ -8,10 +8,11 @@ from google.genai import types
 
 from octavius.config.settings import LLMSettings
 from octavius.ports.llm import LLMClient
-from octavius.domain.models.llm_objects import LLMChunk, LLMResponse
+from octavius.domain.models.llm_objects import FALLBACK_TEXT, GenerationOptions, LLMChunk, LLMResponse
 
 logger = logging.getLogger(__name__)
 
+
 class GeminiClient(LLMClient):
     """Gemini adapter that preserves legacy behavior (system_prompt, temperature, max_tokens,
     thinking_config and Google Search grounding), while conforming to LLMClient port."""
@@ -69,9 +70,11 @@ class GeminiClient(LLMClient):
 
     # ------------- non-streaming -------------
 
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse:
+    def generate(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> LLMResponse:
         self._ensure_ready()
-        cfg = self._build_config(system_prompt)
+        cfg = self._build_config(system_prompt, options)
         try:
             resp = self._client.models.generate_content(  # type: ignore[attr-defined]
                 model=self._default_model,
@@ -87,42 +90,62 @@ class GeminiClient(LLMClient):
             return LLMResponse(text=text or "", usage_tokens=used, finish_reason=finish_name)
         except Exception as e:
             logger.warning("Fallo en GeminiClient.generate: %s", e)
-            return LLMResponse(text="Estoy teniendo un problema para responder ahora mismo; probemos de nuevo en un momento.")
+            return LLMResponse(text=FALLBACK_TEXT)
 
     # ------------- streaming -------------
 
-    def stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[LLMChunk]:
+    def stream(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> Iterator[LLMChunk]:
+        """Yield text deltas as the SDK receives them (`generate_content_stream`).
+
+        Deltas are not stripped: the spaces between them are part of the text. A final empty
+        chunk with `is_final=True` always closes the stream.
+        """
         self._ensure_ready()
-        cfg = self._build_config(system_prompt)
+        cfg = self._build_config(system_prompt, options)
         idx = 0
+        last = None
         try:
-            stream = self._client.models.generate_content(  # type: ignore[attr-defined]
+            stream = self._client.models.generate_content_stream(  # type: ignore[attr-defined]
                 model=self._default_model,
                 contents=(prompt or "").strip(),
                 config=cfg,
-                stream=True,
             )
             for ev in stream:
-                piece = self._safe_text(ev)
+                last = ev
+                piece = self._safe_text(ev, strip=False)
                 if not piece:
                     continue
                 yield LLMChunk(delta=piece, index=idx, is_final=False)
                 idx += 1
+            if last is not None:
+                self._log_provider_meta(last)   # finish_reason / usage come with the last event
         except Exception as e:
             logger.warning("Fallo en GeminiClient.stream: %s", e)
+            if idx == 0:
+                yield LLMChunk(delta=FALLBACK_TEXT, index=idx, is_final=False)
+                idx += 1
         # Signal completion
         yield LLMChunk(delta="", index=idx, is_final=True)
 
     # ------------- helpers -------------
 
-    def _build_config(self, system_prompt: Optional[str]):
+    def _build_config(self, system_prompt: Optional[str], options: Optional[GenerationOptions] = None):
         """Build GenerateContentConfig with system instruction, temperature, max tokens,
-        thinking_config and (optionally) Google Search grounding tool."""
+        thinking_config and (optionally) Google Search grounding tool.
+
+        `options` can switch grounding and thinking off for this request (never on when the
+        settings disable them)."""
         assert self._types is not None
         base_instruction = (system_prompt or self._system_prompt or "").strip()
+        search, budget = self._enable_search, self._thinking_budget
+        if options is not None:
+            search = search and options.grounding
+            budget = budget if options.thinking else 0
 
         tools = None
-        if self._enable_search:
+        if search:
             # Enable Google Search grounding tool (same as legacy)
             tools = [self._types.Tool(google_search=self._types.GoogleSearch())]
 
@@ -130,7 +153,7 @@ class GeminiClient(LLMClient):
             system_instruction=base_instruction if base_instruction else None,
             temperature=self._default_temp,
             max_output_tokens=self._default_max,
-            thinking_config={"thinking_budget": self._thinking_budget},
+            thinking_config={"thinking_budget": budget},
             tools=tools,
         )
         return cfg
@@ -139,14 +162,14 @@ class GeminiClient(LLMClient):
         if self._client is None or self._types is None:
             raise RuntimeError("Call open() before using GeminiClient")
 
-    def _safe_text(self, resp: types.GenerateContentResponse) -> str:
+    def _safe_text(self, resp: types.GenerateContentResponse, strip: bool = True) -> str:
         """Extract text robustly from google.genai responses (final and streaming events)."""
         # Fast path: resp.text property
         try:
             if hasattr(resp, "text"):
                 t = getattr(resp, "text")
                 if isinstance(t, str):
-                    return t.strip()
+                    return t.strip() if strip else t
         except Exception:
             pass
         # Candidates path
@@ -162,6 +185,8 @@ class GeminiClient(LLMClient):
                         if t:
                             parts_text.append(str(t))
             if parts_text:
+                if not strip:
+                    return "".join(parts_text)
                 return "\n".join(p.strip() for p in parts_text if p).strip()
         except Exception:
             pass
@@ -0,0 +1,216 @@
+# octavius/infrastructure/llm/gemini_async.py
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from octavius.config.settings import LLMSettings
+from octavius.ports.llm import AsyncLLMClient
+from octavius.domain.models.llm_objects import FALLBACK_TEXT, GenerationOptions, LLMChunk, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGeminiClient(AsyncLLMClient):
+    """Gemini over its REST API on one pooled `httpx.AsyncClient` for the process lifetime.
+
+    - `open()` creates the client and pre-warms a connection (DNS + TCP + TLS) with a cheap
+      model-metadata GET, so the first turn does not pay the handshake.
+    - Connections are kept alive between turns (`llm.keepalive_s`); with
+      `llm.keepalive_ping_s` > 0 a background task repeats the cheap GET when the client has
+      been idle that long, so the provider does not close the connection between turns.
+    - `agenerate()` / `astream()` send the same request as `GeminiClient` (system prompt,
+      temperature, max tokens, thinking budget, Google Search grounding). Cancelling the
+      awaiting task, or closing the `astream()` iterator, aborts the exchange.
+
+    `model`, `enable_search` and `thinking_budget` override the settings (e.g. a lighter
+    configuration used as a hedge). With `fallback_text=None` failures raise instead of
+    being answered with a canned reply. `transport` is passed to httpx (tests use it;
+    production leaves it None).
+    """
+
+    def __init__(
+        self,
+        settings: LLMSettings,
+        *,
+        api_key: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        model: Optional[str] = None,
+        enable_search: Optional[bool] = None,
+        thinking_budget: Optional[int] = None,
+        fallback_text: Optional[str] = FALLBACK_TEXT,
+    ) -> None:
+        self._s = settings
+        self._api_key = api_key
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+        self._pinger: Optional[asyncio.Task] = None
+        self._last_used = 0.0
+        self._fallback = fallback_text
+        self._model = model or getattr(settings, "model", "gemini-2.5-flash")
+        self._system_prompt = getattr(settings, "system_prompt", None)
+        if thinking_budget is None:
+            thinking_budget = getattr(settings, "thinking_budget", 50)
+        self._thinking_budget = int(thinking_budget)
+        if enable_search is None:
+            enable_search = getattr(settings, "enable_search", True)
+        self._enable_search = bool(enable_search)
+
+    @property
+    def model(self) -> str:
+        return self._model
+
+    # ------------- lifecycle -------------
+
+    async def open(self) -> None:
+        if self._http is not None:
+            return
+        api_key = self._api_key or self._resolve_api_key()
+        self._http = httpx.AsyncClient(
+            base_url=self._s.base_url,
+            headers={"x-goog-api-key": api_key},
+            timeout=httpx.Timeout(self._s.timeout_s, connect=10.0),
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=self._s.keepalive_s),
+            transport=self._transport,
+        )
+        await self._warm()
+        if self._s.keepalive_ping_s > 0:
+            self._pinger = asyncio.create_task(self._ping_loop(), name="gemini-keepalive")
+        logger.info("AsyncGeminiClient open: model=%s base_url=%s", self._model, self._s.base_url)
+
+    async def close(self) -> None:
+        if self._pinger is not None:
+            self._pinger.cancel()
+            try:
+                await self._pinger
+            except asyncio.CancelledError:
+                pass
+            self._pinger = None
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    # ------------- non-streaming -------------
+
+    async def agenerate(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> LLMResponse:
+        http = self._ensure_ready()
+        self._last_used = time.monotonic()
+        try:
+            r = await http.post(f"/v1beta/models/{self._model}:generateContent", json=self._body(prompt, system_prompt, options))
+            r.raise_for_status()
+            data = r.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Fallo en AsyncGeminiClient.agenerate (%s): %s", self._model, e)
+            if self._fallback is None:
+                raise
+            return LLMResponse(text=self._fallback)
+        finally:
+            self._last_used = time.monotonic()
+        usage = data.get("usageMetadata") or {}
+        cand = (data.get("candidates") or [{}])[0]
+        return LLMResponse(
+            text=_text(data).strip(),
+            usage_tokens=usage.get("totalTokenCount"),
+            finish_reason=cand.get("finishReason"),
+        )
+
+    # ------------- streaming -------------
+
+    async def astream(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> AsyncIterator[LLMChunk]:
+        """Server-sent events from `streamGenerateContent?alt=sse`, one chunk per event with text."""
+        http = self._ensure_ready()
+        self._last_used = time.monotonic()
+        idx = 0
+        try:
+            async with http.stream(
+                "POST", f"/v1beta/models/{self._model}:streamGenerateContent",
+                params={"alt": "sse"}, json=self._body(prompt, system_prompt, options),
+            ) as r:
+                r.raise_for_status()
+                async for line in r.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    piece = _text(json.loads(line[5:]))
+                    if piece:
+                        yield LLMChunk(delta=piece, index=idx, is_final=False)
+                        idx += 1
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Fallo en AsyncGeminiClient.astream (%s): %s", self._model, e)
+            if idx == 0:
+                if self._fallback is None:
+                    raise
+                yield LLMChunk(delta=self._fallback, index=idx, is_final=False)
+                idx += 1
+        finally:
+            self._last_used = time.monotonic()
+        yield LLMChunk(delta="", index=idx, is_final=True)
+
+    # ------------- helpers -------------
+
+    def _body(self, prompt: str, system_prompt: Optional[str], options: Optional[GenerationOptions] = None) -> Dict[str, Any]:
+        search, budget = self._enable_search, self._thinking_budget
+        if options is not None:   # per-turn switches can only turn features off
+            search = search and options.grounding
+            budget = budget if options.thinking else 0
+        body: Dict[str, Any] = {
+            "contents": [{"role": "user", "parts": [{"text": (prompt or "").strip()}]}],
+            "generationConfig": {
+                "temperature": self._s.temperature,
+                "maxOutputTokens": self._s.max_tokens,
+                "thinkingConfig": {"thinkingBudget": budget},
+            },
+        }
+        instruction = (system_prompt or self._system_prompt or "").strip()
+        if instruction:
+            body["systemInstruction"] = {"parts": [{"text": instruction}]}
+        if search:
+            body["tools"] = [{"google_search": {}}]
+        return body
+
+    async def _warm(self) -> None:
+        """Open a pooled connection ahead of the first real request (failures are not fatal)."""
+        assert self._http is not None
+        t0 = time.perf_counter()
+        try:
+            r = await self._http.get(f"/v1beta/models/{self._model}")
+            logger.debug("Gemini connection warm in %.0f ms (HTTP %d)", (time.perf_counter() - t0) * 1000, r.status_code)
+        except httpx.HTTPError as e:
+            logger.warning("No se pudo precalentar la conexión con Gemini: %s", e)
+        self._last_used = time.monotonic()
+
+    async def _ping_loop(self) -> None:
+        period = self._s.keepalive_ping_s
+        while True:
+            await asyncio.sleep(max(1.0, period - (time.monotonic() - self._last_used)))
+            if time.monotonic() - self._last_used >= period:
+                await self._warm()
+
+    def _ensure_ready(self) -> httpx.AsyncClient:
+        if self._http is None:
+            raise RuntimeError("Call open() before using AsyncGeminiClient")
+        return self._http
+
+    def _resolve_api_key(self) -> str:
+        env = getattr(self._s, "api_key_env", None)
+        key = (os.getenv(env) if env else None) or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+        if not key:
+            raise RuntimeError("Falta la API key: define GEMINI_API_KEY o GOOGLE_API_KEY (o configura api_key_env).")
+        return key
+
+
+def _text(data: Dict[str, Any]) -> str:
+    """Concatenated text parts of the first candidate (thought parts excluded)."""
+    cands = data.get("candidates") or []
+    if not cands:
+        return ""
+    parts = (cands[0].get("content") or {}).get("parts") or []
+    return "".join(p.get("text", "") for p in parts if not p.get("thought"))
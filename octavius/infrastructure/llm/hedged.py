@@ -0,0 +1,198 @@
+# octavius/infrastructure/llm/hedged.py
+from __future__ import annotations
+import asyncio
+from dataclasses import dataclass
+import logging
+import time
+from typing import AsyncIterator, Awaitable, List, Optional, Tuple
+
+from octavius.ports.llm import AsyncLLMClient
+from octavius.domain.models.llm_objects import FALLBACK_TEXT, GenerationOptions, LLMChunk, LLMResponse
+from octavius.utils.latency import LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    calls: int = 0
+    hedged: int = 0          # second request sent (primary's first token was late)
+    fast_wins: int = 0       # ... and the fast request answered first
+    deadline_misses: int = 0  # no answer by the deadline, or both failed (fallback text used)
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.calls if self.calls else 0.0
+
+    @property
+    def fast_win_rate(self) -> float:
+        return self.fast_wins / self.calls if self.calls else 0.0
+
+
+class HedgedLLMClient(AsyncLLMClient):
+    """Deadline-aware LLM calls: hedge a slow primary with a faster configuration.
+
+    - The primary request starts alone. If its first token has not arrived after
+      `hedge_after_ms`, the same prompt goes to `fast` (e.g. a lighter model without search
+      and thinking) and whichever produces the first token first is used; the other request
+      is cancelled.
+    - If neither has produced a token `deadline_ms` after the start, both are cancelled and a
+      short apology is returned instead of a long silence. A request that fails early, or
+      ends without any text, does not win: the other one is awaited (or started at once, if
+      it was not yet), and the apology is only used when both fail.
+    - Time-to-first-token of the winner is recorded per name (`latency`), and `stats()`
+      counts how often the hedge fired and how often the fast answer was used.
+
+    Both clients should raise on errors (no canned answer of their own), otherwise an error
+    reply would win the race.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncLLMClient,
+        fast: AsyncLLMClient,
+        *,
+        hedge_after_ms: float,
+        deadline_ms: float,
+        names: Tuple[str, str] = ("primary", "fast"),
+        latency: Optional[LatencyRecorder] = None,
+        report_every: int = 20,
+    ) -> None:
+        if hedge_after_ms <= 0 or deadline_ms <= hedge_after_ms:
+            raise ValueError("need 0 < hedge_after_ms < deadline_ms")
+        self._primary = primary
+        self._fast = fast
+        self._hedge_s = hedge_after_ms / 1000.0
+        self._deadline_s = deadline_ms / 1000.0
+        self._names = names
+        self.latency = latency or LatencyRecorder()
+        self._report_every = int(report_every)
+        self._calls = self._hedged = self._fast_wins = self._misses = 0
+
+    # ------------- lifecycle -------------
+
+    async def open(self) -> None:
+        await asyncio.gather(self._primary.open(), self._fast.open())
+
+    async def close(self) -> None:
+        self._report()
+        await asyncio.gather(self._primary.close(), self._fast.close(), return_exceptions=True)
+
+    def stats(self) -> HedgeStats:
+        return HedgeStats(calls=self._calls, hedged=self._hedged, fast_wins=self._fast_wins,
+                          deadline_misses=self._misses)
+
+    # ------------- requests -------------
+
+    async def agenerate(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> LLMResponse:
+        """Whole answers race; the first complete one wins (first token = whole answer here)."""
+        kw = {"options": options} if options is not None else {}
+        starts = [lambda: _with_text(self._primary.agenerate(prompt, system_prompt, **kw)),
+                  lambda: _with_text(self._fast.agenerate(prompt, system_prompt, **kw))]
+        winner, result = await self._race([lambda f=f: asyncio.ensure_future(f()) for f in starts])
+        if winner is None:
+            return LLMResponse(text=FALLBACK_TEXT, finish_reason="DEADLINE")
+        return result
+
+    async def astream(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> AsyncIterator[LLMChunk]:
+        """Race the first chunk with text of both streams, then keep streaming the winner."""
+        kw = {"options": options} if options is not None else {}
+        gens = [self._primary.astream(prompt, system_prompt, **kw), self._fast.astream(prompt, system_prompt, **kw)]
+        try:
+            winner, first = await self._race([lambda g=g: asyncio.ensure_future(_first_text(g)) for g in gens])
+            if winner is None:
+                yield LLMChunk(delta=FALLBACK_TEXT, index=0)
+                yield LLMChunk(delta="", index=1, is_final=True)
+                return
+            yield first
+            if not first.is_final:
+                async for chunk in gens[winner]:
+                    yield chunk
+        finally:
+            for g in gens:
+                try:
+                    await g.aclose()
+                except Exception:
+                    pass
+
+    # ------------- internals -------------
+
+    async def _race(self, starters) -> Tuple[Optional[int], object]:
+        """Run starter[0], hedge with starter[1]; return (index of the winner, its result)."""
+        self._calls += 1
+        t0 = time.monotonic()
+        tasks: List[Optional[asyncio.Future]] = [starters[0](), None]
+        failed = [False, False]
+        try:
+            while True:
+                elapsed = time.monotonic() - t0
+                hedge_due = tasks[1] is None and (elapsed >= self._hedge_s or failed[0])
+                if hedge_due:
+                    tasks[1] = starters[1]()
+                    self._hedged += 1
+                    logger.info("[llm] no first token after %.0f ms; hedging with %s", elapsed * 1000, self._names[1])
+                pending = {t for i, t in enumerate(tasks) if t is not None and not failed[i]}
+                if not pending:
+                    break
+                limit = (self._hedge_s if tasks[1] is None else self._deadline_s) - elapsed
+                done, _ = await asyncio.wait(pending, timeout=max(0.0, limit), return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if tasks[1] is None:
+                        continue          # time to hedge
+                    break                 # deadline
+                for t in done:
+                    i = tasks.index(t)
+                    if t.exception() is not None:
+                        failed[i] = True
+                        logger.warning("[llm] %s failed: %s", self._names[i], t.exception())
+                        continue
+                    ms = (time.monotonic() - t0) * 1000.0
+                    self.latency.record(self._names[i], ms)
+                    if i == 1:
+                        self._fast_wins += 1
+                        logger.info("[llm] %s answered first (%.0f ms)", self._names[1], ms)
+                    self._maybe_report()
+                    return i, t.result()
+            self._misses += 1
+            if all(failed):
+                logger.warning("[llm] both requests failed; using the fallback reply")
+            else:
+                logger.warning("[llm] no answer within %.0f ms; using the fallback reply", self._deadline_s * 1000)
+            self._maybe_report()
+            return None, None
+        finally:
+            for t in tasks:
+                if t is not None and not t.done():
+                    t.cancel()
+            await asyncio.gather(*(t for t in tasks if t is not None), return_exceptions=True)
+
+    def _maybe_report(self) -> None:
+        if self._report_every and self._calls % self._report_every == 0:
+            self._report()
+
+    def _report(self) -> None:
+        st = self.stats()
+        if st.calls:
+            logger.info("[llm] first-token latency %s | hedged %d/%d (%.0f%%), fast used %d (%.0f%%), deadline misses %d",
+                        self.latency.summary() or "-", st.hedged, st.calls, st.hedge_rate * 100,
+                        st.fast_wins, st.fast_win_rate * 100, st.deadline_misses)
+
+
+async def _with_text(request: Awaitable[LLMResponse]) -> LLMResponse:
+    """The response, or an error when it is empty (an empty answer must not win the race)."""
+    response = await request
+    if not (response.text or "").strip():
+        raise RuntimeError("empty answer")
+    return response
+
+
+async def _first_text(stream: AsyncIterator[LLMChunk]) -> LLMChunk:
+    """First chunk with text; a stream that ends without any counts as failed."""
+    async for chunk in stream:
+        if chunk.delta:
+            return chunk
+    raise RuntimeError("empty answer")
@@ -0,0 +1,149 @@
+# octavius/infrastructure/llm/ollama.py
+from __future__ import annotations
+import json
+import logging
+import time
+from typing import Any, Dict, Iterator, Optional
+
+import httpx
+
+from octavius.config.settings import LLMSettings
+from octavius.ports.llm import LLMClient
+from octavius.domain.models.llm_objects import FALLBACK_TEXT, GenerationOptions, LLMChunk, LLMResponse
+
+logger = logging.getLogger(__name__)
+
+_LOAD_TIMEOUT_S = 120.0   # loading a model from disk can take a while on small boards
+
+
+class OllamaClient(LLMClient):
+    """Local LLM through an Ollama-compatible HTTP API (`/api/chat`).
+
+    - One `httpx.Client` for the process lifetime, so turns reuse the same connection.
+    - `open()` loads the model with `llm.keep_alive` (an empty generate request), so the
+      first turn does not pay the load; every request passes `keep_alive` again so the
+      model stays resident between turns.
+    - `stream()` reads the NDJSON stream, one chunk per non-empty `message.content`.
+    - Errors end in the same short fallback reply as `GeminiClient`.
+    - There is no search grounding locally, so per-turn `options` are ignored.
+
+    `transport` is passed to httpx (tests use it; production leaves it None).
+    """
+
+    def __init__(self, settings: LLMSettings, *, transport: Optional[httpx.BaseTransport] = None) -> None:
+        self._s = settings
+        self._transport = transport
+        self._http: Optional[httpx.Client] = None
+        self._model = settings.model
+        self._system_prompt = settings.system_prompt
+
+    # ------------- lifecycle -------------
+
+    def open(self) -> None:
+        if self._http is not None:
+            return
+        self._http = httpx.Client(
+            base_url=self._s.ollama_url,
+            timeout=httpx.Timeout(self._s.timeout_s, connect=5.0),
+            limits=httpx.Limits(max_connections=2, max_keepalive_connections=1, keepalive_expiry=self._s.keepalive_s),
+            transport=self._transport,
+        )
+        self._warm()
+        logger.info("OllamaClient open: model=%s url=%s keep_alive=%s", self._model, self._s.ollama_url, self._s.keep_alive)
+
+    def close(self) -> None:
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    # ------------- non-streaming -------------
+
+    def generate(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> LLMResponse:
+        http = self._ensure_ready()
+        try:
+            r = http.post("/api/chat", json=self._body(prompt, system_prompt, stream=False))
+            r.raise_for_status()
+            data = r.json()
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Fallo en OllamaClient.generate: %s", e)
+            return LLMResponse(text=FALLBACK_TEXT)
+        return LLMResponse(
+            text=((data.get("message") or {}).get("content") or "").strip(),
+            usage_tokens=_usage(data),
+            finish_reason=data.get("done_reason"),
+        )
+
+    # ------------- streaming -------------
+
+    def stream(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> Iterator[LLMChunk]:
+        """NDJSON deltas as the server produces them; a final empty chunk closes the stream."""
+        http = self._ensure_ready()
+        idx = 0
+        try:
+            with http.stream("POST", "/api/chat", json=self._body(prompt, system_prompt, stream=True)) as r:
+                r.raise_for_status()
+                for line in r.iter_lines():
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    if data.get("error"):
+                        raise ValueError(data["error"])
+                    piece = (data.get("message") or {}).get("content") or ""
+                    if piece:
+                        yield LLMChunk(delta=piece, index=idx, is_final=False)
+                        idx += 1
+                    if data.get("done"):
+                        logger.debug("Ollama done_reason=%s tokens=%s", data.get("done_reason"), _usage(data))
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning("Fallo en OllamaClient.stream: %s", e)
+            if idx == 0:
+                yield LLMChunk(delta=FALLBACK_TEXT, index=idx, is_final=False)
+                idx += 1
+        yield LLMChunk(delta="", index=idx, is_final=True)
+
+    # ------------- helpers -------------
+
+    def _body(self, prompt: str, system_prompt: Optional[str], *, stream: bool) -> Dict[str, Any]:
+        messages = []
+        instruction = (system_prompt or self._system_prompt or "").strip()
+        if instruction:
+            messages.append({"role": "system", "content": instruction})
+        messages.append({"role": "user", "content": (prompt or "").strip()})
+        return {
+            "model": self._model,
+            "messages": messages,
+            "stream": stream,
+            "keep_alive": self._s.keep_alive,
+            "options": {"temperature": self._s.temperature, "num_predict": self._s.max_tokens},
+        }
+
+    def _warm(self) -> None:
+        """Load the model ahead of the first turn (failures are not fatal)."""
+        assert self._http is not None
+        t0 = time.perf_counter()
+        try:
+            r = self._http.post(
+                "/api/generate",
+                json={"model": self._model, "keep_alive": self._s.keep_alive},
+                timeout=httpx.Timeout(_LOAD_TIMEOUT_S, connect=5.0),
+            )
+            r.raise_for_status()
+            logger.info("Ollama model %s loaded in %.0f ms", self._model, (time.perf_counter() - t0) * 1000)
+        except httpx.HTTPError as e:
+            logger.warning("No se pudo cargar el modelo %s en Ollama: %s", self._model, e)
+
+    def _ensure_ready(self) -> httpx.Client:
+        if self._http is None:
+            raise RuntimeError("Call open() before using OllamaClient")
+        return self._http
+
+
+def _usage(data: Dict[str, Any]) -> Optional[int]:
+    counts = [data.get("prompt_eval_count"), data.get("eval_count")]
+    if all(c is None for c in counts):
+        return None
+    return sum(c or 0 for c in counts)
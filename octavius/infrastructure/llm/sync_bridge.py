@@ -0,0 +1,93 @@
+# octavius/infrastructure/llm/sync_bridge.py
+from __future__ import annotations
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Iterator, Optional, Union
+
+from octavius.ports.llm import AsyncLLMClient, LLMClient
+from octavius.domain.models.llm_objects import GenerationOptions, LLMChunk, LLMResponse
+
+_DONE = object()
+
+
+class LoopThreadLLMClient(LLMClient):
+    """Sync `LLMClient` facade over an `AsyncLLMClient`, for the (synchronous) TurnManager.
+
+    The async client lives on one event loop in a daemon thread for the whole process, so
+    its pooled connections survive between turns. `stream()` relays chunks through a queue;
+    abandoning the iterator cancels the request on the loop.
+    """
+
+    def __init__(self, client: AsyncLLMClient) -> None:
+        self._client = client
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def open(self) -> None:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="llm-loop", daemon=True)
+            self._thread.start()
+        self._run(self._client.open()).result()
+
+    def close(self) -> None:
+        loop, thread = self._loop, self._thread
+        if loop is None:
+            return
+        try:
+            self._run(self._client.close()).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join(timeout=5.0)
+            loop.close()
+            self._loop = self._thread = None
+
+    def generate(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> LLMResponse:
+        kw = {"options": options} if options is not None else {}
+        fut = self._run(self._client.agenerate(prompt, system_prompt, **kw))
+        try:
+            return fut.result()
+        except BaseException:
+            fut.cancel()   # e.g. KeyboardInterrupt while waiting: abort the HTTP request too
+            raise
+
+    def stream(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> Iterator[LLMChunk]:
+        kw = {"options": options} if options is not None else {}
+        q: "queue.Queue[Union[LLMChunk, BaseException, object]]" = queue.Queue()
+
+        async def pump() -> None:
+            try:
+                async for chunk in self._client.astream(prompt, system_prompt, **kw):
+                    q.put(chunk)
+            except BaseException as e:   # includes CancelledError: unblock the consumer
+                q.put(e)
+                raise
+            finally:
+                q.put(_DONE)
+
+        fut = self._run(pump())
+        try:
+            while True:
+                item = q.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    if isinstance(item, asyncio.CancelledError):
+                        break
+                    raise item
+                yield item
+        finally:
+            fut.cancel()
+
+    def _run(self, coro) -> Future:
+        if self._loop is None:
+            coro.close()
+            raise RuntimeError("Call open() before using the LLM client")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
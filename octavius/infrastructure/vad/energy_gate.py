@@ -0,0 +1,87 @@
+# octavius/infrastructure/vad/energy_gate.py
+from __future__ import annotations
+from dataclasses import dataclass
+import numpy as np
+
+_FULL_SCALE_DB = 20.0 * np.log10(32768.0)
+_EPS = 1e-3
+
+
+@dataclass(frozen=True)
+class EnergyGateStats:
+    frames_seen: int
+    frames_skipped: int
+    noise_floor_db: float
+
+    @property
+    def skip_ratio(self) -> float:
+        return self.frames_skipped / self.frames_seen if self.frames_seen else 0.0
+
+
+class EnergyGate:
+    """Cheap energy pre-gate in front of webrtcvad.
+
+    Frame levels (dBFS RMS) for a whole block of frames are computed in one NumPy call.
+    Only frames within `margin_db` of the adaptive noise floor or louder are worth a
+    webrtcvad call; quieter frames are classified as non-speech directly.
+
+    The noise floor follows frames classified as non-speech: it drops immediately to
+    a quieter level and rises slowly (EMA with `rise_alpha` per frame) when the room
+    gets noisier, so a fan switching on stops costing webrtcvad calls after a while.
+    """
+
+    def __init__(
+        self,
+        margin_db: float = 6.0,
+        rise_alpha: float = 0.02,
+        initial_floor_db: float = -60.0,
+        min_floor_db: float = -80.0,
+    ) -> None:
+        self._margin = float(margin_db)
+        self._alpha = float(rise_alpha)
+        self._min_floor = float(min_floor_db)
+        self._floor = float(initial_floor_db)
+        self._seen = 0
+        self._skipped = 0
+
+    def levels_db(self, frames: np.ndarray) -> np.ndarray:
+        """RMS level in dBFS of each row of a (n_frames, frame_samples) int16 block."""
+        if frames.shape[0] == 0:
+            return np.zeros(0, dtype=np.float64)
+        power = np.einsum("ij,ij->i", frames, frames, dtype=np.float64, casting="unsafe")
+        return 10.0 * np.log10(power / frames.shape[1] + _EPS) - _FULL_SCALE_DB
+
+    def candidates(self, levels_db: np.ndarray) -> np.ndarray:
+        """Mask of frames that must go through webrtcvad."""
+        return levels_db >= self.threshold_db
+
+    def update(self, levels_db: np.ndarray, non_speech: np.ndarray, skipped: int) -> None:
+        """Account a processed block and adapt the noise floor.
+
+        Args:
+            levels_db: levels returned by `levels_db()` for the block.
+            non_speech: mask of frames finally classified as non-speech (skipped or rejected).
+            skipped: how many frames of the block did not reach webrtcvad.
+        """
+        self._seen += int(levels_db.size)
+        self._skipped += int(skipped)
+        quiet = levels_db[non_speech]
+        if quiet.size == 0:
+            return
+        level = float(quiet.mean())
+        if level < self._floor:
+            self._floor = max(level, self._min_floor)
+        else:
+            alpha = 1.0 - (1.0 - self._alpha) ** quiet.size
+            self._floor += alpha * (level - self._floor)
+
+    @property
+    def threshold_db(self) -> float:
+        return self._floor + self._margin
+
+    def stats(self) -> EnergyGateStats:
+        return EnergyGateStats(
+            frames_seen=self._seen,
+            frames_skipped=self._skipped,
+            noise_floor_db=self._floor,
+        )
@@ -0,0 +1,98 @@
+# octavius/infrastructure/vad/frontend.py
+from __future__ import annotations
+from typing import List
+import numpy as np
+
+from octavius.utils.resampler import StreamingResampler
+
+
+class VadFrontEnd:
+    """Fused device-chunk → VAD-frame stage: downmix → resample → frame slicing.
+
+    All intermediate storage is preallocated and reused:
+      - downmix sums channels in an int32 accumulator (no float64 mean round trip),
+      - resampling writes into the StreamingResampler's own output buffer,
+      - frames are sliced in a staging buffer whose leftover samples (carry) are moved
+        to the front on the next push, so frame i always lives at the same offset and
+        its byte memoryview can be created once and handed out on every chunk.
+
+    Frames returned by `push()` / `frame_view()` are only valid until the next `push()`.
+    """
+
+    def __init__(self, dev_rate: int, dev_channels: int, target_rate: int, frame_samples: int) -> None:
+        if frame_samples <= 0:
+            raise ValueError("frame_samples must be > 0")
+        self._ch = int(dev_channels)
+        self._frm = int(frame_samples)
+        self._resampler = StreamingResampler(dev_rate, target_rate)
+        self._acc = np.zeros(0, dtype=np.int32)
+        self._mono = np.zeros(0, dtype=np.int16)
+        self._buf = np.zeros(0, dtype=np.int16)
+        self._views: List[memoryview] = []
+        self._filled = 0     # valid samples in _buf
+        self._consumed = 0   # samples handed out as frames by the last push
+        self._ensure_staging(4 * self._frm)
+
+    def reset(self) -> None:
+        self._resampler.reset()
+        self._filled = 0
+        self._consumed = 0
+
+    def push(self, raw: bytes) -> np.ndarray:
+        """Consume one device chunk; return the complete frames as a (n, frame_samples) view."""
+        frm = self._frm
+        # 1) move the carry (partial frame left by the previous push) to the front
+        carry = self._filled - self._consumed
+        if carry and self._consumed:
+            self._buf[:carry] = self._buf[self._consumed:self._filled]
+        self._filled, self._consumed = carry, 0
+
+        # 2) downmix to mono with integer accumulation
+        mono = self._downmix(np.frombuffer(raw, dtype=np.int16))
+
+        # 3) resample straight into the staging buffer after the carry
+        y = self._resampler.process(mono)
+        self._ensure_staging(carry + len(y))
+        self._buf[carry:carry + len(y)] = y
+        self._filled = carry + len(y)
+
+        # 4) frame slicing (views only)
+        n = self._filled // frm
+        self._consumed = n * frm
+        return self._buf[:self._consumed].reshape(n, frm)
+
+    def frame_view(self, i: int) -> memoryview:
+        """Byte memoryview of frame i of the last push (what webrtcvad.Vad.is_speech expects)."""
+        return self._views[i]
+
+    @property
+    def frame_samples(self) -> int:
+        return self._frm
+
+    # --- internals ------------------------------------------------------------
+
+    def _downmix(self, x: np.ndarray) -> np.ndarray:
+        ch = self._ch
+        if ch == 1:
+            return x
+        n = x.size // ch
+        if self._acc.size < n:
+            self._acc = np.empty(n, dtype=np.int32)
+            self._mono = np.empty(n, dtype=np.int16)
+        acc, mono = self._acc[:n], self._mono[:n]
+        np.sum(x[:n * ch].reshape(n, ch), axis=1, dtype=np.int32, out=acc)
+        # rounded integer mean
+        acc += ch // 2
+        np.floor_divide(acc, ch, out=acc)
+        np.copyto(mono, acc, casting="unsafe")
+        return mono
+
+    def _ensure_staging(self, size: int) -> None:
+        if self._buf.size >= size:
+            return
+        frm = self._frm
+        cap = -(-max(size, 2 * self._buf.size) // frm) * frm
+        buf = np.zeros(cap, dtype=np.int16)
+        buf[:self._filled] = self._buf[:self._filled]
+        self._buf = buf
+        self._views = [memoryview(buf[i * frm:(i + 1) * frm]).cast("B") for i in range(cap // frm)]
@@ -0,0 +1,99 @@
+# octavius/infrastructure/vad/segment_buffer.py
+from __future__ import annotations
+import numpy as np
+
+
+class SegmentBuffer:
+    """Fixed-capacity int16 accumulator for one speech segment.
+
+    Layout: ``[ pre-roll region | speech region ]``.
+
+    - While idle, non-speech frames go to the pre-roll region, used as a circular
+      buffer of `pre_frames` frames (no list trimming, no allocation).
+    - On speech start the ring is unrolled in place so that its frames sit, oldest
+      first, right before the speech region; speech frames are then written after it.
+    - `view()` returns the contiguous segment (pre-roll + speech) without copying.
+    """
+
+    def __init__(self, frame_samples: int, pre_frames: int, max_frames: int) -> None:
+        if frame_samples <= 0 or max_frames <= 0 or pre_frames < 0:
+            raise ValueError("invalid SegmentBuffer geometry")
+        self._frm = int(frame_samples)
+        self._pre = int(pre_frames)
+        self._max = int(max_frames)
+        self._pre_len = self._pre * self._frm
+        self._buf = np.zeros(self._pre_len + self._max * self._frm, dtype=np.int16)
+        self._scratch = np.zeros(self._pre_len, dtype=np.int16)
+        self.reset()
+
+    def reset(self) -> None:
+        self._ring_written = 0           # frames ever pushed to the pre-roll ring
+        self._start = self._pre_len      # first sample of the segment
+        self._end = self._pre_len        # one past the last written sample
+        self._started = False
+
+    # --- idle ----------------------------------------------------------------
+
+    def push_preroll(self, frame: np.ndarray) -> None:
+        """Remember a non-speech frame as pre-roll (oldest one is overwritten)."""
+        if not self._pre or self._started:
+            return
+        slot = self._ring_written % self._pre
+        self._buf[slot * self._frm:(slot + 1) * self._frm] = frame
+        self._ring_written += 1
+
+    # --- speech --------------------------------------------------------------
+
+    def start(self) -> None:
+        """Mark speech start: lay the pre-roll out chronologically before the speech region."""
+        if self._started:
+            return
+        count = min(self._ring_written, self._pre)
+        if count:
+            frm, pre_len = self._frm, self._pre_len
+            oldest = self._ring_written % self._pre if self._ring_written > self._pre else 0
+            split = oldest * frm
+            used = count * frm
+            ring = self._buf[:pre_len]
+            if split:
+                # rotate [split:] + [:split] via the preallocated scratch area
+                tail = pre_len - split
+                self._scratch[:tail] = ring[split:]
+                self._scratch[tail:] = ring[:split]
+                ring[:] = self._scratch
+            elif used < pre_len:
+                # ring never wrapped: frames sit at the front, move them next to the speech region
+                self._scratch[:used] = ring[:used]
+                ring[pre_len - used:] = self._scratch[:used]
+        self._start = self._pre_len - count * self._frm
+        self._started = True
+
+    def append(self, frame: np.ndarray) -> bool:
+        """Append a speech frame in place. Returns False (and drops it) when full."""
+        if not self._started:
+            self.start()
+        if self._end + self._frm > self._buf.size:
+            return False
+        self._buf[self._end:self._end + self._frm] = frame
+        self._end += self._frm
+        return True
+
+    # --- access --------------------------------------------------------------
+
+    def view(self) -> np.ndarray:
+        """Zero-copy view of the segment written so far (empty before speech)."""
+        if not self._started:
+            return self._buf[:0]
+        return self._buf[self._start:self._end]
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    @property
+    def n_frames(self) -> int:
+        return (self._end - self._start) // self._frm if self._started else 0
+
+    @property
+    def full(self) -> bool:
+        return self._end + self._frm > self._buf.size
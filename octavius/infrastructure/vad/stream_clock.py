@@ -0,0 +1,42 @@
+# octavius/infrastructure/vad/stream_clock.py
+from __future__ import annotations
+from typing import Optional
+
+
+class StreamClock:
+    """Maps VAD target-rate sample positions back to the source sample clock.
+
+    The front-end resampler is delay-compensated, so target sample P corresponds to
+    device sample P * src / dst of the stream fed to it. Each incoming chunk re-anchors
+    that mapping on the chunk's own stamp (device sample index + monotonic time), which
+    absorbs gaps left by samples the source lost.
+    """
+
+    def __init__(self, dev_rate: int, target_rate: int) -> None:
+        self._src = float(dev_rate)
+        self._dst = float(target_rate)
+        self.reset()
+
+    def reset(self) -> None:
+        self._fed = 0                     # device samples fed to the front-end (per channel)
+        self._a_pos = 0.0                 # anchor: target position where the last chunk starts
+        self._a_index = 0                 # anchor: device sample index of that chunk
+        self._a_time: Optional[float] = None
+
+    def on_chunk(self, n_samples: int, sample_index: Optional[int] = None,
+                 captured_at: Optional[float] = None) -> None:
+        """Register a chunk of `n_samples` device samples (per channel) about to be processed."""
+        self._a_pos = self._fed * self._dst / self._src
+        self._a_index = self._fed if sample_index is None else int(sample_index)
+        self._a_time = captured_at
+        self._fed += int(n_samples)
+
+    def ms(self, pos: int) -> int:
+        """Source-clock milliseconds (since the source opened) of target sample `pos`."""
+        return int(round(self._a_index * 1000.0 / self._src + (pos - self._a_pos) * 1000.0 / self._dst))
+
+    def time(self, pos: int) -> Optional[float]:
+        """Monotonic capture time of target sample `pos` (None if the source gives no times)."""
+        if self._a_time is None:
+            return None
+        return self._a_time + (pos - self._a_pos) / self._dst
@@ -1,14 +1,21 @@
 # octavius/infrastructure/vad/webrtc_vad_adapter.py
 from __future__ import annotations
-from typing import Iterable, List, Iterator, Optional
+from typing import Iterable, List, Iterator, Optional, Tuple, Union
 import logging
+import time
 import numpy as np
 import webrtcvad
 from octavius.config.settings import Settings
 from octavius.infrastructure.vad.vad_settings import VadParams
+from octavius.domain.models.audio_frame import AudioFrame
 from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.vad_event import EndReason, SpeechChunk, SpeechEnd, SpeechStart, VadEvent
+from octavius.ports.features import FeatureStream
 from octavius.ports.vad import VADPort
-from octavius.utils.audio_utils import to_mono_int16, resample_int16
+from octavius.infrastructure.vad.frontend import VadFrontEnd
+from octavius.infrastructure.vad.energy_gate import EnergyGate, EnergyGateStats
+from octavius.infrastructure.vad.segment_buffer import SegmentBuffer
+from octavius.infrastructure.vad.stream_clock import StreamClock
 
 logger = logging.getLogger(__name__)
 
@@ -16,14 +23,21 @@ class WebRTCVADAdapter(VADPort):
     """WebRTC-based VAD that normalizes input and segments until sustained silence.
 
     Responsibilities owned here:
-      - Convert device-native frames → MONO int16 @ target_sample_rate.
+      - Convert device-native frames → MONO int16 @ target_sample_rate (fused `VadFrontEnd`).
       - Split into frame_ms windows and run webrtcvad.Vad on those frames.
-      - Collect frames until 'silence_ms' of continuous non-speech is observed.
+      - Emit SpeechStart / SpeechChunk / SpeechEnd events while collecting frames until
+        'silence_ms' of continuous non-speech is observed, in place,
+        into a preallocated `SegmentBuffer` (sized from max_record_ms, with circular pre-roll).
+      - Optionally (`vad.energy_gate`) skip webrtcvad on frames close to the noise floor
+        while waiting for speech to start.
+      - Optionally feed each segment's samples to a `FeatureStream` as they are collected,
+        so the ASR front-end (log-mel) is done by the time the segment ends.
     """
 
     def __init__(
         self,
         vad_settings: Settings,
+        features: Optional[FeatureStream] = None,
     ) -> None:
         """
         Args:
@@ -31,8 +45,10 @@ class WebRTCVADAdapter(VADPort):
             vad_settings: configuration object with attributes
                 .aggressiveness, .frame_ms, .silence_ms, .pre_speech_ms, .max_record_ms 
             target_sample_rate: normalized sample rate for VAD (e.g., 16000)
+            features: optional incremental feature extractor attached to each segment
         """
         self._s = self._make_vad_params(settings=vad_settings)
+        self._features = features
         # Will be set in open()
         self._vad: Optional[webrtcvad.Vad] = None
         self._dev_rate: Optional[int] = None
@@ -40,9 +56,14 @@ class WebRTCVADAdapter(VADPort):
         self._frame_samples: Optional[int] = None
         self._silence_frames_needed: Optional[int] = None
         self._pre_frames: Optional[int] = None
-
-        # carry-over buffer to avoid dropping partial frames after resampling
-        self._carry: np.ndarray = np.empty(0, dtype=np.int16)
+        # downmix/resample/framing stage (keeps the partial-frame carry between chunks)
+        self._frontend: Optional[VadFrontEnd] = None
+        self._gate: Optional[EnergyGate] = None
+        self._segments: List[SegmentBuffer] = []
+        self._seg_idx = 0
+        self._framed = 0          # target-rate samples handed to webrtcvad since open()
+        self._clock: Optional[StreamClock] = None
+        self._carry: Optional[np.ndarray] = None   # frames left after a max_record_ms cut
 
     # --------------------- VADPort API ---------------------------------------
 
@@ -58,6 +79,20 @@ class WebRTCVADAdapter(VADPort):
         self._frame_samples = int(self._s.sample_rate * self._s.frame_ms / 1000)
         self._silence_frames_needed = max(1, int(self._s.silence_ms / self._s.frame_ms))
         self._pre_frames = max(0, int(self._s.pre_speech_ms / self._s.frame_ms))
+        self._frontend = VadFrontEnd(
+            dev_rate=self._dev_rate,
+            dev_channels=self._dev_channels,
+            target_rate=self._s.sample_rate,
+            frame_samples=self._frame_samples,
+        )
+        self._gate = EnergyGate(margin_db=self._s.energy_gate_margin_db) if self._s.energy_gate else None
+        self._framed = 0
+        self._carry = None
+        self._clock = StreamClock(self._dev_rate, self._s.sample_rate)
+        max_frames = max(1, -(-self._s.max_record_ms // self._s.frame_ms))
+        self._segments = [
+            SegmentBuffer(self._frame_samples, self._pre_frames, max_frames) for _ in range(2)
+        ]
 
         logger.info(
             "VAD.open: dev_rate=%s dev_ch=%s → target_rate=%d frame_ms=%d frame_samples=%d silence_frames=%d pre_frames=%d",
@@ -68,85 +103,168 @@ class WebRTCVADAdapter(VADPort):
     def close(self) -> None:
         """Nothing to release here; keep idempotent."""
         self._vad = None
+        self._frontend = None
+        self._gate = None
+        self._segments = []
+        self._clock = None
+        self._carry = None
+
+    def capture_until_silence(self,frames: Iterable[Union[AudioFrame, bytes]]) -> RecordingSegment:
+        """Consume device frames until silence; return a RecordingSegment with single PCM16 mono segment at target rate.
+
+        Thin wrapper over `stream_events()`: returns the segment carried by SpeechEnd.
+        """
+        for ev in self.stream_events(frames):
+            if isinstance(ev, SpeechEnd):
+                return ev.segment
+        raise RuntimeError("stream_events() finished without SpeechEnd")  # pragma: no cover
+
+    def stream_events(self, frames: Iterable[Union[AudioFrame, bytes]]) -> Iterator[VadEvent]:
+        """Consume device frames and yield SpeechStart / SpeechChunk / SpeechEnd for one segment.
 
-    def capture_until_silence(self,frames: Iterable[bytes]) -> RecordingSegment:
-        """Consume device frames until silence; return a RecordingSegment with single PCM16 mono segment at target rate."""
-        assert self._vad is not None, "Call open() before capture_until_silence()"
+        Stamped `AudioFrame`s give segments absolute source-clock and monotonic times; plain
+        bytes are accepted too and are timed by counting samples.
+
+        SpeechChunk is emitted once per device chunk that added speech. All pcm handed out is
+        a zero-copy view of the adapter's segment buffer. Two buffers are used alternately,
+        so a segment stays valid while the next one is being captured.
+
+        When `max_record_ms` cuts a segment in the middle of a device chunk, the rest of that
+        chunk is kept and processed first by the next call, so a turn that continues over
+        several segments loses no audio.
+        """
+        assert self._vad is not None, "Call open() before stream_events()"
         assert self._dev_rate is not None and self._dev_channels is not None
         assert self._frame_samples is not None and self._silence_frames_needed is not None and self._pre_frames is not None
+        assert self._frontend is not None and self._segments and self._clock is not None
+        frontend = self._frontend
+        gate = self._gate
+        clock = self._clock
+        frm = self._frame_samples
+        frame_ms = int(self._s.frame_ms)
 
-        ring: List[bytes] = []   # pre-speech buffer (frame-sized)
-        speech: List[bytes] = []
+        # alternate buffers: the previous segment may still be in use downstream
+        self._seg_idx ^= 1
+        seg = self._segments[self._seg_idx]
+        seg.reset()
+        feats = self._features
+        if feats is not None:
+            feats.reset()
         silence_count = 0
         total_ms = 0
+        emitted = 0   # samples of `seg` already handed out as SpeechChunk
+        seg_start = seg_end = self._framed   # target positions of the segment span
 
-        for raw in frames:
-            for fr in self._dev_raw_to_target_frames(raw):
-                if self._vad.is_speech(fr, self._s.sample_rate):
-                    if self._pre_frames and ring: 
-                        speech.extend(ring); ring.clear()
-                    speech.append(fr); 
+        for block, staged in self._blocks(frames):
+            # energy pre-gate only while idle: one vectorized level computation per chunk
+            gated = gate is not None and not seg.started and len(block) > 0
+            if gated:
+                levels = gate.levels_db(block)
+                candidates = gate.candidates(levels)
+                non_speech = ~candidates
+                skipped = 0
+            end: Optional[EndReason] = None
+            for i in range(len(block)):
+                pos = self._framed   # target position of this frame's first sample
+                self._framed += frm
+                if gated and not seg.started and not candidates[i]:
+                    is_speech = False
+                    skipped += 1
+                else:
+                    # zero-copy byte view of the frame in the front-end staging buffer
+                    frame = frontend.frame_view(i) if staged else memoryview(block[i]).cast("B")
+                    is_speech = self._vad.is_speech(frame, self._s.sample_rate)
+                    if gated and not is_speech:
+                        non_speech[i] = True
+                if is_speech:
+                    first = not seg.started
+                    seg.append(block[i])
                     silence_count = 0
+                    seg_end = pos + frm
+                    if first:
+                        seg_start = pos - (seg.n_frames - 1) * frm   # pre-roll is contiguous
+                        yield SpeechStart(timestamp_ms=clock.ms(seg_start), captured_at=clock.time(seg_start))
                 else:
-                    if speech:
+                    if seg.started:
                         silence_count += 1
                         if silence_count >= (self._silence_frames_needed or 1):
-                            pcm = b"".join(speech)
-                            seg_ms = len(speech) * self._s.frame_ms
-                            return RecordingSegment(
-                                pcm=pcm,
-                                sample_rate=self._s.sample_rate,
-                                channels=1,
-                                frame_ms=int(self._s.frame_ms),
-                                start_ms=0,
-                                end_ms=seg_ms,
-                            )
-                    elif self._pre_frames:
-                        ring.append(fr)
-                        if len(ring) > self._pre_frames: ring.pop(0)
-
-                total_ms += self._s.frame_ms
+                            end = EndReason.SILENCE
+                            break
+                    else:
+                        seg.push_preroll(block[i])
+
+                total_ms += frame_ms
                 if self._s.max_record_ms and total_ms >= self._s.max_record_ms:
-                    pcm = b"".join(speech)
-                    seg_ms = len(speech) * self._s.frame_ms
-                    return RecordingSegment(
-                        pcm=pcm, sample_rate=self._s.sample_rate, channels=1,
-                        frame_ms=int(self._s.frame_ms), start_ms=0, end_ms=seg_ms
-                    )
+                    end = EndReason.MAX_LENGTH
+                    if i + 1 < len(block):
+                        self._carry = block[i + 1:].copy()   # staging is reused by the next push()
+                    break
+            if gated and end is None:
+                gate.update(levels, non_speech, skipped)
+
+            pcm = seg.view()
+            if len(pcm) > emitted:
+                if feats is not None:
+                    feats.push(pcm[emitted:])
+                yield SpeechChunk(
+                    pcm=memoryview(pcm[emitted:]).cast("B"),
+                    offset_ms=emitted * 1000 // self._s.sample_rate,
+                )
+                emitted = len(pcm)
+            if end is not None:
+                yield SpeechEnd(reason=end, segment=self._segment(seg, seg_start, seg_end),
+                                trailing_silence_ms=silence_count * frame_ms)
+                return
 
         # stream ended; return whatever we have
-        pcm = b"".join(speech)
-        seg_ms = len(speech) * self._s.frame_ms
-        return RecordingSegment(
-            pcm=pcm, sample_rate=self._s.sample_rate, channels=1,
-            frame_ms=int(self._s.frame_ms), start_ms=0, end_ms=seg_ms
-        )
+        yield SpeechEnd(reason=EndReason.STREAM_END, segment=self._segment(seg, seg_start, seg_end),
+                        trailing_silence_ms=silence_count * frame_ms)
 
     # --------------------- Helpers ------------------------------------------
 
-    def _dev_raw_to_target_frames(self, raw: bytes) -> List[bytes]:
-        """Convert device-native bytes → target-rate mono frames aligned to frame_ms."""
-        assert self._dev_rate is not None and self._dev_channels is not None and self._frame_samples is not None
+    def _blocks(self, frames: Iterable[Union[AudioFrame, bytes]]) -> Iterator[Tuple[np.ndarray, bool]]:
+        """Target-rate frame blocks, and whether they live in the front-end staging buffer.
 
-        # 1) downmix to mono at device rate
-        mono_raw = to_mono_int16(raw, self._dev_channels)
-        mono_dev = np.frombuffer(mono_raw, dtype=np.int16)
+        Frames carried over from a `max_record_ms` cut come first.
+        """
+        assert self._frontend is not None and self._clock is not None and self._dev_channels is not None
+        carry, self._carry = self._carry, None
+        if carry is not None:
+            yield carry, False
+        bytes_per_dev_sample = 2 * self._dev_channels
+        for item in frames:
+            if isinstance(item, AudioFrame):
+                raw = item.pcm
+                self._clock.on_chunk(len(raw) // bytes_per_dev_sample, item.sample_index, item.captured_at)
+            else:
+                raw = item
+                self._clock.on_chunk(len(raw) // bytes_per_dev_sample)
+            yield self._frontend.push(raw), True
 
-        # 2) resample to target rate
-        mono_tgt = resample_int16(mono_dev, self._dev_rate, self._s.sample_rate)
+    def _segment(self, seg: SegmentBuffer, start_pos: int, end_pos: int) -> RecordingSegment:
+        """Wrap the accumulated samples (pre-roll + speech) without copying them and stamp them."""
+        assert self._clock is not None
+        endpoint_at = time.monotonic()
+        pcm = seg.view()
+        if not seg.started:
+            start_pos = end_pos = self._framed
+        if self._gate is not None:
+            st = self._gate.stats()
+            logger.debug("VAD energy gate: skipped %d/%d frames (%.0f%%), floor=%.1f dBFS",
+                         st.frames_skipped, st.frames_seen, st.skip_ratio * 100.0, st.noise_floor_db)
+        return RecordingSegment(
+            pcm=memoryview(pcm).cast("B"),
+            sample_rate=self._s.sample_rate,
+            channels=1,
+            frame_ms=int(self._s.frame_ms),
+            start_ms=self._clock.ms(start_pos),
+            end_ms=self._clock.ms(end_pos),
+            captured_at=self._clock.time(start_pos),
+            ended_at=self._clock.time(end_pos),
+            endpoint_at=endpoint_at,
+            features=self._features.finish() if self._features is not None and seg.started else None,
+        )
 
-        # 3) slice into fixed-size frames
-        if self._carry.size:
-            mono_tgt = np.concatenate([self._carry, mono_tgt])
-        frm = self._frame_samples
-        n = (len(mono_tgt) // frm) * frm
-        if n == 0:
-            self._carry = mono_tgt  # keep all as carry
-            return []
-        frames = mono_tgt[:n].reshape(-1, frm).astype(np.int16)
-        self._carry = mono_tgt[n:]  # keep remainder for next call
-        return [f.tobytes() for f in frames]
-    
     def _make_vad_params(self,settings: Settings) -> VadParams:
         v, a = settings.vad, settings.audio
         return VadParams(
@@ -156,6 +274,8 @@ class WebRTCVADAdapter(VADPort):
             pre_speech_ms=v.pre_speech_ms,
             sample_rate=a.sample_rate,
             max_record_ms=v.max_record_ms,
+            energy_gate=v.energy_gate,
+            energy_gate_margin_db=v.energy_gate_margin_db,
         )
 
     # --------------------- Metadata -----------------------------------------
@@ -168,3 +288,8 @@ class WebRTCVADAdapter(VADPort):
     @property
     def frame_ms(self) -> int:
         return int(self._s.frame_ms)
+
+    @property
+    def energy_gate_stats(self) -> Optional[EnergyGateStats]:
+        """Frames seen/skipped by the energy pre-gate (None when disabled)."""
+        return self._gate.stats() if self._gate is not None else None
@@ -6,4 +6,6 @@ class VadParams:
     silence_ms: int
     pre_speech_ms: int
     sample_rate: int    
-    max_record_ms: int
\ No newline at end of file
+    max_record_ms: int
+    energy_gate: bool = False
+    energy_gate_margin_db: float = 6.0
\ No newline at end of file
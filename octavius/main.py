@@ -3,6 +3,7 @@ from __future__ import annotations
 from dotenv import load_dotenv
 import logging
 import sys
+from typing import Optional
 import pyaudio
 
 from octavius.config.settings import Settings, get_settings
@@ -13,17 +14,27 @@ from octavius.ports.audio_source import AudioSource
 from octavius.ports.vad import VADPort
 from octavius.ports.asr import ASRPort
 from octavius.ports.llm import LLMClient
+from octavius.ports.features import FeatureStream
 
 # Adapters (implementations)
 from octavius.infrastructure.audio.pyaudio_source import PyAudioSource
 from octavius.infrastructure.vad.vad import WebRTCVADAdapter
-from octavius.infrastructure.asr.whisper import WhisperTranscriber
+from octavius.infrastructure.asr.factory import create_transcriber
+from octavius.infrastructure.asr.features import StreamingLogMel, whisper_n_mels
+from octavius.infrastructure.asr.process_worker import ProcessASRTranscriber
 from octavius.infrastructure.llm.gemini import GeminiClient
+from octavius.infrastructure.llm.gemini_async import AsyncGeminiClient
+from octavius.infrastructure.llm.hedged import HedgedLLMClient
+from octavius.infrastructure.llm.ollama import OllamaClient
+from octavius.infrastructure.llm.sync_bridge import LoopThreadLLMClient
 from octavius.infrastructure.memory.in_memory_conversation_store import InMemoryConversationStore
 
 # Domain services
 from octavius.domain.services.conversation_history import ConversationHistory
 from octavius.domain.services.turn_manager import TurnManager
+from octavius.domain.services.chunked_transcriber import ChunkedTranscriber
+from octavius.domain.services.transcript_gate import TranscriptGate
+from octavius.domain.services.query_classifier import QueryClassifier
 
 log = logging.getLogger("octavius.cli")
 
@@ -64,18 +75,86 @@ def build_source(pa: pyaudio.PyAudio, settings:Settings) -> AudioSource:
 def build_vad(settings:Settings) -> VADPort:
     """Instantiate the VAD adapter (owns downmix/resample/framing)."""
     return WebRTCVADAdapter(
-        vad_settings=settings       
+        vad_settings=settings,
+        features=build_features(settings),
     )
 
 
+def build_features(settings:Settings) -> Optional[FeatureStream]:
+    """Log-mel extractor run during capture (`asr.stream_features`, openai Whisper only)."""
+    if not settings.asr.stream_features or settings.asr.implementation != "openai":
+        return None
+    return StreamingLogMel(whisper_n_mels(settings.asr.model_id))
+
+
 def build_asr(settings:Settings) -> ASRPort:
-    """Instantiate the ASR adapter (consumes RecordingSegment)."""
-    return WhisperTranscriber(settings.asr)
+    """Instantiate the ASR adapter (consumes RecordingSegment) selected by `asr.implementation`.
+
+    With `asr.isolation: process` the model is hosted in a worker process instead, so its
+    decode loop does not compete for the GIL with capture and VAD.
+    """
+    if settings.asr.isolation == "process":
+        return ProcessASRTranscriber(settings.asr)
+    return create_transcriber(settings.asr)
 
 
 def build_llm(settings:Settings) ->LLMClient:
-    """Instantiate the LLM client adapter."""
-    return GeminiClient(settings.llm)
+    """Instantiate the LLM client adapter.
+
+    With `llm.transport: http` the async REST client is used (pooled, pre-warmed connection
+    kept for the whole process), behind a sync facade running its event loop in a thread.
+    With `llm.hedge_after_ms` > 0 a slow first token is hedged with `llm.hedge_model`
+    (no search, no thinking) and `llm.deadline_ms` bounds the wait.
+    `llm.provider: ollama` uses a local Ollama-compatible server instead (works offline).
+    """
+    s = settings.llm
+    if s.provider == "ollama":
+        return OllamaClient(s)
+    if s.transport == "http":
+        if s.hedge_after_ms <= 0:
+            return LoopThreadLLMClient(AsyncGeminiClient(s))
+        primary = AsyncGeminiClient(s, fallback_text=None)
+        fast = AsyncGeminiClient(s, model=s.hedge_model, enable_search=False, thinking_budget=0, fallback_text=None)
+        return LoopThreadLLMClient(HedgedLLMClient(
+            primary, fast,
+            hedge_after_ms=s.hedge_after_ms,
+            deadline_ms=s.deadline_ms,
+            names=(primary.model, fast.model),
+        ))
+    if s.hedge_after_ms > 0:
+        logging.getLogger(__name__).warning("llm.hedge_after_ms requiere llm.transport: http; se ignora")
+    return GeminiClient(s)
+
+
+def build_chunker(asr: ASRPort, settings:Settings) -> Optional[ChunkedTranscriber]:
+    """Background chunked transcription for long utterances (None when `asr.chunking` is off)."""
+    if not settings.asr.chunking:
+        return None
+    return ChunkedTranscriber(
+        asr,
+        sample_rate=settings.audio.sample_rate,
+        frame_ms=settings.vad.frame_ms,
+        chunk_seconds=settings.asr.chunk_seconds,
+        overlap_ms=settings.asr.chunk_overlap_ms,
+        search_ms=settings.asr.chunk_search_ms,
+    )
+
+
+def build_classifier(settings:Settings) -> Optional[QueryClassifier]:
+    """Per-turn grounding/thinking decision (None when `llm.query_routing` is off)."""
+    if not settings.llm.query_routing:
+        return None
+    return QueryClassifier()
+
+
+def build_gate(settings:Settings) -> Optional[TranscriptGate]:
+    """Transcript gate in front of the LLM (None when `asr.gate` is off)."""
+    if not settings.asr.gate:
+        return None
+    return TranscriptGate(
+        min_confidence=settings.asr.gate_min_confidence,
+        max_repeats=settings.asr.gate_max_repeats,
+    )
 
 
 def build_history(settings:Settings) -> ConversationHistory:
@@ -102,10 +181,11 @@ def main() -> None:
 
     # Build all adapters/services (no side effects yet)
     src = build_source(pa=pa, settings=s)
-    vad = build_vad(settings=s, target_rate=s.audio.sample_rate)
+    vad = build_vad(settings=s)
     asr = build_asr(settings=s)
     llm = build_llm(settings=s)
     history = build_history(settings=s)
+    chunker = build_chunker(asr, settings=s)
 
     try:
         # ---- Open lifecycle explicitly (in order) ----
@@ -121,7 +201,8 @@ def main() -> None:
                  vad.sample_rate, vad.frame_ms)
 
         if hasattr(asr, "open") and callable(getattr(asr, "open")):
-            asr.open()
+            asr.open()   # model loads + warms up in background; the first turn waits only if needed
+            log.info("ASR loading in background (ready=%s)", getattr(asr, "is_ready", True))
 
         if hasattr(llm, "open") and callable(getattr(llm, "open")):
             llm.open()
@@ -135,6 +216,10 @@ def main() -> None:
             history=history,
             llm_system_prompt=getattr(s.llm, "system_prompt", None),
             llm_max_tokens_context=getattr(s.llm, "max_tokens", None) or 2048,
+            chunker=chunker,
+            gate=build_gate(settings=s),
+            llm_streaming=s.llm.streaming,
+            classifier=build_classifier(settings=s),
         )
 
         # ---- Run one conversational turn ----
@@ -149,6 +234,12 @@ def main() -> None:
         except Exception:
             log.exception("LLM close failed")
 
+        try:
+            if chunker is not None:
+                chunker.close()
+        except Exception:
+            log.exception("ASR chunker close failed")
+
         try:
             if hasattr(asr, "close") and callable(getattr(asr, "close")):
                 asr.close()
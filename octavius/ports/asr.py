@@ -1,11 +1,18 @@
 from __future__ import annotations
-from typing import Protocol, Any
+from concurrent.futures import Future
+from typing import Protocol, Any, Optional
 from octavius.domain.models.recording_segment import RecordingSegment
 from octavius.domain.models.utterance import Utterance
 
 class ASRPort(Protocol):
     """Speech-to-text boundary; converts audio segments into text."""
     def transcribe(self, segment: RecordingSegment) -> Utterance: ...
-    # Optional lifecycle for adapters that need it
+    # Optional lifecycle for adapters that need it.
+    # open() may return before the model is usable; transcribe() then waits for it.
     def open(self) -> None: ...
     def close(self) -> None: ...
+
+    # Optional readiness (adapters that load in the background)
+    ready: Optional[Future]
+    @property
+    def is_ready(self) -> bool: ...
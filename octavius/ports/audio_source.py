@@ -1,15 +1,23 @@
 from __future__ import annotations
 from typing import Iterator, Protocol
 
+from octavius.domain.models.audio_frame import AudioFrame
+from octavius.domain.models.capture_stats import CaptureStats
+
 class AudioSource(Protocol):
     """Abstraction for any audio capture device/stream that yields PCM16 mono frames.
 
     Contract:
         - `open()` acquires the underlying resource (mic, socket, etc.).
-        - `capture_stream()` yields frames as raw PCM16 MONO bytes.
+        - `capture_stream()` yields `AudioFrame`s: raw PCM16 bytes plus the chunk's
+          position on the source sample clock and its monotonic capture time.
         - Each frame MUST represent `frame_ms` ms at `sample_rate`.
         - `sample_rate` SHOULD be one of 8000/16000/32000/48000 (WebRTC-VAD friendly).
         - `close()` releases resources and is idempotent.
+        - `stats()` returns a snapshot of capture counters (overflows, dropped samples,
+          read latency, time blocked in read) accumulated since `open()`; the latency
+          maximum covers the reads since the last `reset_latency_max()`. Reading stats
+          has no side effects.
     """
 
     # lifecycle
@@ -17,7 +25,11 @@ class AudioSource(Protocol):
     def close(self) -> None: ...
 
     # capture
-    def capture_stream(self) -> Iterator[bytes]: ...
+    def capture_stream(self) -> Iterator[AudioFrame]: ...
+
+    # telemetry
+    def stats(self) -> CaptureStats: ...
+    def reset_latency_max(self) -> None: ...
 
     # metadata
     @property
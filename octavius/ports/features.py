@@ -0,0 +1,18 @@
+from __future__ import annotations
+from typing import Optional, Protocol
+import numpy as np
+
+from octavius.domain.models.mel_features import MelFeatures
+
+class FeatureStream(Protocol):
+    """Incremental ASR front-end fed with segment audio while it is being captured.
+
+    Contract:
+      - `reset()` starts a new segment.
+      - `push()` takes the next PCM16 mono samples of the segment (at the VAD rate) and
+        does as much of the feature work as the audio so far allows.
+      - `finish()` completes the segment and returns its features (None if there was no audio).
+    """
+    def reset(self) -> None: ...
+    def push(self, samples: np.ndarray) -> None: ...
+    def finish(self) -> Optional[MelFeatures]: ...
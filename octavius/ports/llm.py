@@ -1,10 +1,13 @@
 from __future__ import annotations
-from typing import Protocol, Iterator, Optional
-from octavius.domain.models.llm_objects import LLMChunk, LLMResponse
+from typing import AsyncIterator, Protocol, Iterator, Optional
+from octavius.domain.models.llm_objects import GenerationOptions, LLMChunk, LLMResponse
 
 class LLMClient(Protocol):
     """LLM boundary that works with a single prompt string and optional system prompt.
     Adapts to providers (Gemini, etc.) behind this interface.
+    `options` (per turn, e.g. from `QueryClassifier`) can switch off search grounding and
+    thinking; None keeps the adapter's configured defaults. Adapters without those features
+    ignore it.
     """
 
     # lifecycle
@@ -12,7 +15,34 @@ class LLMClient(Protocol):
     def close(self) -> None: ...
 
     # non-streaming
-    def generate(self, prompt: str, system_prompt: Optional[str] = None) -> LLMResponse: ...
+    def generate(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> LLMResponse: ...
 
     # streaming
-    def stream(self, prompt: str, system_prompt: Optional[str] = None) -> Iterator[LLMChunk]: ...
+    def stream(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> Iterator[LLMChunk]: ...
+
+
+class AsyncLLMClient(Protocol):
+    """asyncio variant of `LLMClient`.
+
+    `open()` may connect ahead of the first request (connection pre-warm). Requests are
+    cancellable: cancelling the awaiting task (or closing the `astream()` iterator) aborts
+    the HTTP exchange.
+    """
+
+    # lifecycle
+    async def open(self) -> None: ...
+    async def close(self) -> None: ...
+
+    # non-streaming
+    async def agenerate(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> LLMResponse: ...
+
+    # streaming
+    def astream(
+        self, prompt: str, system_prompt: Optional[str] = None, options: Optional[GenerationOptions] = None,
+    ) -> AsyncIterator[LLMChunk]: ...
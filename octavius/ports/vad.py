@@ -1,8 +1,10 @@
 # octavius/application/ports/vad.py
 from __future__ import annotations
-from typing import Iterable, Protocol
+from typing import Iterable, Iterator, Protocol, Union
 
+from octavius.domain.models.audio_frame import AudioFrame
 from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.vad_event import VadEvent
 
 class VADPort(Protocol):
     """Voice Activity Detector that segments speech until sustained silence.
@@ -11,8 +13,14 @@ class VADPort(Protocol):
       - The adapter owns any format normalization required for VAD:
         channel downmix (→ mono), resampling to target sample_rate, and framing to frame_ms.
       - `open()` prepares internal state (e.g., creates webrtcvad.Vad, derives sizes).
+      - `stream_events()` consumes audio and yields events as they happen for ONE segment:
+        SpeechStart, then SpeechChunk(s) with the newly captured speech, then exactly one
+        SpeechEnd (reason: silence, max length or end of stream) carrying the full segment.
       - `capture_until_silence()` consumes audio from the injected AudioSource and returns
         a single speech segment (PCM16 mono) at `sample_rate`, aligned to `frame_ms`.
+        It is equivalent to draining `stream_events()` and returning the SpeechEnd segment.
+      - Input chunks are `AudioFrame`s (or plain device-native bytes). Their stamps are carried
+        over to segment/event timestamps so latency can be measured against real audio time.
       - `close()` releases resources (idempotent). It may be a no-op if not needed.
     """
 
@@ -21,7 +29,8 @@ class VADPort(Protocol):
     def close(self) -> None: ...
 
     # segmentation
-    def capture_until_silence(self, frames: Iterable[bytes]) -> RecordingSegment: ...
+    def stream_events(self, frames: Iterable[Union[AudioFrame, bytes]]) -> Iterator[VadEvent]: ...
+    def capture_until_silence(self, frames: Iterable[Union[AudioFrame, bytes]]) -> RecordingSegment: ...
 
     # normalized output metadata
     @property
@@ -5,6 +5,7 @@ import logging
 import numpy as np
 import pyaudio
 from octavius.utils.pa_errors import pa_error_info
+from octavius.utils.resampler import resample_once
 
 logger = logging.getLogger(__name__)
 
@@ -32,24 +33,12 @@ def to_mono_int16(raw: bytes, channels: int) -> bytes:
     return y.tobytes()
 
 def resample_int16(x: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
-    """Resample int16 PCM using polyphase when available, else linear interpolation."""
-    if src_rate == dst_rate:
-        return x
-    try:
-        from scipy.signal import resample_poly  # lazy import
-    except Exception:
-        resample_poly = None  # type: ignore
-    if resample_poly is not None:
-        y = resample_poly(x.astype(np.float32), dst_rate, src_rate)
-        y = np.clip(np.round(y), -32768, 32767).astype(np.int16)
-        return y
-    # Fallback: linear interpolation
-    import numpy as _np
-    t_src = _np.linspace(0.0, 1.0, num=len(x), endpoint=False, dtype=_np.float32)
-    out_len = int(len(x) * dst_rate / src_rate)
-    t_dst = _np.linspace(0.0, 1.0, num=out_len, endpoint=False, dtype=_np.float32)
-    y = _np.interp(t_dst, t_src, x.astype(_np.float32))
-    return _np.clip(_np.round(y), -32768, 32767).astype(_np.int16)
+    """Resample a complete int16 signal with a polyphase FIR (taps cached per rate pair).
+
+    For continuous streams processed chunk by chunk use
+    `octavius.utils.resampler.StreamingResampler`, which keeps filter history across calls.
+    """
+    return resample_once(x, src_rate, dst_rate)
 
 def pcm16_bytes_to_ndarray(pcm: bytes) -> np.ndarray:
     """View PCM16 mono/stereo bytes as np.int16 (no copy)."""
@@ -68,7 +57,7 @@ def int16_to_float32(x: np.ndarray) -> np.ndarray:
 def ensure_float32_mono_16k_from_pcm16(pcm: bytes, sample_rate: int, channels: int = 1, frame_ms: int | None = None) -> np.ndarray:
     """Normalize PCM16 bytes → float32 mono @ 16 kHz using existing int16 helpers.
 
-    - Reuses `to_mono_int16` (downmix) and `resample_int16` (int16-domain).
+    - Reuses `to_mono_int16` (downmix) and the cached-taps polyphase resampler (int16-domain).
     - Converts to float32 only at the end (efficient + avoids extra rounding).
     """
     raw = pcm
@@ -78,7 +67,7 @@ def ensure_float32_mono_16k_from_pcm16(pcm: bytes, sample_rate: int, channels: i
     x_i16 = pcm16_bytes_to_ndarray(raw)
 
     if sample_rate != 16000:
-        x_i16 = resample_int16(x_i16, src_rate=sample_rate, dst_rate=16000)  
+        x_i16 = resample_once(x_i16, src_rate=sample_rate, dst_rate=16000)
 
     
     if frame_ms:
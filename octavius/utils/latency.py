@@ -0,0 +1,49 @@
+# octavius/utils/latency.py
+from __future__ import annotations
+from collections import deque
+import threading
+from typing import Deque, Dict, Iterable, Tuple
+import numpy as np
+
+
+class LatencyRecorder:
+    """Sliding window of latency samples per name (e.g. per model), with percentiles.
+
+    Keeps the last `window` samples of each name; thread-safe.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        if window <= 0:
+            raise ValueError("window must be > 0")
+        self._window = int(window)
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, ms: float) -> None:
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self._window)).append(float(ms))
+
+    def count(self, name: str) -> int:
+        with self._lock:
+            return len(self._samples.get(name, ()))
+
+    def percentiles(self, name: str, qs: Iterable[float] = (50, 90, 99)) -> Dict[float, float]:
+        """{q: value} over the window (empty dict when there are no samples)."""
+        with self._lock:
+            data = list(self._samples.get(name, ()))
+        if not data:
+            return {}
+        values = np.percentile(np.asarray(data), list(qs))
+        return {q: float(v) for q, v in zip(qs, values)}
+
+    def summary(self, qs: Tuple[float, ...] = (50, 90, 99)) -> str:
+        """One line per name: `name: n=.. p50=..ms p90=..ms p99=..ms`."""
+        with self._lock:
+            names = sorted(self._samples)
+        lines = []
+        for name in names:
+            p = self.percentiles(name, qs)
+            if p:
+                stats = " ".join(f"p{q:g}={v:.0f}ms" for q, v in p.items())
+                lines.append(f"{name}: n={self.count(name)} {stats}")
+        return "; ".join(lines)
@@ -18,6 +18,7 @@ PA_ERROR_NAMES = {
     -9987:  "paTimedOut",
     -9986:  "paInternalError",
     -9985:  "paDeviceUnavailable",
+    -9981:  "paInputOverflowed",
 }
 
 def pa_error_info(exc: Exception) -> tuple[int | None, str, str]:
@@ -0,0 +1,157 @@
+# octavius/utils/resampler.py
+from __future__ import annotations
+from functools import lru_cache
+from math import gcd
+from typing import Tuple
+import numpy as np
+
+# Same design as scipy.signal.resample_poly's default (Kaiser window, beta=5.0,
+# half-length = 10 * max(up, down)) so output quality is unchanged.
+_KAISER_BETA = 5.0
+_HALF_LEN_FACTOR = 10
+
+
+def _ratio(src_rate: int, dst_rate: int) -> Tuple[int, int]:
+    g = gcd(int(src_rate), int(dst_rate))
+    return int(dst_rate) // g, int(src_rate) // g   # (up, down)
+
+
+@lru_cache(maxsize=8)
+def _polyphase_taps(up: int, down: int) -> Tuple[np.ndarray, int]:
+    """Design the anti-aliasing FIR once per (up, down) and split it into phases.
+
+    Returns (taps, skip) where taps has shape (up, K) with each row already reversed,
+    so that `window @ taps[p]` computes the dot product for phase p, and `skip` is the
+    number of leading outputs that only carry the filter delay.
+    """
+    max_rate = max(up, down)
+    cutoff = 1.0 / max_rate
+    half_len = _HALF_LEN_FACTOR * max_rate
+    n = 2 * half_len + 1
+    m = np.arange(n, dtype=np.float64) - half_len
+    h = cutoff * np.sinc(cutoff * m) * np.kaiser(n, _KAISER_BETA)
+    h *= up / h.sum()
+
+    # delay the filter so its center lands on an output sample (as resample_poly does)
+    pre_pad = (-half_len) % down
+    k = -(-(n + pre_pad) // up)  # ceil(len / up) taps per phase
+    padded = np.zeros(k * up, dtype=np.float64)
+    padded[pre_pad:pre_pad + n] = h
+    taps = padded.reshape(k, up).T[:, ::-1].astype(np.float32)
+    taps.setflags(write=False)
+    return taps, (half_len + pre_pad) // down
+
+
+class StreamingResampler:
+    """Stateful polyphase resampler for int16 PCM streams.
+
+    - Filter taps are designed once per (src, dst) rate pair and shared between instances.
+    - The last K-1 input samples are kept between calls, so consecutive chunks are
+      filtered as one continuous signal (no per-chunk edge artifacts).
+    - The filter group delay is compensated, so output sample n lines up with input
+      time n / dst_rate, exactly like `scipy.signal.resample_poly` on the whole signal.
+    - `process()` writes into internal buffers that are reused across calls; the returned
+      array is a view that stays valid only until the next call.
+    """
+
+    def __init__(self, src_rate: int, dst_rate: int) -> None:
+        if src_rate <= 0 or dst_rate <= 0:
+            raise ValueError("sample rates must be > 0")
+        self.src_rate = int(src_rate)
+        self.dst_rate = int(dst_rate)
+        self._up, self._down = _ratio(self.src_rate, self.dst_rate)
+        self._passthrough = self._up == self._down
+        if self._passthrough:
+            return
+        self._taps, self._skip = _polyphase_taps(self._up, self._down)
+        self._k = self._taps.shape[1]
+        self._work = np.zeros(0, dtype=np.float32)
+        self._acc = np.zeros(0, dtype=np.float32)
+        self._out = np.zeros(0, dtype=np.int16)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the stream history (start of a new, unrelated signal)."""
+        if self._passthrough:
+            return
+        self._hist = np.zeros(self._k - 1, dtype=np.float32)
+        self._n_in = 0    # input samples consumed so far
+        self._n_out = 0   # next (delay-uncompensated) output index
+
+    def process(self, x: np.ndarray) -> np.ndarray:
+        """Resample the next chunk of a continuous int16 stream."""
+        if self._passthrough:
+            return x
+        return self._run(x, len(x))
+
+    def flush(self) -> np.ndarray:
+        """Emit the tail still held by the filter (zero-padded end of stream).
+
+        After `process()` + `flush()` the total output length is ceil(n_in * dst / src),
+        the same as `resample_poly` on the whole signal. Call `reset()` before reuse.
+        """
+        if self._passthrough:
+            return np.zeros(0, dtype=np.int16)
+        up, down = self._up, self._down
+        wanted = -(-self._n_in * up // down) + self._skip   # raw outputs for the whole signal
+        if wanted <= self._n_out:
+            return self._out[:0]
+        need_in = -(-((wanted - 1) * down + 1) // up)
+        zeros = max(0, need_in - self._n_in)
+        y = self._run(np.zeros(zeros, dtype=np.int16), zeros)
+        extra = self._n_out - wanted
+        return y[:len(y) - extra] if extra > 0 else y
+
+    # --- internals ------------------------------------------------------------
+
+    def _run(self, x: np.ndarray, n: int) -> np.ndarray:
+        up, down, k = self._up, self._down, self._k
+        hist_len = k - 1
+        work = self._grow("_work", hist_len + n, np.float32)
+        work[:hist_len] = self._hist
+        work[hist_len:] = x
+
+        n_in_new = self._n_in + n
+        n_end = (n_in_new * up - 1) // down + 1 if n_in_new else 0
+        count = max(0, n_end - self._n_out)
+        acc = self._grow("_acc", count, np.float32)
+        if count:
+            windows = np.lib.stride_tricks.sliding_window_view(work, k)
+            first = self._n_out * down
+            if up == 1:
+                # integer decimation: windows are an evenly strided view, no gather needed
+                j0 = first - self._n_in
+                np.matmul(windows[j0:j0 + (count - 1) * down + 1:down], self._taps[0], out=acc)
+            else:
+                t = first + np.arange(count, dtype=np.int64) * down
+                j = t // up - self._n_in
+                np.einsum("ij,ij->i", windows[j], self._taps[t % up], out=acc)
+        self._hist[:] = work[n:n + hist_len]
+        start_out = self._n_out
+        self._n_in = n_in_new
+        self._n_out = n_end if count else self._n_out
+
+        # drop outputs that only contain filter delay
+        drop = min(count, max(0, self._skip - start_out))
+        acc = acc[drop:]
+        out = self._grow("_out", len(acc), np.int16)
+        np.rint(acc, out=acc)
+        np.clip(acc, -32768, 32767, out=acc)
+        out[:] = acc
+        return out
+
+    def _grow(self, name: str, size: int, dtype) -> np.ndarray:
+        buf = getattr(self, name)
+        if buf.size < size:
+            buf = np.empty(max(size, 2 * buf.size), dtype=dtype)
+            setattr(self, name, buf)
+        return buf[:size]
+
+
+def resample_once(x: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """Resample a complete int16 signal (cached taps, output owns its memory)."""
+    if src_rate == dst_rate:
+        return x
+    rs = StreamingResampler(src_rate, dst_rate)
+    head = rs.process(np.asarray(x, dtype=np.int16)).copy()
+    return np.concatenate([head, rs.flush()])
@@ -0,0 +1,108 @@
+# octavius/utils/ring_buffer.py
+from __future__ import annotations
+import threading
+import time
+from typing import Optional
+import numpy as np
+
+
+class Int16RingBuffer:
+    """Preallocated single-producer / single-consumer ring of int16 samples.
+
+    The producer (e.g. a PortAudio callback thread) only moves the write counter and the
+    consumer only moves the read counter, so no lock is shared between them. Counters are
+    monotonically increasing sample totals; the physical position is `counter % capacity`.
+
+    When the ring is full, incoming samples are dropped (never overwriting unread audio)
+    and accounted in `dropped_samples`.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self._buf = np.zeros(capacity, dtype=np.int16)
+        self._cap = int(capacity)
+        self._w = 0   # total samples written (producer-owned)
+        self._r = 0   # total samples read (consumer-owned)
+        self._dropped = 0
+        self._data_ready = threading.Event()
+
+    # --- producer side -------------------------------------------------------
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copy `samples` into the ring. Returns how many samples were dropped (ring full)."""
+        n = int(samples.size)
+        free = self._cap - (self._w - self._r)
+        dropped = max(0, n - free)
+        n -= dropped
+        if n > 0:
+            pos = self._w % self._cap
+            first = min(n, self._cap - pos)
+            self._buf[pos:pos + first] = samples[:first]
+            if n > first:
+                self._buf[:n - first] = samples[first:n]
+            self._w += n
+            self._data_ready.set()
+        if dropped:
+            self._dropped += dropped
+        return dropped
+
+    # --- consumer side -------------------------------------------------------
+
+    def read_into(self, out: np.ndarray, timeout: Optional[float] = None) -> bool:
+        """Fill `out` completely, waiting for the producer if needed.
+
+        Returns False if `timeout` (seconds) elapsed before enough samples were available.
+        """
+        n = int(out.size)
+        if n > self._cap:
+            raise ValueError("read size exceeds ring capacity")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._w - self._r < n:
+            self._data_ready.clear()
+            # re-check after clearing so a write between the check and clear() is not missed
+            if self._w - self._r >= n:
+                break
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._data_ready.wait(remaining)
+        pos = self._r % self._cap
+        first = min(n, self._cap - pos)
+        out[:first] = self._buf[pos:pos + first]
+        if n > first:
+            out[first:] = self._buf[:n - first]
+        self._r += n
+        return True
+
+    def clear(self) -> None:
+        """Discard unread samples (consumer side)."""
+        self._r = self._w
+
+    # --- introspection -------------------------------------------------------
+
+    @property
+    def capacity(self) -> int:
+        return self._cap
+
+    @property
+    def available(self) -> int:
+        """Samples written but not yet read."""
+        return self._w - self._r
+
+    @property
+    def fill_ratio(self) -> float:
+        """How full the ring is, in [0, 1]."""
+        return self.available / self._cap
+
+    @property
+    def written(self) -> int:
+        return self._w
+
+    @property
+    def read_count(self) -> int:
+        return self._r
+
+    @property
+    def dropped_samples(self) -> int:
+        return self._dropped
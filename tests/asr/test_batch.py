@@ -0,0 +1,61 @@
+# tests/asr/test_batch.py
+from types import SimpleNamespace
+import numpy as np
+import soundfile as sf
+
+from octavius.asr.batch import Piece, find_audio, iter_pieces, length_batches, transcribe_files
+
+
+def _wav(path, seconds, rate=44100, channels=2, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * rate)) / rate
+    x = np.sin(2 * np.pi * 220 * t) * 8000 * (np.sin(2 * np.pi * 0.3 * t) > -0.9)
+    x = (x + rng.standard_normal(t.size) * 50).astype(np.int16)
+    sf.write(str(path), np.stack([x] * channels, axis=1), rate, subtype="PCM_16")
+    return str(path)
+
+
+def test_pieces_cover_the_file_in_order_and_fit_whisper(tmp_path):
+    path = _wav(tmp_path / "long.wav", 71.0)
+    pieces = list(iter_pieces(path, max_s=30.0, search_s=2.0))
+
+    assert len(pieces) == 3
+    assert all(p.seconds <= 30.0 for p in pieces)
+    assert [p.index for p in pieces] == [0, 1, 2]
+    for a, b in zip(pieces, pieces[1:]):
+        assert abs(a.start_s + a.seconds - b.start_s) < 1e-6   # contiguous, no overlap
+    assert abs(sum(p.seconds for p in pieces) - 71.0) < 0.01
+    assert pieces[0].audio.dtype == np.float32
+
+
+def test_length_batches_groups_similar_lengths():
+    lengths = [1, 29, 2, 28, 3, 27, 4, 26]
+    pieces = [Piece("f", i, 0.0, np.zeros(n * 16000, np.float32)) for i, n in enumerate(lengths)]
+    batches = list(length_batches(pieces, batch_size=4))
+
+    assert [sorted(int(p.seconds) for p in b) for b in batches] == [[1, 2, 3, 4], [26, 27, 28, 29]]
+
+
+def test_transcribe_files_runs_one_decode_per_batch(tmp_path):
+    files = [_wav(tmp_path / f"{i}.wav", s, rate=16000, channels=1, seed=i) for i, s in enumerate((5.0, 40.0, 6.0))]
+    calls = []
+
+    def decode(audios):
+        calls.append(len(audios))
+        return [SimpleNamespace(text=f" {len(a)} ", language="es", avg_logprob=-0.1,
+                                no_speech_prob=0.0, compression_ratio=1.0) for a in audios]
+
+    records = list(transcribe_files(files, decode, batch_size=2))
+
+    assert calls == [2, 2]
+    assert sorted((r["file"], r["index"]) for r in records) == sorted(
+        [(files[0], 0), (files[1], 0), (files[1], 1), (files[2], 0)])
+    assert all(r["text"] == str(int(round((r["end_s"] - r["start_s"]) * 16000))) for r in records)
+
+
+def test_find_audio_walks_directories(tmp_path):
+    (tmp_path / "sub").mkdir()
+    a = _wav(tmp_path / "a.wav", 0.5)
+    b = _wav(tmp_path / "sub" / "b.wav", 0.5)
+    (tmp_path / "notes.txt").write_text("x")
+    assert find_audio([str(tmp_path)], "*.wav") == sorted([a, b])
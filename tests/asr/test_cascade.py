@@ -0,0 +1,76 @@
+# tests/asr/test_cascade.py
+from concurrent.futures import Future
+
+from octavius.domain.models.asr_stats import AsrStats
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.infrastructure.asr.cascade import CascadeThresholds, CascadingTranscriber
+
+SEG = RecordingSegment(pcm=b"\x00\x00" * 1600, sample_rate=16000, channels=1, frame_ms=30, start_ms=0, end_ms=100)
+
+
+class _Stage:
+    def __init__(self, name, stats):
+        self.name, self.stats, self.calls, self.opened = name, stats, 0, False
+        self.ready = None
+
+    def open(self):
+        self.opened = True
+        self.ready = Future()
+        self.ready.set_result(self.name)
+
+    def close(self):
+        self.opened = False
+
+    def transcribe(self, segment):
+        self.calls += 1
+        return Utterance(raw_text=f"{self.name} text", asr_stats=self.stats)
+
+
+def _cascade(first_stats):
+    first = _Stage("tiny", first_stats)
+    second = _Stage("small", AsrStats(-0.2, 0.01, 1.3))
+    c = CascadingTranscriber(first, second, CascadeThresholds(min_avg_logprob=-0.7))
+    c.open()
+    return c, first, second
+
+
+def test_confident_first_stage_is_final():
+    c, first, second = _cascade(AsrStats(-0.3, 0.05, 1.4))
+    assert c.transcribe(SEG).raw_text == "tiny text"
+    assert (first.calls, second.calls) == (1, 0)
+    st = c.stats()
+    assert st.calls == 1 and st.escalations == 0 and st.first_ms_avg >= 0
+
+
+def test_low_confidence_escalates_and_is_counted():
+    for stats in (AsrStats(-1.2, 0.05, 1.4), AsrStats(-0.3, 0.9, 1.4), AsrStats(-0.3, 0.05, 3.1)):
+        c, first, second = _cascade(stats)
+        assert c.transcribe(SEG).raw_text == "small text"
+        assert second.calls == 1
+        assert c.stats().escalation_rate == 1.0
+
+
+def test_empty_or_unjudgeable_first_stage_is_final():
+    c, first, second = _cascade(None)
+    first.transcribe = lambda segment: Utterance(raw_text="")   # silence / false trigger
+    assert c.transcribe(SEG).raw_text == ""
+    assert c.transcribe(SEG).raw_text == ""
+    c2, _, second2 = _cascade(None)                             # text but no stats
+    assert c2.transcribe(SEG).raw_text == "tiny text"
+    assert (second.calls, second2.calls) == (0, 0) and c.stats().escalations == 0
+
+
+def test_both_stages_are_opened_once_and_ready_together():
+    c, first, second = _cascade(AsrStats(-0.3, 0.05, 1.4))
+    assert first.opened and second.opened
+    assert c.ready.result(timeout=5) == ["tiny", "small"] and c.is_ready
+    c.close()
+    assert not first.opened and not second.opened
+
+
+def test_stats_combine_weights_by_duration():
+    s = AsrStats.combine([(1.0, AsrStats(-1.0, 0.0, 1.0)), (3.0, AsrStats(-0.2, 0.4, 2.0))])
+    assert abs(s.avg_logprob - (-0.4)) < 1e-9 and abs(s.no_speech_prob - 0.3) < 1e-9
+    assert s.compression_ratio == 2.0
+    assert AsrStats.combine([]) is None
@@ -0,0 +1,32 @@
+# tests/asr/test_decoding.py
+import pytest
+
+from octavius.infrastructure.asr.decoding import DECODING_PROFILES, get_profile
+
+
+def test_fast_profile_pins_language_and_decodes_once():
+    kw = get_profile("fast").openai_kwargs("es")
+    assert kw["language"] == "es"
+    assert kw["beam_size"] is None            # greedy in openai-whisper
+    assert kw["temperature"] == (0.0,)
+    assert kw["without_timestamps"] and not kw["condition_on_previous_text"]
+
+
+def test_faster_whisper_kwargs_match_the_profile():
+    p = get_profile("accurate")
+    kw = p.faster_whisper_kwargs("fr")
+    assert kw["language"] == "fr" and kw["beam_size"] == 5 and kw["best_of"] == 5
+    assert kw["temperature"] == list(p.temperatures)
+    assert kw["no_speech_threshold"] == p.no_speech_threshold
+    assert kw["compression_ratio_threshold"] == p.compression_ratio_threshold == 2.4
+
+
+def test_profiles_are_ordered_by_decoding_effort():
+    fast, balanced, accurate = (DECODING_PROFILES[n] for n in ("fast", "balanced", "accurate"))
+    assert len(fast.temperatures) <= len(balanced.temperatures) <= len(accurate.temperatures)
+    assert fast.beam_size <= balanced.beam_size <= accurate.beam_size
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        get_profile("turbo")
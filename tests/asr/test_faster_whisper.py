@@ -0,0 +1,99 @@
+# tests/asr/test_faster_whisper.py
+import sys
+from types import SimpleNamespace
+import uuid
+import pytest
+
+pytest.importorskip("pyaudio")   # octavius.utils.audio_utils imports it
+
+from octavius.config.settings import AsrSettings
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.infrastructure.asr.factory import create_transcriber
+from octavius.infrastructure.asr.faster_whisper import FasterWhisperTranscriber
+
+SEG = RecordingSegment(pcm=b"\x10\x00" * 16000, sample_rate=16000, channels=1, frame_ms=30, start_ms=0, end_ms=1000)
+
+
+class _FakeWhisperModel:
+    """Stands in for faster_whisper.WhisperModel: two segments, records its arguments."""
+
+    instances = []
+
+    def __init__(self, model_ref, device, compute_type):
+        self.ref, self.device, self.compute_type = model_ref, device, compute_type
+        self.calls = []
+        _FakeWhisperModel.instances.append(self)
+
+    def transcribe(self, audio, **kw):
+        self.calls.append((audio, kw))
+        segments = [
+            SimpleNamespace(text=" Hola,", start=0.0, end=0.3, avg_logprob=-0.2, no_speech_prob=0.1, compression_ratio=1.1),
+            SimpleNamespace(text=" ¿qué tal?", start=0.3, end=0.9, avg_logprob=-0.5, no_speech_prob=0.0, compression_ratio=1.6),
+        ]
+        return iter(segments), SimpleNamespace(language="es")
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    _FakeWhisperModel.instances = []
+    monkeypatch.setitem(sys.modules, "faster_whisper", SimpleNamespace(WhisperModel=_FakeWhisperModel))
+    monkeypatch.setitem(sys.modules, "ctranslate2", SimpleNamespace(get_cuda_device_count=lambda: 0))
+    return _FakeWhisperModel
+
+
+def _settings(**kw):
+    # a model path of its own per test: the shared registry would otherwise reuse the model
+    base = dict(implementation="faster-whisper", model_path=f"/models/{uuid.uuid4().hex}", warmup=False)
+    return AsrSettings(**{**base, **kw})
+
+
+def test_factory_selects_the_backend_from_settings(backend):
+    assert isinstance(create_transcriber(_settings()), FasterWhisperTranscriber)
+    with pytest.raises(ValueError):
+        create_transcriber(_settings(implementation="whisper.cpp"))
+
+
+def test_segments_map_to_one_utterance_with_stats(backend):
+    asr = create_transcriber(_settings(compute_type="int8", device="auto"))
+    asr.open()
+    try:
+        utt = asr.transcribe(SEG)
+    finally:
+        asr.close()
+
+    model = backend.instances[0]
+    assert (model.device, model.compute_type) == ("cpu", "int8")
+    assert utt.raw_text == "Hola, ¿qué tal?" and utt.lang == "es"
+    # duration-weighted (0.3 s and 0.6 s), worst compression ratio
+    st = utt.asr_stats
+    assert (st.avg_logprob, st.no_speech_prob, st.compression_ratio) == pytest.approx((-0.4, 0.1 / 3, 1.6))
+    assert utt.asr_confidence == pytest.approx(st.confidence)
+
+
+def test_language_is_forced_and_vad_filter_is_off(backend):
+    asr = create_transcriber(_settings(language="fr", profile="fast"))
+    asr.open()
+    try:
+        asr.transcribe(SEG)
+    finally:
+        asr.close()
+
+    audio, kw = backend.instances[0].calls[0]
+    assert kw["language"] == "fr" and kw["task"] == "transcribe"
+    assert kw["vad_filter"] is False and kw["beam_size"] == 1
+    assert audio.dtype.name == "float32" and len(audio) == 16000
+
+
+def test_float16_falls_back_to_float32_on_cpu(backend):
+    asr = FasterWhisperTranscriber(_settings(compute_type="float16", device="cuda"))
+    asr.open()
+    asr._wait_model()
+    asr.close()
+    assert (backend.instances[0].device, backend.instances[0].compute_type) == ("cpu", "float32")
+
+
+def test_missing_backend_fails_at_open(monkeypatch):
+    monkeypatch.setitem(sys.modules, "ctranslate2", None)   # import raises ImportError
+    asr = FasterWhisperTranscriber(_settings())
+    with pytest.raises(RuntimeError, match="pip install faster-whisper"):
+        asr.open()
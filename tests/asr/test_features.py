@@ -0,0 +1,69 @@
+# tests/asr/test_features.py
+import numpy as np
+import pytest
+
+from octavius.infrastructure.asr.features import StreamingLogMel, log_mel, mel_filters, whisper_n_mels
+
+
+def _pcm(n, seed=0):
+    return (np.random.default_rng(seed).standard_normal(n) * 3000).astype(np.int16)
+
+
+def test_mel_filters_shape_and_coverage():
+    fb = mel_filters(80)
+    assert fb.shape == (80, 201)
+    assert (fb >= 0).all() and (fb.max(axis=1) > 0).all()
+    assert whisper_n_mels("large-v3") == 128 and whisper_n_mels("small") == 80
+
+
+def test_streaming_matches_whole_signal_for_any_chunking():
+    pcm = _pcm(16000 * 2 + 123)
+    ref = log_mel(pcm.astype(np.float32) / 32768.0, pad_samples=8000)
+    rng = np.random.default_rng(1)
+    for _ in range(3):
+        ext = StreamingLogMel(pad_ms=500)
+        i = 0
+        while i < len(pcm):
+            k = int(rng.integers(1, 1200))
+            ext.push(pcm[i:i + k])
+            i += k
+        feats = ext.finish()
+        assert feats.n_samples == len(pcm) and feats.pad_samples == 8000
+        assert feats.data.shape == ref.shape == (80, (len(pcm) + 8000) // 160)
+        assert np.allclose(feats.data, ref, atol=1e-5)
+
+
+@pytest.mark.parametrize("n_mels", [80, 128])
+def test_streaming_matches_whisper_reference(n_mels):
+    pytest.importorskip("torch")
+    whisper_audio = pytest.importorskip("whisper.audio")
+    pcm = _pcm(16000 * 3 + 517, seed=3)
+    audio = pcm.astype(np.float32) / 32768.0
+    ref = whisper_audio.log_mel_spectrogram(audio, n_mels=n_mels, padding=8000).numpy()
+
+    ext = StreamingLogMel(n_mels, pad_ms=500)
+    for i in range(0, len(pcm), 480):
+        ext.push(pcm[i:i + 480])
+    feats = ext.finish()
+    assert feats.data.shape == ref.shape
+    assert np.allclose(feats.data, ref, atol=1e-4)
+
+
+def test_short_input_and_reset():
+    ext = StreamingLogMel(pad_ms=0)
+    assert ext.finish() is None
+    ext.push(_pcm(480))
+    feats = ext.finish()
+    assert np.allclose(feats.data, log_mel(_pcm(480).astype(np.float32) / 32768.0), atol=1e-5)
+    ext.push(_pcm(320, seed=2))   # finish() reset the state
+    assert ext.finish().n_samples == 320
+
+
+def test_padded_extends_with_silence_value():
+    ext = StreamingLogMel(pad_ms=0)
+    ext.push(_pcm(1600))
+    feats = ext.finish()
+    out = feats.padded(3000)
+    assert out.shape == (80, 3000)
+    assert np.array_equal(out[:, :feats.n_frames], feats.data)
+    assert np.all(out[:, feats.n_frames:] == np.float32(feats.pad_value))
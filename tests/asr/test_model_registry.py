@@ -0,0 +1,84 @@
+# tests/asr/test_model_registry.py
+import threading
+
+from octavius.infrastructure.asr.model_registry import ModelKey, ModelRegistry
+
+MB = 1024 * 1024
+SMALL = ModelKey("faster-whisper", "small", "cpu", "int8")
+BASE = ModelKey("faster-whisper", "base", "cpu", "int8")
+TINY = ModelKey("openai", "tiny", "cpu", "float32")
+
+
+class _FakeMemory:
+    """RSS that grows by the size of each fake model while it is being loaded."""
+
+    def __init__(self):
+        self.rss = 100 * MB
+        self.loads = []
+
+    def loader(self, name, mb):
+        def load():
+            self.loads.append(name)
+            self.rss += mb * MB
+            return object()
+        return load
+
+
+def test_same_key_shares_one_model_and_counts_references():
+    mem = _FakeMemory()
+    reg = ModelRegistry(rss_fn=lambda: mem.rss)
+    a = reg.acquire(SMALL, mem.loader("small", 500))
+    b = reg.acquire(SMALL, mem.loader("small", 500))
+    assert a is b and mem.loads == ["small"]
+    (info,) = reg.stats()
+    assert info.key == SMALL and info.refs == 2 and info.rss_mb == 500
+
+    reg.release(SMALL)
+    reg.release(SMALL)
+    assert reg.stats()[0].refs == 0          # unused, still cached (no ceiling)
+    assert reg.acquire(SMALL, mem.loader("small", 500)) is a
+
+
+def test_unused_models_are_evicted_lru_under_the_ceiling():
+    mem = _FakeMemory()
+    reg = ModelRegistry(max_mb=1000, rss_fn=lambda: mem.rss)
+    reg.acquire(SMALL, mem.loader("small", 500))
+    reg.acquire(TINY, mem.loader("tiny", 100))
+    reg.release(SMALL)
+    reg.release(TINY)                         # SMALL is the least recently used
+
+    reg.acquire(BASE, mem.loader("base", 600))   # 1200 MB > 1000 → evict SMALL only
+    keys = {i.key for i in reg.stats()}
+    assert keys == {TINY, BASE}
+    assert reg.total_mb == 700
+
+
+def test_models_in_use_are_never_evicted():
+    mem = _FakeMemory()
+    reg = ModelRegistry(max_mb=100, rss_fn=lambda: mem.rss)
+    reg.acquire(SMALL, mem.loader("small", 500))
+    reg.acquire(BASE, mem.loader("base", 600))
+    assert {i.key for i in reg.stats()} == {SMALL, BASE}
+    assert not reg.evict(SMALL)
+    reg.release(SMALL)
+    assert {i.key for i in reg.stats()} == {BASE}
+
+
+def test_concurrent_acquire_loads_once():
+    mem = _FakeMemory()
+    reg = ModelRegistry(rss_fn=lambda: mem.rss)
+    gate = threading.Event()
+
+    def slow():
+        gate.wait(5)
+        return mem.loader("small", 10)()
+
+    out = []
+    threads = [threading.Thread(target=lambda: out.append(reg.acquire(SMALL, slow))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    gate.set()
+    for t in threads:
+        t.join(5)
+    assert mem.loads == ["small"] and len({id(m) for m in out}) == 1
+    assert reg.stats()[0].refs == 4
@@ -0,0 +1,77 @@
+# tests/asr/test_process_worker.py
+import os
+import time
+import numpy as np
+import pytest
+
+from octavius.config.settings import AsrSettings
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.infrastructure.asr.process_worker import ProcessASRTranscriber
+
+HANG, CRASH = 1111, 2222
+
+
+class _FakeASR:
+    """Describes the PCM it received; the first sample selects a failure mode."""
+
+    def open(self):
+        pass
+
+    def transcribe(self, segment: RecordingSegment) -> Utterance:
+        x = np.frombuffer(segment.pcm, dtype=np.int16)
+        if x[0] == HANG:
+            time.sleep(60)
+        if x[0] == CRASH:
+            os._exit(3)
+        if x[0] < 0:
+            raise ValueError("bad audio")
+        return Utterance(raw_text=f"{len(x)} {int(x.astype(np.int64).sum())}", lang=str(os.getpid()))
+
+
+def _fake_factory(settings):
+    return _FakeASR()
+
+
+def _segment(x: np.ndarray) -> RecordingSegment:
+    x = x.astype(np.int16)
+    return RecordingSegment(pcm=x.tobytes(), sample_rate=16000, channels=1, frame_ms=30,
+                            start_ms=0, end_ms=len(x) * 1000 // 16000)
+
+
+@pytest.fixture
+def asr():
+    a = ProcessASRTranscriber(AsrSettings(), factory=_fake_factory, timeout_s=1.0)
+    a.open()
+    yield a
+    a.close()
+
+
+def test_segments_round_trip_through_the_worker(asr):
+    x = np.arange(16000) % 100
+    utt = asr.transcribe(_segment(x))
+    assert asr.is_ready
+    assert utt.raw_text == f"{len(x)} {int(x.sum())}"
+    assert int(utt.lang) != os.getpid()          # decoded in another process
+
+    big = np.ones(40 * 16000)                    # larger than the initial shared block
+    assert asr.transcribe(_segment(big)).raw_text == f"{len(big)} {len(big)}"
+
+    with pytest.raises(RuntimeError, match="bad audio"):
+        asr.transcribe(_segment(np.full(10, -1)))
+    assert asr.transcribe(_segment(np.ones(5))).raw_text == "5 5"
+
+
+def test_hung_decode_times_out_and_worker_respawns(asr):
+    first_pid = asr.transcribe(_segment(np.ones(10))).lang
+    with pytest.raises(TimeoutError):
+        asr.transcribe(_segment(np.full(160, HANG)))
+    utt = asr.transcribe(_segment(np.ones(10)))
+    assert utt.raw_text == "10 10" and utt.lang != first_pid
+    assert asr.respawns == 1
+
+
+def test_crashed_worker_respawns(asr):
+    with pytest.raises(RuntimeError, match="died"):
+        asr.transcribe(_segment(np.full(10, CRASH)))
+    assert asr.transcribe(_segment(np.ones(3))).raw_text == "3 3"
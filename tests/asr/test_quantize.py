@@ -0,0 +1,56 @@
+# tests/asr/test_quantize.py
+import json
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+from octavius.infrastructure.asr.quantize import load_quantized, quantize_linear_int8, wants_int8, weights_mb
+
+
+class _CastingLinear(torch.nn.Linear):
+    """Like whisper.model.Linear: a Linear subclass with its own forward."""
+
+    def forward(self, x):
+        return torch.nn.functional.linear(x, self.weight.to(x.dtype), self.bias.to(x.dtype))
+
+
+def _model():
+    torch.manual_seed(0)
+    return torch.nn.Sequential(_CastingLinear(256, 512), torch.nn.GELU(), torch.nn.Linear(512, 256)).eval()
+
+
+def test_wants_int8_only_on_cpu():
+    assert wants_int8("cpu", "int8") and wants_int8("cpu", "int8_float32")
+    assert not wants_int8("cuda", "int8") and not wants_int8("cpu", "float32")
+
+
+def test_linear_layers_become_int8_and_stay_close():
+    model = _model()
+    x = torch.randn(4, 256)
+    with torch.no_grad():
+        ref = model(x)
+        before = weights_mb(model)
+        quantize_linear_int8(model)
+        out = model(x)
+    assert all(type(m).__module__.startswith("torch.ao.nn.quantized") for m in (model[0], model[2]))
+    assert weights_mb(model) < before / 2
+    assert torch.allclose(out, ref, atol=0.05 * ref.abs().max().item())
+
+
+def test_quantized_model_is_cached_with_a_report(tmp_path):
+    loads = []
+
+    def load_float():
+        loads.append(1)
+        return _model()
+
+    x = torch.randn(2, 256)
+    first = load_quantized("tiny-test", load_float, cache_dir=tmp_path, reference=lambda m: m(x))
+    second = load_quantized("tiny-test", load_float, cache_dir=tmp_path, reference=lambda m: m(x))
+
+    assert loads == [1]                      # second call came from disk
+    with torch.no_grad():
+        assert torch.allclose(first(x), second(x))
+    report = json.loads(next(tmp_path.glob("*.json")).read_text())
+    assert report["int8_mb"] < report["float_mb"] and report["speedup"] > 0
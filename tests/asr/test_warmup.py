@@ -0,0 +1,101 @@
+# tests/asr/test_warmup.py
+import threading
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+from octavius.infrastructure.asr.model_registry import ModelKey, get_registry
+from octavius.infrastructure.asr.warmup import BackgroundModelMixin, load_in_background, warmup_segment
+
+
+def test_load_runs_in_background_and_resolves_future():
+    release = threading.Event()
+    callers = []
+
+    def load():
+        callers.append(threading.current_thread())
+        release.wait(5)
+        return "model"
+
+    fut = load_in_background(load, name="test-load")
+    assert not fut.done()               # open() does not block on the load
+    release.set()
+    assert fut.result(timeout=5) == "model"
+    assert callers[0] is not threading.current_thread() and callers[0].daemon
+
+
+def test_load_failure_is_reported_through_the_future():
+    def load():
+        raise OSError("model not found")
+
+    fut = load_in_background(load, name="test-load")
+    with pytest.raises(OSError, match="model not found"):
+        fut.result(timeout=5)
+
+
+def test_warmup_segment_is_short_pcm16_mono():
+    seg = warmup_segment(seconds=0.5)
+    x = np.frombuffer(seg.pcm, dtype=np.int16)
+    assert seg.sample_rate == 16000 and seg.channels == 1
+    assert len(x) == 8000 and seg.duration_ms == 500
+    assert 500 < np.abs(x).max() < 32767
+
+
+def _refs(key):
+    return next((info.refs for info in get_registry().stats() if info.key == key), 0)
+
+
+class _FakeAdapter(BackgroundModelMixin):
+    _label = "fake"
+
+    def __init__(self, warmup=True, fail_warm=False):
+        self.a = SimpleNamespace(model_cache_mb=0, warmup=warmup)
+        self.fail_warm = fail_warm
+        self.loads = []
+        self.warmed = []
+
+    def _model_key(self):
+        return ModelKey("fake", f"m-{id(self)}", "cpu", "float32")
+
+    def _load_model_for(self, key):
+        self.loads.append(key)
+        return object()
+
+    def _warm(self, model):
+        if self.fail_warm:
+            raise RuntimeError("warm-up failed")
+        self.warmed.append(model)
+
+
+def test_adapter_missing_a_hook_fails_when_instantiated():
+    class _NoWarm(BackgroundModelMixin):
+        def _model_key(self):
+            return ModelKey("fake", "m", "cpu", "float32")
+
+        def _load_model_for(self, key):
+            return object()
+
+    with pytest.raises(TypeError, match="_warm"):
+        _NoWarm()
+
+
+def test_background_model_mixin_loads_warms_and_releases():
+    a = _FakeAdapter()
+    assert not a.is_ready
+    with pytest.raises(RuntimeError):
+        a._wait_model()
+    a.open()
+    model = a._wait_model()
+    assert a.is_ready and a.model is model and a.warmed == [model] and len(a.loads) == 1
+    key = a._key
+    assert _refs(key) == 1
+    a.close()
+    assert a.ready is None and a.model is None and _refs(key) == 0
+
+
+def test_failed_warmup_releases_the_model():
+    a = _FakeAdapter(fail_warm=True)
+    a.open()
+    with pytest.raises(RuntimeError, match="warm-up failed"):
+        a._wait_model()
+    assert not a.is_ready and _refs(a._key) == 0
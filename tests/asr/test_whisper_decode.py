@@ -0,0 +1,41 @@
+# tests/asr/test_whisper_decode.py
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+whisper = pytest.importorskip("whisper")
+
+from whisper.model import ModelDimensions, Whisper
+
+from octavius.infrastructure.asr.whisper_decode import decode_short, enable_variable_audio_ctx
+
+
+@pytest.fixture(scope="module")
+def model():
+    torch.manual_seed(0)
+    dims = ModelDimensions(n_mels=80, n_audio_ctx=1500, n_audio_state=64, n_audio_head=2, n_audio_layer=2,
+                           n_vocab=51865, n_text_ctx=448, n_text_state=64, n_text_head=2, n_text_layer=2)
+    m = Whisper(dims).eval()
+    enable_variable_audio_ctx(m)
+    return m
+
+
+def test_full_context_is_unchanged(model):
+    mel = torch.randn(1, 80, 3000)
+    with torch.no_grad():
+        patched = model.encoder(mel)
+        original = type(model.encoder).forward(model.encoder, mel)
+    assert torch.allclose(patched, original)
+
+
+def test_short_mel_gives_proportional_context(model):
+    with torch.no_grad():
+        feats = model.encoder(torch.randn(1, 80, 200))   # 2 s
+    assert feats.shape == (1, 100, 64)
+
+
+def test_decode_short_runs_on_the_reduced_context(model):
+    audio = (np.random.default_rng(0).standard_normal(16000) * 0.05).astype(np.float32)
+    opts = whisper.DecodingOptions(language="es", without_timestamps=True, fp16=False, sample_len=5)
+    res = decode_short(model, audio, opts)
+    assert isinstance(res.avg_logprob, float)
@@ -0,0 +1,40 @@
+# tests/audio/test_capture_counters.py
+from octavius.domain.models.capture_stats import CaptureStats
+from octavius.infrastructure.audio.capture_counters import CaptureCounters
+
+
+def test_snapshot_aggregates_reads_and_losses():
+    c = CaptureCounters()
+    c.record_read(blocked_s=0.010, latency_ms=30.0)
+    c.record_read(blocked_s=0.020, latency_ms=90.0)
+    c.record_overflow(lost_samples=480)
+    c.record_dropped(100)
+
+    s = c.snapshot(buffer_fill=0.25)
+    assert s.chunks == 2
+    assert s.overflows == 1
+    assert s.dropped_samples == 580
+    assert round(s.blocked_ms) == 30
+    assert s.read_latency_ms_avg == 60.0 and s.read_latency_ms_max == 90.0
+    assert s.buffer_fill == 0.25
+
+
+def test_since_returns_per_turn_deltas():
+    before = CaptureStats(overflows=2, dropped_samples=100, chunks=10, blocked_ms=50.0)
+    after = CaptureStats(overflows=3, dropped_samples=400, chunks=25, blocked_ms=80.0)
+    d = after.since(before)
+    assert (d.overflows, d.dropped_samples, d.chunks, d.blocked_ms) == (1, 300, 15, 30.0)
+
+
+def test_latency_avg_and_max_are_per_window():
+    c = CaptureCounters()
+    c.record_read(blocked_s=0.0, latency_ms=500.0)   # a slow start-up read
+    first = c.snapshot()
+    assert c.snapshot() == first            # reading stats does not reset anything
+    c.reset_latency_max()
+    c.record_read(blocked_s=0.0, latency_ms=20.0)
+    c.record_read(blocked_s=0.0, latency_ms=40.0)
+    d = c.snapshot().since(first)
+    assert d.chunks == 2
+    assert d.read_latency_ms_avg == 30.0
+    assert d.read_latency_ms_max == 40.0
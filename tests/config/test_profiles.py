@@ -0,0 +1,33 @@
+# tests/config/test_profiles.py
+import pytest
+import yaml
+
+from octavius.config.settings import PROFILES_DIR, AsrSettings, AudioSettings, LLMSettings, VadSettings
+
+# Values the original base.yaml already tuned away from the Settings defaults.
+_TUNED = {("vad", "aggressiveness"), ("vad", "silence_ms"), ("llm", "max_tokens"), ("llm", "system_prompt")}
+
+
+def _load(name):
+    with (PROFILES_DIR / name).open("r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+@pytest.mark.parametrize("section, model", [
+    ("audio", AudioSettings), ("asr", AsrSettings), ("vad", VadSettings), ("llm", LLMSettings),
+])
+def test_base_profile_keeps_the_settings_defaults(section, model):
+    """Optional features are switched on in device profiles, never in base.yaml."""
+    raw = _load("base.yaml")[section]
+    defaults = model()
+    for key, value in raw.items():
+        if (section, key) in _TUNED:
+            continue
+        assert getattr(model(**{key: value}), key) == getattr(defaults, key), f"{section}.{key}"
+
+
+def test_pc_profile_validates():
+    base = _load("base.yaml")
+    pc = _load("device.pc.yaml")
+    for section, model in (("audio", AudioSettings), ("asr", AsrSettings), ("vad", VadSettings), ("llm", LLMSettings)):
+        model(**{**base[section], **pc.get(section, {})})
@@ -0,0 +1,83 @@
+# tests/llm/stub_gemini.py
+"""Local HTTP/1.1 stand-in for the Gemini REST API (generateContent / streamGenerateContent)."""
+from __future__ import annotations
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+
+def _payload(text, finish=None):
+    cand = {"content": {"role": "model", "parts": [{"text": text}]}, "index": 0}
+    if finish:
+        cand["finishReason"] = finish
+    return {"candidates": [cand], "usageMetadata": {"promptTokenCount": 5, "totalTokenCount": 12},
+            "modelVersion": "gemini-2.5-flash"}
+
+
+class StubGemini:
+    """Serves canned answers; records requests and counts TCP connections."""
+
+    def __init__(self, pieces=("Hola, ", "soy Octavius."), delay_s=0.0, status=200):
+        self.pieces = list(pieces)
+        self.delay_s = delay_s
+        self.status = status
+        self.connections = 0
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                stub.connections += 1
+                super().setup()
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, code, obj):
+                body = json.dumps(obj).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                stub.requests.append(("GET", self.path, dict(self.headers), None))
+                self._send_json(200, {"name": self.path.rsplit("/", 1)[-1]})
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append(("POST", self.path, dict(self.headers), body))
+                time.sleep(stub.delay_s)
+                if stub.status != 200:
+                    self._send_json(stub.status, {"error": {"code": stub.status, "message": "boom"}})
+                elif ":streamGenerateContent" in self.path:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/event-stream")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    for i, piece in enumerate(stub.pieces):
+                        last = i == len(stub.pieces) - 1
+                        data = f"data: {json.dumps(_payload(piece, 'STOP' if last else None))}\r\n\r\n".encode()
+                        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                        self.wfile.flush()
+                        time.sleep(0.01)
+                    self.wfile.write(b"0\r\n\r\n")
+                else:
+                    self._send_json(200, _payload("".join(stub.pieces), "STOP"))
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
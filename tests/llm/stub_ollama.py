@@ -0,0 +1,74 @@
+# tests/llm/stub_ollama.py
+"""Local HTTP/1.1 stand-in for the Ollama API (/api/generate, /api/chat)."""
+from __future__ import annotations
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+
+class StubOllama:
+    """Serves canned chat answers (NDJSON when streaming); records requests, counts connections."""
+
+    def __init__(self, pieces=("Hola, ", "soy Octavius."), status=200):
+        self.pieces = list(pieces)
+        self.status = status
+        self.connections = 0
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                stub.connections += 1
+                super().setup()
+
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, code, obj):
+                body = json.dumps(obj).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.requests.append((self.path, body))
+                done = {"done": True, "done_reason": "stop", "prompt_eval_count": 7, "eval_count": 5}
+                if stub.status != 200:
+                    self._send_json(stub.status, {"error": "model not found"})
+                elif self.path == "/api/generate":
+                    self._send_json(200, {"model": body["model"], "response": "", **done, "done_reason": "load"})
+                elif not body.get("stream", True):
+                    msg = {"role": "assistant", "content": "".join(stub.pieces)}
+                    self._send_json(200, {"model": body["model"], "message": msg, **done})
+                else:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/x-ndjson")
+                    self.send_header("Transfer-Encoding", "chunked")
+                    self.end_headers()
+                    lines = [{"message": {"role": "assistant", "content": p}, "done": False} for p in stub.pieces]
+                    lines.append({"message": {"role": "assistant", "content": ""}, **done})
+                    for obj in lines:
+                        data = (json.dumps(obj) + "\n").encode()
+                        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+                        self.wfile.flush()
+                        time.sleep(0.01)
+                    self.wfile.write(b"0\r\n\r\n")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,154 @@
+# tests/llm/test_gemini_async.py
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from octavius.config.settings import LLMSettings
+from octavius.infrastructure.llm.gemini_async import AsyncGeminiClient
+from octavius.infrastructure.llm.sync_bridge import LoopThreadLLMClient
+from tests.llm.stub_gemini import StubGemini
+
+
+def _client(stub, **kw):
+    settings = LLMSettings(base_url=stub.url, system_prompt="Eres Octavius.", **kw)
+    return AsyncGeminiClient(settings, api_key="test-key")
+
+
+def test_open_prewarms_and_turns_reuse_one_connection():
+    async def run(stub):
+        c = _client(stub)
+        await c.open()
+        assert stub.connections == 1 and stub.requests[0][0] == "GET"
+        answers = [await c.agenerate("hola") for _ in range(3)]
+        await c.close()
+        return answers
+
+    with StubGemini() as stub:
+        answers = asyncio.run(run(stub))
+    assert [a.text for a in answers] == ["Hola, soy Octavius."] * 3
+    assert answers[0].usage_tokens == 12 and answers[0].finish_reason == "STOP"
+    assert stub.connections == 1
+    method, path, headers, body = stub.requests[1]
+    assert path == "/v1beta/models/gemini-2.5-flash:generateContent"
+    assert headers["x-goog-api-key"] == "test-key"
+    assert body["contents"][0]["parts"][0]["text"] == "hola"
+    assert body["systemInstruction"]["parts"][0]["text"] == "Eres Octavius."
+
+
+def test_astream_yields_sse_deltas_then_final():
+    async def run(stub):
+        c = _client(stub)
+        await c.open()
+        chunks = [ch async for ch in c.astream("hola")]
+        await c.close()
+        return chunks
+
+    with StubGemini(pieces=["Hola, ", "¿qué tal", " estás?"]) as stub:
+        chunks = asyncio.run(run(stub))
+    assert "".join(c.delta for c in chunks) == "Hola, ¿qué tal estás?"
+    assert chunks[-1].is_final and len(chunks) == 4
+    assert "alt=sse" in stub.requests[-1][1]
+
+
+def test_request_can_be_cancelled():
+    async def run(stub):
+        c = _client(stub)
+        await c.open()
+        task = asyncio.create_task(c.agenerate("hola"))
+        await asyncio.sleep(0.1)
+        t0 = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        elapsed = time.perf_counter() - t0
+        await c.close()
+        return elapsed
+
+    with StubGemini(delay_s=2.0) as stub:
+        assert asyncio.run(run(stub)) < 0.5
+
+
+def test_http_error_returns_the_fallback_answer():
+    async def run(stub):
+        c = _client(stub)
+        await c.open()
+        r = await c.agenerate("hola")
+        await c.close()
+        return r
+
+    with StubGemini(status=503) as stub:
+        assert asyncio.run(run(stub)).text
+
+
+def test_sync_bridge_for_the_turn_manager():
+    with StubGemini(pieces=["Una frase. ", "Otra frase."]) as stub:
+        llm = LoopThreadLLMClient(_client(stub))
+        llm.open()
+        try:
+            assert llm.generate("hola").text == "Una frase. Otra frase."
+            chunks = list(llm.stream("hola"))
+            assert "".join(c.delta for c in chunks) == "Una frase. Otra frase." and chunks[-1].is_final
+            first = next(iter(llm.stream("hola")))   # abandoning the iterator cancels the request
+            assert first.delta == "Una frase. "
+            assert llm.generate("otra vez").text == "Una frase. Otra frase."
+        finally:
+            llm.close()
+    assert stub.connections <= 2
+
+
+def test_hedged_clients_against_stub_servers():
+    from octavius.infrastructure.llm.hedged import HedgedLLMClient
+
+    async def run(slow, fast):
+        primary = AsyncGeminiClient(LLMSettings(base_url=slow.url), api_key="test-key", fallback_text=None)
+        lite = AsyncGeminiClient(LLMSettings(base_url=fast.url), api_key="test-key",
+                                 model="gemini-2.5-flash-lite", enable_search=False, thinking_budget=0,
+                                 fallback_text=None)
+        h = HedgedLLMClient(primary, lite, hedge_after_ms=100, deadline_ms=3000)
+        await h.open()
+        chunks = [ch async for ch in h.astream("hola")]
+        await h.close()
+        return chunks, h.stats()
+
+    with StubGemini(delay_s=1.0) as slow, StubGemini(pieces=["Rápido."]) as fast:
+        chunks, stats = asyncio.run(run(slow, fast))
+    assert "".join(c.delta for c in chunks) == "Rápido."
+    assert stats.fast_wins == 1
+    body = fast.requests[-1][3]
+    assert "tools" not in body and body["generationConfig"]["thinkingConfig"]["thinkingBudget"] == 0
+    assert "gemini-2.5-flash-lite:streamGenerateContent" in fast.requests[-1][1]
+
+
+def test_errors_raise_without_fallback_text():
+    async def run(stub):
+        c = AsyncGeminiClient(LLMSettings(base_url=stub.url), api_key="k", fallback_text=None)
+        await c.open()
+        try:
+            await c.agenerate("hola")
+        finally:
+            await c.close()
+
+    with StubGemini(status=500) as stub:
+        with pytest.raises(Exception):
+            asyncio.run(run(stub))
+
+
+def test_options_shape_the_request_body():
+    from octavius.domain.models.llm_objects import GenerationOptions
+
+    async def run(stub):
+        c = _client(stub)
+        await c.open()
+        await c.agenerate("hola", options=GenerationOptions(grounding=False, thinking=False))
+        await c.agenerate("¿qué noticias hay?", options=GenerationOptions(grounding=True, thinking=True))
+        await c.close()
+
+    with StubGemini() as stub:
+        asyncio.run(run(stub))
+    quick, grounded = stub.requests[-2][3], stub.requests[-1][3]
+    assert "tools" not in quick and quick["generationConfig"]["thinkingConfig"]["thinkingBudget"] == 0
+    assert grounded["tools"] == [{"google_search": {}}]
+    assert grounded["generationConfig"]["thinkingConfig"]["thinkingBudget"] == 50
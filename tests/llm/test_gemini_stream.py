@@ -0,0 +1,59 @@
+# tests/llm/test_gemini_stream.py
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.genai")
+
+from google.genai import types
+
+from octavius.config.settings import LLMSettings
+from octavius.infrastructure.llm.gemini import GeminiClient
+
+
+class _Models:
+    def __init__(self, pieces, fail_after=None):
+        self.pieces = pieces
+        self.fail_after = fail_after
+        self.calls = []
+
+    def generate_content_stream(self, *, model, contents, config):
+        self.calls.append((model, contents))
+        for i, p in enumerate(self.pieces):
+            if self.fail_after is not None and i == self.fail_after:
+                raise RuntimeError("connection reset")
+            yield SimpleNamespace(text=p, candidates=[])
+
+
+def _client(models):
+    c = GeminiClient(LLMSettings())
+    c._client = SimpleNamespace(models=models)
+    c._types = types
+    return c
+
+
+def test_stream_uses_the_sdk_streaming_call_and_keeps_spacing():
+    models = _Models(["Hola, ", "¿qué tal", " estás?"])
+    chunks = list(_client(models).stream("  hola  "))
+
+    assert models.calls == [("gemini-2.5-flash", "hola")]
+    assert "".join(c.delta for c in chunks) == "Hola, ¿qué tal estás?"
+    assert [c.index for c in chunks] == [0, 1, 2, 3]
+    assert chunks[-1].is_final and not any(c.is_final for c in chunks[:-1])
+
+
+def test_stream_failure_before_any_text_yields_the_fallback():
+    chunks = list(_client(_Models(["x"], fail_after=0)).stream("hola"))
+    assert chunks[0].delta and chunks[-1].is_final and len(chunks) == 2
+
+
+def test_options_switch_off_search_and_thinking():
+    from octavius.domain.models.llm_objects import GenerationOptions
+
+    c = _client(_Models([]))
+    default = c._build_config(None)
+    quick = c._build_config(None, GenerationOptions(grounding=False, thinking=False))
+    grounded = c._build_config(None, GenerationOptions(grounding=True, thinking=False))
+    assert default.tools and default.thinking_config.thinking_budget == 50
+    assert not quick.tools and quick.thinking_config.thinking_budget == 0
+    assert grounded.tools and grounded.thinking_config.thinking_budget == 0
@@ -0,0 +1,125 @@
+# tests/llm/test_hedged.py
+import asyncio
+
+import pytest
+
+from octavius.domain.models.llm_objects import FALLBACK_TEXT, LLMChunk, LLMResponse
+from octavius.infrastructure.llm.hedged import HedgedLLMClient
+
+
+class FakeAsyncLLM:
+    """First chunk after `delay_s` (or an error); records starts and cancellations."""
+
+    def __init__(self, text, delay_s=0.0, fail=False):
+        self.text, self.delay_s, self.fail = text, delay_s, fail
+        self.started = 0
+        self.cancelled = 0
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def agenerate(self, prompt, system_prompt=None):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay_s)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError("boom")
+        return LLMResponse(text=self.text)
+
+    async def astream(self, prompt, system_prompt=None):
+        self.started += 1
+        try:
+            await asyncio.sleep(self.delay_s)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError("boom")
+        words = self.text.split(" ")
+        for i, w in enumerate(words):
+            yield LLMChunk(delta=w if i == 0 else " " + w, index=i)
+        yield LLMChunk(delta="", index=len(words), is_final=True)
+
+
+def _hedged(primary, fast, hedge_ms=50, deadline_ms=400):
+    return HedgedLLMClient(primary, fast, hedge_after_ms=hedge_ms, deadline_ms=deadline_ms, names=("pro", "lite"))
+
+
+def _collect(client):
+    async def run():
+        return [c async for c in client.astream("hola")]
+    return asyncio.run(run())
+
+
+def test_fast_primary_is_not_hedged():
+    primary, fast = FakeAsyncLLM("respuesta larga"), FakeAsyncLLM("corta")
+    h = _hedged(primary, fast)
+    chunks = _collect(h)
+    assert "".join(c.delta for c in chunks) == "respuesta larga" and chunks[-1].is_final
+    assert fast.started == 0
+    st = h.stats()
+    assert (st.calls, st.hedged, st.fast_wins, st.deadline_misses) == (1, 0, 0, 0)
+    assert h.latency.count("pro") == 1
+
+
+def test_slow_primary_is_hedged_and_cancelled():
+    primary, fast = FakeAsyncLLM("respuesta larga", delay_s=1.0), FakeAsyncLLM("corta", delay_s=0.01)
+    h = _hedged(primary, fast)
+    chunks = _collect(h)
+    assert "".join(c.delta for c in chunks) == "corta"
+    assert primary.cancelled == 1
+    st = h.stats()
+    assert (st.hedged, st.fast_wins) == (1, 1) and st.fast_win_rate == 1.0
+    assert h.latency.percentiles("lite")[50] >= 50
+
+
+def test_primary_can_still_win_after_hedge():
+    primary, fast = FakeAsyncLLM("respuesta larga", delay_s=0.08), FakeAsyncLLM("corta", delay_s=1.0)
+    h = _hedged(primary, fast)
+    response = asyncio.run(h.agenerate("hola"))
+    assert response.text == "respuesta larga"
+    assert fast.cancelled == 1
+    assert (h.stats().hedged, h.stats().fast_wins) == (1, 0)
+
+
+def test_deadline_returns_fallback():
+    primary, fast = FakeAsyncLLM("a", delay_s=2.0), FakeAsyncLLM("b", delay_s=2.0)
+    h = _hedged(primary, fast, hedge_ms=20, deadline_ms=100)
+    chunks = _collect(h)
+    assert chunks[0].delta == FALLBACK_TEXT and chunks[-1].is_final and len(chunks) == 2
+    assert primary.cancelled == 1 and fast.cancelled == 1
+    assert h.stats().deadline_misses == 1
+
+
+def test_primary_error_hedges_immediately():
+    primary, fast = FakeAsyncLLM("a", fail=True), FakeAsyncLLM("corta")
+    h = _hedged(primary, fast, hedge_ms=5000, deadline_ms=10000)
+    response = asyncio.run(h.agenerate("hola"))
+    assert response.text == "corta" and fast.started == 1
+
+
+def test_empty_stream_does_not_win_the_race():
+    primary, fast = FakeAsyncLLM(""), FakeAsyncLLM("corta", delay_s=0.01)
+    h = _hedged(primary, fast, hedge_ms=5000, deadline_ms=10000)
+    chunks = _collect(h)
+    assert "".join(c.delta for c in chunks) == "corta" and chunks[-1].is_final
+    assert fast.started == 1 and h.stats().fast_wins == 1
+
+
+def test_empty_answers_from_both_end_in_the_fallback():
+    h = _hedged(FakeAsyncLLM(""), FakeAsyncLLM(""), hedge_ms=5000, deadline_ms=10000)
+    assert asyncio.run(h.agenerate("hola")).finish_reason == "DEADLINE"
+    chunks = _collect(h)
+    assert chunks[0].delta and chunks[-1].is_final
+    assert h.stats().deadline_misses == 2
+
+
+def test_invalid_budget():
+    with pytest.raises(ValueError):
+        HedgedLLMClient(FakeAsyncLLM("a"), FakeAsyncLLM("b"), hedge_after_ms=500, deadline_ms=500)
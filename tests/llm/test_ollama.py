@@ -0,0 +1,61 @@
+# tests/llm/test_ollama.py
+import pytest
+
+pytest.importorskip("httpx")
+
+from octavius.config.settings import LLMSettings
+from octavius.infrastructure.llm.ollama import OllamaClient
+from tests.llm.stub_ollama import StubOllama
+
+
+def _client(stub, **kw):
+    settings = LLMSettings(provider="ollama", model="llama3.2:3b", ollama_url=stub.url,
+                           system_prompt="Eres Octavius.", keep_alive="1h", **kw)
+    return OllamaClient(settings)
+
+
+def test_open_loads_model_and_turns_reuse_one_connection():
+    with StubOllama() as stub:
+        c = _client(stub)
+        c.open()
+        assert stub.requests[0] == ("/api/generate", {"model": "llama3.2:3b", "keep_alive": "1h"})
+        answers = [c.generate("hola") for _ in range(3)]
+        c.close()
+    assert [a.text for a in answers] == ["Hola, soy Octavius."] * 3
+    assert answers[0].usage_tokens == 12 and answers[0].finish_reason == "stop"
+    assert stub.connections == 1
+    path, body = stub.requests[1]
+    assert path == "/api/chat" and body["stream"] is False and body["keep_alive"] == "1h"
+    assert body["messages"] == [{"role": "system", "content": "Eres Octavius."},
+                                {"role": "user", "content": "hola"}]
+    assert body["options"]["num_predict"] == 350
+
+
+def test_stream_yields_ndjson_deltas_then_final():
+    with StubOllama(pieces=["Hola, ", "¿qué tal", " estás?"]) as stub:
+        c = _client(stub)
+        c.open()
+        chunks = list(c.stream("hola"))
+        again = list(c.stream("otra"))
+        c.close()
+    assert "".join(ch.delta for ch in chunks) == "Hola, ¿qué tal estás?"
+    assert chunks[-1].is_final and len(chunks) == 4 and [ch.index for ch in chunks] == [0, 1, 2, 3]
+    assert len(again) == 4 and stub.connections == 1
+    assert stub.requests[-1][1]["stream"] is True
+
+
+def test_errors_fall_back_to_a_short_reply():
+    with StubOllama(status=404) as stub:
+        c = _client(stub)
+        c.open()                       # a failed warm-up is not fatal
+        response = c.generate("hola")
+        chunks = list(c.stream("hola"))
+        c.close()
+    assert response.text
+    assert chunks[0].delta and chunks[-1].is_final and len(chunks) == 2
+
+
+def test_requires_open():
+    c = OllamaClient(LLMSettings(provider="ollama"))
+    with pytest.raises(RuntimeError):
+        c.generate("hola")
@@ -0,0 +1,84 @@
+# tests/services/fakes/turn_manager_fakes.py
+import time
+from typing import List, Optional, Sequence, Union
+
+from octavius.domain.models.llm_objects import LLMChunk, LLMResponse
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+
+
+class FakeAudio:
+    """AudioSource without frames or capture stats (TurnManager logs that and moves on)."""
+
+    def capture_stream(self):
+        return iter(())
+
+    def stats(self):
+        raise RuntimeError("no stats")
+
+
+class FakeVad:
+    """capture_until_silence() returns 100 ms of speech that ended just now."""
+
+    def capture_until_silence(self, frames):
+        now = time.monotonic()
+        return RecordingSegment(pcm=b"\x01\x00" * 1600, sample_rate=16000, channels=1, frame_ms=30,
+                                start_ms=0, end_ms=100, captured_at=now - 0.1, ended_at=now, endpoint_at=now)
+
+
+class FakeAsr:
+    """Returns the same transcript for every segment (an Utterance, or a text in Spanish)."""
+
+    def __init__(self, utt: Union[Utterance, str]):
+        self.utt = Utterance(raw_text=utt, lang="es") if isinstance(utt, str) else utt
+        self.calls: List[RecordingSegment] = []
+
+    def transcribe(self, segment):
+        self.calls.append(segment)
+        return self.utt
+
+
+class FakeLlm:
+    """LLMClient answering `text`; records prompts. Knows nothing of per-turn options."""
+
+    def __init__(self, text: str = "ok"):
+        self.text = text
+        self.prompts: List[str] = []
+
+    def generate(self, prompt, system_prompt=None):
+        self.prompts.append(prompt)
+        return LLMResponse(text=self.text)
+
+
+class FakeStreamingLlm:
+    """LLMClient streaming `deltas` 10 ms apart; generate() must not be used."""
+
+    def __init__(self, deltas: Sequence[str]):
+        self.deltas = list(deltas)
+
+    def generate(self, prompt, system_prompt=None):  # pragma: no cover - must not be used
+        raise AssertionError("generate() called in streaming mode")
+
+    def stream(self, prompt, system_prompt=None):
+        for i, d in enumerate(self.deltas):
+            time.sleep(0.01)
+            yield LLMChunk(delta=d, index=i)
+        yield LLMChunk(delta="", index=len(self.deltas), is_final=True)
+
+
+class FakeHistory:
+    """ConversationHistory keeping turns in a list; the prompt joins their texts."""
+
+    def __init__(self):
+        self.turns = []
+
+    def append(self, turn):
+        self.turns.append(turn)
+
+    def build_context(self, max_tokens):
+        history = self
+
+        class _Ctx:
+            def to_prompt(self):
+                return " | ".join(t.text for t in history.turns)
+        return _Ctx()
@@ -0,0 +1,80 @@
+# tests/services/test_chunked_transcriber.py
+import threading
+import numpy as np
+
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.domain.models.vad_event import SpeechChunk
+from octavius.domain.services.chunked_transcriber import ChunkedTranscriber, stitch_transcripts
+
+RATE = 16000
+WORD = int(0.4 * RATE)
+GAP = int(0.15 * RATE)
+
+
+class _WordASR:
+    """Fake ASR: every constant non-zero run of samples is the word w<value - 1000>."""
+
+    def __init__(self):
+        self.calls = []
+        self.threads = set()
+
+    def transcribe(self, segment: RecordingSegment) -> Utterance:
+        self.calls.append(segment)
+        self.threads.add(threading.get_ident())
+        x = np.frombuffer(segment.pcm, dtype=np.int16)
+        words, prev = [], 0
+        for v in x[np.flatnonzero(np.diff(x, prepend=0))]:
+            if v and v != prev:
+                words.append(f"w{int(v) - 1000}")
+            prev = v
+        return Utterance(raw_text=" ".join(words), lang="es")
+
+
+def _speech(n_words: int) -> np.ndarray:
+    parts = []
+    for i in range(n_words):
+        parts += [np.full(WORD, 1000 + i, dtype=np.int16), np.zeros(GAP, dtype=np.int16)]
+    return np.concatenate(parts)
+
+
+def _feed(chunker: ChunkedTranscriber, sig: np.ndarray, step: int = 480 * 4) -> None:
+    for i in range(0, len(sig), step):
+        chunker.on_event(SpeechChunk(pcm=sig[i:i + step].tobytes(), offset_ms=i * 1000 // RATE))
+
+
+def test_long_speech_is_chunked_while_feeding_and_stitched():
+    asr = _WordASR()
+    chunker = ChunkedTranscriber(asr, sample_rate=RATE, frame_ms=30, chunk_seconds=4,
+                                 overlap_ms=700, search_ms=1000)
+    sig = _speech(40)                          # 22 s
+    _feed(chunker, sig)
+    assert chunker.submitted == 5              # submitted before the speech ended
+    utt = chunker.finish()
+
+    assert utt.raw_text == " ".join(f"w{i}" for i in range(40))
+    assert utt.lang == "es"
+    assert threading.get_ident() not in asr.threads
+    # chunks are cut in silence and overlap the previous one
+    for prev, nxt in zip(asr.calls, asr.calls[1:]):
+        assert nxt.start_ms < prev.end_ms
+        assert sig[prev.end_ms * RATE // 1000] == 0
+    chunker.close()
+
+
+def test_short_speech_is_a_single_chunk():
+    asr = _WordASR()
+    chunker = ChunkedTranscriber(asr, sample_rate=RATE, frame_ms=30, chunk_seconds=10)
+    _feed(chunker, _speech(3))
+    assert chunker.submitted == 0
+    assert chunker.finish().raw_text == "w0 w1 w2"
+    assert len(asr.calls) == 1
+    assert chunker.finish().raw_text == ""     # state is reset after finish()
+    chunker.close()
+
+
+def test_stitch_drops_repeated_words_ignoring_case_and_punctuation():
+    assert stitch_transcripts(["Hola, me llamo Ana y", "Ana y vivo en Madrid.", "en Madrid. Gracias"]) \
+        == "Hola, me llamo Ana y vivo en Madrid. Gracias"
+    assert stitch_transcripts(["uno dos", "tres cuatro"]) == "uno dos tres cuatro"
+    assert stitch_transcripts(["", "hola"]) == "hola"
@@ -0,0 +1,78 @@
+# tests/services/test_query_classifier.py
+import pytest
+
+from octavius.domain.services.query_classifier import QueryClassifier
+from octavius.domain.services.turn_manager import TurnManager
+from tests.services.fakes.turn_manager_fakes import FakeAsr, FakeAudio, FakeHistory, FakeLlm, FakeVad
+
+
+@pytest.mark.parametrize("text", [
+    "Hola, ¿qué tal estás?",
+    "Gracias, eres muy amable",
+    "Cuéntame un chiste",
+    "Me llamo Ana",
+    "How are you doing?",
+])
+def test_small_talk_needs_neither(text):
+    opts = QueryClassifier().classify(text)
+    assert not opts.grounding and not opts.thinking and opts.reason == "chit-chat"
+    assert opts.label == "ungrounded"
+
+
+@pytest.mark.parametrize("text, reason", [
+    ("¿Qué noticias hay esta mañana?", "news"),
+    ("¿Qué día es hoy?", "date"),
+    ("¿Qué hora es?", "date"),
+    ("What time is it in Tokyo?", "date"),
+    ("¿Va a llover en Sevilla?", "weather"),
+    ("¿A cuánto cotiza el bitcoin?", "price"),
+    ("¿Quién ganó el partido del Betis?", "sports"),
+    ("¿Cuál es la capital de Australia?", "fact"),
+    ("¿Cuándo nació Cervantes?", "fact"),
+    ("Who won the last election?", "fact"),
+])
+def test_fresh_facts_need_grounding(text, reason):
+    opts = QueryClassifier().classify(text)
+    assert opts.grounding and opts.reason.startswith(reason)
+
+
+@pytest.mark.parametrize("text", ["¿Cuánto es 12 por 7?", "Explícame por qué el cielo es azul", "compare tea and coffee"])
+def test_reasoning_needs_thinking(text):
+    opts = QueryClassifier().classify(text)
+    assert opts.thinking and not opts.grounding
+
+
+def test_custom_rules():
+    c = QueryClassifier(grounding=[("recipe", r"\breceta\b")], thinking=[])
+    assert c.classify("Dame una receta de paella").grounding
+    assert not c.classify("¿Qué noticias hay?").grounding
+
+
+class _OptionsLlm(FakeLlm):
+    def __init__(self):
+        super().__init__()
+        self.options = []
+
+    def generate(self, prompt, system_prompt=None, options=None):
+        self.options.append(options)
+        return super().generate(prompt, system_prompt)
+
+
+def test_turn_manager_passes_the_decision_to_the_llm(caplog):
+    llm = _OptionsLlm()
+    caplog.set_level("INFO")
+    for text in ("hola, ¿cómo estás?", "¿qué noticias hay hoy?"):
+        tm = TurnManager(audio=FakeAudio(), vad=FakeVad(), asr=FakeAsr(text), llm_client=llm, history=FakeHistory(),
+                         classifier=QueryClassifier())
+        result = tm.run_once()
+        assert result.llm_options is llm.options[-1]
+    assert [o.grounding for o in llm.options] == [False, True]
+    assert any("[llm] grounded thinking=off (news)" in r.getMessage() for r in caplog.records)
+
+
+def test_without_classifier_no_options_reach_the_llm():
+    llm = FakeLlm()   # its generate() has no `options` parameter
+    tm = TurnManager(audio=FakeAudio(), vad=FakeVad(), asr=FakeAsr("¿qué noticias hay?"), llm_client=llm,
+                     history=FakeHistory())
+    result = tm.run_once()
+    assert result.llm_options is None and result.llm_text == "ok" and len(llm.prompts) == 1
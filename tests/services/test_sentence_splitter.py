@@ -0,0 +1,28 @@
+# tests/services/test_sentence_splitter.py
+from octavius.domain.services.sentence_splitter import SentenceSplitter
+
+
+def _split(text, step, **kw):
+    s = SentenceSplitter(**kw)
+    out = []
+    for i in range(0, len(text), step):
+        out += s.push(text[i:i + step])
+    rest = s.flush()
+    return out + ([rest] if rest else [])
+
+
+def test_sentences_are_independent_of_delta_size():
+    text = "Hola, soy Octavius. Hoy hace sol en Madrid, ¿quieres saber más? ¡Perfecto! Hasta luego"
+    expected = ["Hola, soy Octavius.", "Hoy hace sol en Madrid, ¿quieres saber más?", "¡Perfecto! Hasta luego"]
+    for step in (1, 3, 7, len(text)):
+        assert _split(text, step) == expected
+
+
+def test_abbreviations_decimals_and_newlines():
+    text = "El Sr. García pesa 72.5 kilos, p. ej. hoy.\nSegunda línea sin punto final"
+    assert _split(text, 4) == ["El Sr. García pesa 72.5 kilos, p. ej. hoy.", "Segunda línea sin punto final"]
+
+
+def test_short_pieces_merge_into_the_next_sentence():
+    assert _split("Sí. Claro que puedo ayudarte. Vale.", 5) == ["Sí. Claro que puedo ayudarte.", "Vale."]
+    assert _split("Sí. Vale.", 5, min_chars=1) == ["Sí.", "Vale."]
@@ -0,0 +1,61 @@
+# tests/services/test_transcript_gate.py
+import math
+
+from octavius.domain.models.asr_stats import AsrStats
+from octavius.domain.models.utterance import Utterance
+from octavius.domain.services.transcript_gate import TranscriptGate
+from octavius.domain.services.turn_manager import TurnManager
+from tests.services.fakes.turn_manager_fakes import FakeAsr, FakeAudio, FakeHistory, FakeLlm, FakeVad
+
+
+def _utt(text, conf=None):
+    return Utterance(raw_text=text, lang="es", asr_confidence=conf)
+
+
+def test_confidence_from_stats():
+    s = AsrStats(avg_logprob=-0.2, no_speech_prob=0.1, compression_ratio=1.2)
+    assert math.isclose(s.confidence, math.exp(-0.2) * 0.9)
+    assert AsrStats(avg_logprob=-5.0, no_speech_prob=0.99, compression_ratio=1.0).confidence < 0.01
+
+
+def test_accepts_normal_speech():
+    gate = TranscriptGate()
+    assert gate.check(_utt("¿Qué tiempo hace mañana en Madrid?", 0.8)).accepted
+    assert gate.check(_utt("gracias", None)).accepted   # no confidence reported: text checks only
+
+
+def test_rejects_empty_and_low_confidence():
+    gate = TranscriptGate(min_confidence=0.3)
+    assert gate.check(_utt("  ...  ")).reason == "empty"
+    d = gate.check(_utt("enciende la luz", 0.1))
+    assert not d.accepted and d.reason.startswith("confidence")
+
+
+def test_rejects_hallucinations_and_loops():
+    gate = TranscriptGate()
+    for text in ("Subtítulos realizados por la comunidad de Amara.org",
+                 "¡Gracias por ver el video!",
+                 "Thank you for watching.",
+                 "[Música]"):
+        assert not gate.check(_utt(text, 0.9)).accepted, text
+    d = gate.check(_utt("sí sí sí sí sí", 0.9))
+    assert d.reason == "repetition"
+
+
+def _manager(utt, llm, history):
+    return TurnManager(audio=FakeAudio(), vad=FakeVad(), asr=FakeAsr(utt), llm_client=llm,
+                       history=history, gate=TranscriptGate())
+
+
+def test_turn_manager_skips_llm_for_rejected_transcript():
+    llm, history = FakeLlm(), FakeHistory()
+    result = _manager(_utt("Thanks for watching!", 0.9), llm, history).run_once()
+    assert result.llm_text is None and result.rejected
+    assert llm.prompts == [] and history.turns == []
+
+
+def test_turn_manager_passes_accepted_transcript():
+    llm, history = FakeLlm(), FakeHistory()
+    result = _manager(_utt("pon música tranquila", 0.9), llm, history).run_once()
+    assert result.llm_text == "ok" and result.rejected is None
+    assert len(llm.prompts) == 1 and len(history.turns) == 2
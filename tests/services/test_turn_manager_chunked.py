@@ -0,0 +1,86 @@
+# tests/services/test_turn_manager_chunked.py
+import numpy as np
+
+from octavius.domain.models.mel_features import MelFeatures
+from octavius.domain.models.recording_segment import RecordingSegment
+from octavius.domain.models.utterance import Utterance
+from octavius.domain.models.vad_event import EndReason, SpeechChunk, SpeechEnd, SpeechStart
+from octavius.domain.services.chunked_transcriber import ChunkedTranscriber
+from octavius.domain.services.turn_manager import TurnManager
+from tests.services.fakes.turn_manager_fakes import FakeAudio, FakeHistory, FakeLlm
+
+RATE = 16000
+
+
+class _ScriptedVad:
+    """stream_events() replays one scripted segment per call: (reason, speech_ms, trailing_silence_ms)."""
+
+    def __init__(self, script, with_features=False):
+        self.script = list(script)
+        self.with_features = with_features
+        self.calls = 0
+        self.t = 0
+
+    def stream_events(self, frames):
+        reason, speech_ms, silence_ms = self.script[self.calls]
+        self.calls += 1
+        pcm = np.full(speech_ms * RATE // 1000, 1000 + self.calls, dtype=np.int16).tobytes()
+        start = self.t
+        self.t += speech_ms + silence_ms
+        if pcm:
+            yield SpeechStart(timestamp_ms=start)
+            yield SpeechChunk(pcm=pcm, offset_ms=0)
+        n = len(pcm) // 2
+        feats = None
+        if self.with_features and n:
+            feats = MelFeatures(data=np.zeros((80, n // 160 + 1), dtype=np.float32), n_samples=n,
+                                pad_samples=0, pad_value=-1.5)
+        seg = RecordingSegment(pcm=pcm, sample_rate=RATE, channels=1, frame_ms=30,
+                               start_ms=start, end_ms=start + speech_ms, features=feats)
+        yield SpeechEnd(reason=reason, segment=seg, trailing_silence_ms=silence_ms)
+
+
+class _SegmentsASR:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, segment):
+        self.calls.append(segment)
+        return Utterance(raw_text=f"{len(segment.pcm) // 2} muestras", lang="es")
+
+
+def _run(script, with_features=False):
+    vad, asr = _ScriptedVad(script, with_features), _SegmentsASR()
+    chunker = ChunkedTranscriber(asr, sample_rate=RATE, frame_ms=30, chunk_seconds=30)
+    tm = TurnManager(audio=FakeAudio(), vad=vad, asr=asr, llm_client=FakeLlm(), history=FakeHistory(),
+                     chunker=chunker)
+    try:
+        return tm.run_once(), vad, asr
+    finally:
+        chunker.close()
+
+
+def test_cut_while_speaking_continues_the_turn():
+    result, vad, _ = _run([(EndReason.MAX_LENGTH, 1000, 0), (EndReason.SILENCE, 500, 600)])
+    assert vad.calls == 2
+    assert result.asr_text == f"{RATE * 3 // 2} muestras"     # both segments, one transcription
+    assert result.segment_ms == 1500
+
+
+def test_cut_in_trailing_silence_ends_the_turn():
+    result, vad, _ = _run([(EndReason.MAX_LENGTH, 1000, 450), (EndReason.MAX_LENGTH, 0, 0)])
+    assert vad.calls == 1
+    assert result.asr_text == f"{RATE} muestras"
+    assert result.segment_ms == 1000
+
+
+def test_streamed_features_reach_the_asr():
+    _, _, asr = _run([(EndReason.SILENCE, 1000, 600)], with_features=True)
+    (segment,) = asr.calls
+    assert segment.features is not None and segment.features.n_samples == len(segment.pcm) // 2
+
+
+def test_features_are_dropped_when_the_turn_spans_segments():
+    _, _, asr = _run([(EndReason.MAX_LENGTH, 1000, 0), (EndReason.SILENCE, 500, 600)], with_features=True)
+    (segment,) = asr.calls
+    assert segment.features is None and len(segment.pcm) // 2 == RATE * 3 // 2
@@ -0,0 +1,21 @@
+# tests/services/test_turn_manager_streaming.py
+from octavius.domain.services.turn_manager import TurnManager
+from tests.services.fakes.turn_manager_fakes import FakeAsr, FakeAudio, FakeHistory, FakeStreamingLlm, FakeVad
+
+DELTAS = ["Claro, ", "aquí tienes una ", "historia corta. Había", " una vez un ", "emperador."]
+
+
+def test_streaming_turn_emits_sentences_and_records_first_token_times():
+    sentences = []
+    history = FakeHistory()
+    tm = TurnManager(audio=FakeAudio(), vad=FakeVad(), asr=FakeAsr("cuéntame algo"),
+                     llm_client=FakeStreamingLlm(DELTAS), history=history,
+                     llm_streaming=True, on_sentence=sentences.append)
+
+    result = tm.run_once()
+
+    assert sentences == ["Claro, aquí tienes una historia corta.", "Había una vez un emperador."]
+    assert result.llm_text == "Claro, aquí tienes una historia corta. Había una vez un emperador."
+    assert history.turns[-1].text == result.llm_text
+    assert result.ttft_ms is not None and result.ttfs_ms is not None
+    assert result.ttft_ms <= result.ttfs_ms <= result.llm_done_ms
@@ -0,0 +1,25 @@
+import pytest
+
+from octavius.utils.latency import LatencyRecorder
+
+
+def test_percentiles_over_window():
+    rec = LatencyRecorder(window=100)
+    for ms in range(1, 201):
+        rec.record("flash", ms)
+    assert rec.count("flash") == 100            # only the last 100 samples are kept
+    p = rec.percentiles("flash")
+    assert p[50] == pytest.approx(150.5) and p[99] == pytest.approx(199.01)
+    assert rec.percentiles("lite") == {}
+
+
+def test_summary_lists_every_name():
+    rec = LatencyRecorder()
+    rec.record("b", 10)
+    rec.record("a", 20)
+    assert rec.summary(qs=(50,)) == "a: n=1 p50=20ms; b: n=1 p50=10ms"
+
+
+def test_window_must_be_positive():
+    with pytest.raises(ValueError):
+        LatencyRecorder(window=0)
@@ -0,0 +1,40 @@
+# tests/utils/test_resampler.py
+import numpy as np
+import pytest
+from octavius.utils.resampler import StreamingResampler, resample_once
+
+
+def _signal(rate: int, seconds: float = 0.5) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    return (rng.standard_normal(int(rate * seconds)) * 3000).astype(np.int16)
+
+
+@pytest.mark.parametrize("src,dst", [(48000, 16000), (44100, 16000), (8000, 16000)])
+def test_chunked_stream_matches_whole_signal_resample_poly(src, dst):
+    signal = pytest.importorskip("scipy.signal")
+    x = _signal(src)
+    ref = np.clip(np.round(signal.resample_poly(x.astype(np.float64), dst, src)), -32768, 32767)
+
+    rs = StreamingResampler(src, dst)
+    step = int(src * 0.03)
+    parts = [rs.process(x[i:i + step]).copy() for i in range(0, len(x), step)]
+    parts.append(rs.flush().copy())
+    y = np.concatenate(parts)
+
+    assert len(y) == len(ref)
+    assert np.abs(y.astype(np.int32) - ref.astype(np.int32)).max() <= 1
+
+
+def test_output_buffer_is_reused_between_calls():
+    rs = StreamingResampler(48000, 16000)
+    x = _signal(48000, 0.03)
+    rs.process(x)  # first chunk is shorter (filter delay)
+    a = rs.process(x)
+    b = rs.process(x)
+    assert np.shares_memory(a, b)
+
+
+def test_same_rate_is_passthrough():
+    x = _signal(16000, 0.01)
+    assert StreamingResampler(16000, 16000).process(x) is x
+    assert resample_once(x, 16000, 16000) is x
@@ -0,0 +1,48 @@
+# tests/utils/test_ring_buffer.py
+import threading
+import numpy as np
+from octavius.utils.ring_buffer import Int16RingBuffer
+
+
+def test_write_read_wraps_around_and_preserves_order():
+    ring = Int16RingBuffer(capacity=8)
+    out = np.empty(3, dtype=np.int16)
+    for start in range(0, 30, 3):
+        assert ring.write(np.arange(start, start + 3, dtype=np.int16)) == 0
+        assert ring.read_into(out, timeout=0)
+        assert out.tolist() == [start, start + 1, start + 2]
+    assert ring.available == 0
+
+
+def test_full_ring_drops_newest_samples_and_counts_them():
+    ring = Int16RingBuffer(capacity=4)
+    assert ring.write(np.arange(3, dtype=np.int16)) == 0
+    assert ring.write(np.arange(10, 13, dtype=np.int16)) == 2
+    assert ring.dropped_samples == 2
+    assert ring.fill_ratio == 1.0
+    out = np.empty(4, dtype=np.int16)
+    assert ring.read_into(out, timeout=0)
+    assert out.tolist() == [0, 1, 2, 10]
+
+
+def test_read_times_out_when_producer_is_idle():
+    ring = Int16RingBuffer(capacity=16)
+    ring.write(np.ones(2, dtype=np.int16))
+    out = np.empty(4, dtype=np.int16)
+    assert ring.read_into(out, timeout=0.01) is False
+    assert ring.available == 2
+
+
+def test_reader_wakes_up_when_producer_writes_from_another_thread():
+    ring = Int16RingBuffer(capacity=1024)
+    out = np.empty(600, dtype=np.int16)
+
+    def produce():
+        for i in range(10):
+            ring.write(np.full(100, i, dtype=np.int16))
+
+    t = threading.Thread(target=produce)
+    t.start()
+    assert ring.read_into(out, timeout=2.0)
+    t.join()
+    assert out[:100].tolist() == [0] * 100 and out[-1] == 5
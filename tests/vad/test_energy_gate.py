@@ -0,0 +1,34 @@
+# tests/vad/test_energy_gate.py
+import numpy as np
+from octavius.infrastructure.vad.energy_gate import EnergyGate
+
+
+def _block(amplitudes, frame_samples=480):
+    rng = np.random.default_rng(3)
+    rows = [rng.standard_normal(frame_samples) * a for a in amplitudes]
+    return np.clip(np.array(rows), -32768, 32767).astype(np.int16)
+
+
+def test_quiet_frames_are_skipped_and_loud_frames_reach_vad():
+    gate = EnergyGate(margin_db=6.0, initial_floor_db=-60.0)
+    levels = gate.levels_db(_block([10, 10, 3000, 10]))
+    mask = gate.candidates(levels)
+    assert mask.tolist() == [False, False, True, False]
+
+    gate.update(levels, ~mask, skipped=int((~mask).sum()))
+    st = gate.stats()
+    assert (st.frames_seen, st.frames_skipped) == (4, 3)
+    assert st.skip_ratio == 0.75
+
+
+def test_noise_floor_rises_slowly_with_non_speech_noise_and_drops_fast():
+    gate = EnergyGate(margin_db=6.0, rise_alpha=0.1, initial_floor_db=-60.0)
+    noisy = gate.levels_db(_block([300] * 50))          # ~ -40 dBFS fan noise
+    everything = np.ones(noisy.size, dtype=bool)
+    gate.update(noisy, everything, skipped=0)
+    assert gate.stats().noise_floor_db > -45.0
+    assert gate.candidates(noisy).sum() == 0            # fan no longer costs vad calls
+
+    quiet = gate.levels_db(_block([5] * 2))
+    gate.update(quiet, np.ones(2, dtype=bool), skipped=2)
+    assert gate.stats().noise_floor_db < -60.0
@@ -0,0 +1,36 @@
+# tests/vad/test_frontend.py
+import numpy as np
+from octavius.infrastructure.vad.frontend import VadFrontEnd
+from octavius.utils.resampler import StreamingResampler
+
+
+def _stereo_chunks(rate: int, chunk_ms: int, n_chunks: int):
+    rng = np.random.default_rng(2)
+    n = int(rate * chunk_ms / 1000)
+    x = (rng.standard_normal((n * n_chunks, 2)) * 2000).astype(np.int16)
+    return x, [x[i * n:(i + 1) * n].tobytes() for i in range(n_chunks)]
+
+
+def test_frames_match_downmix_then_streaming_resample():
+    x, chunks = _stereo_chunks(48000, 30, 10)
+    fe = VadFrontEnd(dev_rate=48000, dev_channels=2, target_rate=16000, frame_samples=480)
+    got = np.concatenate([fe.push(c).reshape(-1).copy() for c in chunks])
+
+    mono = np.floor_divide(x.astype(np.int32).sum(axis=1) + 1, 2).astype(np.int16)
+    ref = StreamingResampler(48000, 16000).process(mono)[:len(got)]
+    assert len(got) % 480 == 0
+    assert np.array_equal(got, ref)
+
+
+def test_frame_views_are_bytes_of_the_frames_and_reused():
+    _, chunks = _stereo_chunks(16000, 45, 4)   # 720 samples/chunk → carry between pushes
+    fe = VadFrontEnd(dev_rate=16000, dev_channels=2, target_rate=16000, frame_samples=480)
+    seen = []
+    for c in chunks:
+        block = fe.push(c)
+        for i in range(len(block)):
+            view = fe.frame_view(i)
+            assert view.nbytes == 960 and bytes(view) == block[i].tobytes()
+            seen.append(id(view))
+    assert len(seen) == 6
+    assert len(set(seen)) <= 2   # same slots handed out again
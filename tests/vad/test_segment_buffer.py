@@ -0,0 +1,38 @@
+# tests/vad/test_segment_buffer.py
+import numpy as np
+from octavius.infrastructure.vad.segment_buffer import SegmentBuffer
+
+FRM = 4
+
+
+def _frame(v: int) -> np.ndarray:
+    return np.full(FRM, v, dtype=np.int16)
+
+
+def test_wrapped_preroll_is_unrolled_oldest_first_before_speech():
+    seg = SegmentBuffer(frame_samples=FRM, pre_frames=3, max_frames=10)
+    for v in range(1, 6):          # ring keeps 3, 4, 5
+        seg.push_preroll(_frame(v))
+    seg.append(_frame(9))
+    seg.append(_frame(10))
+    got = seg.view().reshape(-1, FRM)[:, 0].tolist()
+    assert got == [3, 4, 5, 9, 10]
+    assert seg.n_frames == 5
+
+
+def test_partial_preroll_and_view_is_zero_copy():
+    seg = SegmentBuffer(frame_samples=FRM, pre_frames=3, max_frames=10)
+    seg.push_preroll(_frame(7))
+    seg.append(_frame(8))
+    view = seg.view()
+    assert view.reshape(-1, FRM)[:, 0].tolist() == [7, 8]
+    assert view.base is not None and np.shares_memory(view, seg.view())
+
+
+def test_append_stops_at_capacity_and_reset_starts_over():
+    seg = SegmentBuffer(frame_samples=FRM, pre_frames=0, max_frames=2)
+    assert seg.view().size == 0
+    assert seg.append(_frame(1)) and seg.append(_frame(2))
+    assert seg.full and not seg.append(_frame(3))
+    seg.reset()
+    assert not seg.started and seg.view().size == 0
@@ -0,0 +1,130 @@
+# tests/vad/test_webrtc_vad_adapter.py
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+pytest.importorskip("webrtcvad")
+
+from octavius.config.settings import AudioSettings, VadSettings
+from octavius.domain.models.audio_frame import AudioFrame
+from octavius.domain.models.vad_event import EndReason, SpeechChunk, SpeechEnd, SpeechStart
+from octavius.infrastructure.vad.vad import WebRTCVADAdapter
+from octavius.infrastructure.asr.features import StreamingLogMel, log_mel
+
+RATE = 48000
+FPB = 1440  # 30 ms at 48 kHz
+
+
+def _voice(seconds: float) -> np.ndarray:
+    """Harmonic-rich, formant-filtered, amplitude-modulated tone that webrtcvad takes for speech."""
+    t = np.arange(int(RATE * seconds)) / RATE
+    phase = 2 * np.pi * np.cumsum(140 + 20 * np.sin(2 * np.pi * 0.5 * t)) / RATE
+    src = sum(np.sin(k * phase) / k for k in range(1, 30))
+    y = np.zeros_like(src)
+    for n in range(2, len(src)):   # simple 2-pole resonator
+        y[n] = src[n] + 1.3 * y[n - 1] - 0.8 * y[n - 2]
+    y *= 0.6 + 0.4 * np.sin(2 * np.pi * 4 * t)
+    return (y / np.abs(y).max() * 9000).astype(np.int16)
+
+
+def _noise(seconds: float) -> np.ndarray:
+    return (np.random.default_rng(0).standard_normal(int(RATE * seconds)) * 60).astype(np.int16)
+
+
+def _chunks(sig: np.ndarray):
+    return (sig[i:i + FPB].tobytes() for i in range(0, len(sig) - FPB + 1, FPB))
+
+
+def _adapter(features=None, **vad) -> WebRTCVADAdapter:
+    settings = SimpleNamespace(
+        audio=AudioSettings(sample_rate=16000),
+        vad=VadSettings(aggressiveness=3, silence_ms=600, energy_gate=True, **vad),
+    )
+    a = WebRTCVADAdapter(settings, features=features)
+    a.open(device_rate=RATE, device_channels=1)
+    return a
+
+
+@pytest.fixture(scope="module")
+def signal():
+    return np.concatenate([_noise(2.0), _voice(1.5), _noise(1.5)])
+
+
+def test_stream_events_order_and_chunks_rebuild_the_segment(signal):
+    events = list(_adapter().stream_events(_chunks(signal)))
+
+    assert isinstance(events[0], SpeechStart)
+    assert isinstance(events[-1], SpeechEnd) and events[-1].reason is EndReason.SILENCE
+    chunks = [e for e in events if isinstance(e, SpeechChunk)]
+    assert chunks and all(isinstance(e, SpeechChunk) for e in events[1:-1])
+
+    seg = events[-1].segment
+    assert b"".join(bytes(c.pcm) for c in chunks) == bytes(seg.pcm)
+    assert 1.2 <= len(seg.pcm) / 2 / 16000 <= 2.0
+    # speech starts ~2 s into the stream, minus the 300 ms pre-roll
+    assert 1500 <= events[0].timestamp_ms <= 2100
+
+
+def test_capture_until_silence_is_a_wrapper_over_events(signal):
+    seg = _adapter().capture_until_silence(_chunks(signal))
+    expected = list(_adapter().stream_events(_chunks(signal)))[-1].segment
+    assert bytes(seg.pcm) == bytes(expected.pcm)
+
+
+def test_max_record_without_speech_returns_empty_segment():
+    events = list(_adapter(max_record_ms=900).stream_events(_chunks(_noise(2.0))))
+    assert len(events) == 1
+    assert events[0].reason is EndReason.MAX_LENGTH and not events[0].segment.pcm
+
+
+def test_stamped_frames_give_absolute_segment_times(signal):
+    t0, offset = 100.0, RATE * 10   # source opened 10 s before this stream
+    frames = (
+        AudioFrame(pcm=sig, sample_index=offset + i * FPB, captured_at=t0 + i * FPB / RATE)
+        for i, sig in enumerate(_chunks(signal))
+    )
+    events = list(_adapter().stream_events(frames))
+    start, seg = events[0], events[-1].segment
+
+    assert seg.start_ms == start.timestamp_ms
+    assert 11500 <= seg.start_ms <= 12100
+    assert 13200 <= seg.end_ms <= 13800             # voice ends 3.5 s into the stream
+    assert seg.captured_at == pytest.approx(t0 + (seg.start_ms - 10000) / 1000, abs=2e-3)
+    assert seg.ended_at == pytest.approx(t0 + (seg.end_ms - 10000) / 1000, abs=2e-3)
+    assert seg.endpoint_at is not None and seg.endpoint_delay_ms is not None
+
+
+def test_features_computed_during_capture_match_the_segment(signal):
+    seg = _adapter(features=StreamingLogMel(pad_ms=500)).capture_until_silence(_chunks(signal))
+
+    pcm = np.frombuffer(seg.pcm, dtype=np.int16)
+    assert seg.features is not None and seg.features.n_samples == len(pcm)
+    ref = log_mel(pcm.astype(np.float32) / 32768.0, pad_samples=8000)
+    assert seg.features.data.shape == ref.shape
+    assert np.allclose(seg.features.data, ref, atol=1e-5)
+
+
+def test_max_record_cut_reports_trailing_silence():
+    speaking = list(_adapter(max_record_ms=2700).stream_events(_chunks(np.concatenate([_noise(2.0), _voice(3.0)]))))
+    assert speaking[-1].reason is EndReason.MAX_LENGTH and speaking[-1].trailing_silence_ms == 0
+    # speech ~2.0..2.6 s, then the cut at 3.0 s lands in the trailing silence (silence_ms=600)
+    quiet = list(_adapter(max_record_ms=3000).stream_events(_chunks(np.concatenate([_noise(2.0), _voice(0.6), _noise(1.0)]))))
+    assert quiet[-1].reason is EndReason.MAX_LENGTH and quiet[-1].segment.pcm
+    assert 200 <= quiet[-1].trailing_silence_ms < 600
+
+
+def test_max_record_cut_carries_the_rest_of_the_chunk_over():
+    sig = np.concatenate([_noise(0.5), _voice(3.0)])
+    big = 4 * FPB   # 120 ms chunks: the 900 ms cut lands inside one
+    chunks = [sig[i:i + big].tobytes() for i in range(0, len(sig) - big + 1, big)]
+    whole = _adapter(max_record_ms=10000)
+    whole.capture_until_silence(chunks)
+
+    a = _adapter(max_record_ms=900)
+    it = iter(chunks)
+    ends = []
+    while not ends or ends[-1].reason is EndReason.MAX_LENGTH:
+        ends.append(list(a.stream_events(it))[-1])
+    # every frame of every chunk went through the VAD, none was dropped at the cuts
+    assert len(ends) > 2 and ends[-1].reason is EndReason.STREAM_END
+    assert a._framed == whole._framed